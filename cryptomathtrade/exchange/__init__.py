@@ -1,63 +1,84 @@
-from . import binance
-from . import bingx
-from . import bybit
-from . import kucoin
-from . import okx
-from . import htx
-from . import bitmart
-from . import gate
-from . import mexc
-from . import bitget
-from . import ascendex
-from . import lbank
-from . import xt
-from . import weex
-from . import coinex
-from . import ourbit
-from . import poloniex
-from . import whitebit
-from . import bitunix
-from . import backpack
-from . import bitrue
-from . import orangex
-from . import tapbit
-from . import toobit
-from . import hotcoin
-from . import coinw
-from . import digifinex
-from . import kcex
-
-
-Exchanges = {
-    "binance": binance,
-    "bingx": bingx,
-    "bybit": bybit,
-    "kucoin": kucoin,
-    "okx": okx,
-    "htx": htx,
-    "bitmart": bitmart,
-    "gate": gate,
-    "mexc": mexc,
-    "bitget": bitget,
-    "ascendex": ascendex,
-    "lbank": lbank,
-    "xt": xt,
-    "weex": weex,
-    "coinex": coinex,
-    "ourbit": ourbit,
-    "poloniex": poloniex,
-    "whitebit": whitebit,
-    "bitunix": bitunix,
-    "backpack": backpack,
-    "bitrue": bitrue,
-    "orangex": orangex,
-    "tapbit": tapbit,
-    "toobit": toobit,
-    "hotcoin": hotcoin,
-    "coinw": coinw,
-    "digifinex": digifinex,
-    "kcex": kcex,
-}
+import asyncio
+import importlib
+import time
+from collections.abc import Mapping
+
+from ._json import set_json_decoder, get_json_decoder
+from ._reconnect import Backoff, reconnecting
+from ._hub import StreamHub
+from ._cache import MetadataCache, SymbolCache, CoinCache
+from ._symbols import SymbolIndex, split_symbol, parse_symbol, format_symbol
+from ._backfill import KlineBackfill, interval_to_ms
+from ._recorder import MarketRecorder
+from ._replay import MarketReplay, RecordedFrame, read_segment
+from ._signer import HmacSigner, benchmark_signing
+from ._clock import ServerClock
+from .errors import ParameterValueError
+from ..types import DepthSnapshot
+
+
+class _LazyExchanges(Mapping):
+    """Exchange name -> exchange package, imported on first access."""
+
+    def __init__(self, names):
+        self._names = tuple(names)
+        self._modules = {}
+
+    def __getitem__(self, name):
+        module = self._modules.get(name)
+        if module is None:
+            if name not in self._names:
+                raise KeyError(name)
+            module = self._modules[name] = importlib.import_module(f'.{name}', __name__)
+        return module
+
+    def __contains__(self, name):
+        return name in self._names
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+
+Exchanges = _LazyExchanges((
+    "binance",
+    "bingx",
+    "bybit",
+    "kucoin",
+    "okx",
+    "htx",
+    "bitmart",
+    "gate",
+    "mexc",
+    "bitget",
+    "ascendex",
+    "lbank",
+    "xt",
+    "weex",
+    "coinex",
+    "ourbit",
+    "poloniex",
+    "whitebit",
+    "bitunix",
+    "backpack",
+    "bitrue",
+    "orangex",
+    "tapbit",
+    "toobit",
+    "hotcoin",
+    "coinw",
+    "digifinex",
+    "kcex",
+))
+
+
+def __getattr__(name):
+    """Import exchange packages on attribute access, e.g. cryptomathtrade.exchange.binance."""
+    if name in Exchanges:
+        return Exchanges[name]
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
 
 def get_exchange(exchange_name):
@@ -71,3 +92,100 @@ def get_exchange(exchange_name):
         Module: Module object for the specified exchange.
     """
     return Exchanges.get(exchange_name)
+
+
+async def _fetch_depth(exchange_name, market, symbol, timeout):
+    start = time.perf_counter()
+    try:
+        response = await asyncio.wait_for(market.get_depth(symbol=symbol), timeout=timeout)
+    except Exception as exc:
+        return DepthSnapshot(exchange=exchange_name, symbol=symbol, latency=time.perf_counter() - start, error=exc)
+    return DepthSnapshot(exchange=exchange_name, symbol=symbol, data=response.data, latency=time.perf_counter() - start)
+
+
+async def get_depths(symbols, exchanges=None, timeout: float = 1.0, markets: dict = None) -> list[DepthSnapshot]:
+    """
+    Fetch order books from several exchanges concurrently, each under its own deadline.
+
+    A slow or failing exchange never delays or breaks the others: its entry is returned with
+    the error (asyncio.TimeoutError if the deadline passed) instead of data.
+
+    Args:
+        symbols (str | list[str] | dict): Trading pair(s) requested on every exchange, or a dict
+            mapping exchange name to its own trading pair(s) when the names differ between exchanges.
+        exchanges (Iterable[str], optional): Names from Exchanges. Default: keys of `symbols` if it is a dict,
+            otherwise all exchanges.
+        timeout (float, optional): Per-exchange deadline in seconds. Default 1.0.
+        markets (dict, optional): Exchange name -> AsyncMarket instance to reuse (and its connection pool).
+            Missing instances are created for this call and closed before returning.
+
+    Returns:
+        list[DepthSnapshot]: One entry per (exchange, symbol), in request order.
+    """
+    if isinstance(symbols, dict):
+        if exchanges is None:
+            exchanges = list(symbols)
+        requests = [(name, symbol) for name in exchanges
+                    for symbol in ([symbols[name]] if isinstance(symbols[name], str) else symbols[name])]
+    else:
+        if exchanges is None:
+            exchanges = list(Exchanges)
+        if isinstance(symbols, str):
+            symbols = [symbols]
+        requests = [(name, symbol) for name in exchanges for symbol in symbols]
+
+    unknown = [name for name, _ in requests if name not in Exchanges]
+    if unknown:
+        raise ParameterValueError(params=unknown)
+
+    markets = dict(markets) if markets else {}
+    own_markets = {name: Exchanges[name].AsyncMarket() for name, _ in requests if name not in markets}
+    markets.update(own_markets)
+    try:
+        return await asyncio.gather(
+            *[_fetch_depth(name, markets[name], symbol, timeout) for name, symbol in requests]
+        )
+    finally:
+        await asyncio.gather(*[market.aclose() for market in own_markets.values()])
+
+
+async def get_symbol_index(exchanges=None, timeout: float = 10.0, markets: dict = None) -> SymbolIndex:
+    """
+    Build a SymbolIndex from the get_symbols listings of several exchanges, fetched concurrently.
+
+    Exchanges without get_symbols are skipped; failed or timed out listings are left out
+    of the index and reported in SymbolIndex.errors.
+
+    Args:
+        exchanges (Iterable[str], optional): Names from Exchanges. Default: all exchanges.
+        timeout (float, optional): Per-exchange deadline in seconds. Default 10.0.
+        markets (dict, optional): Exchange name -> AsyncMarket instance to reuse.
+            Missing instances are created for this call and closed before returning.
+
+    Returns:
+        SymbolIndex: The index of every listing received.
+    """
+    if exchanges is None:
+        exchanges = list(Exchanges)
+    unknown = [name for name in exchanges if name not in Exchanges]
+    if unknown:
+        raise ParameterValueError(params=unknown)
+
+    markets = dict(markets) if markets else {}
+    own_markets = {name: Exchanges[name].AsyncMarket() for name in exchanges if name not in markets}
+    markets.update(own_markets)
+    names = [name for name in exchanges if hasattr(markets[name], 'get_symbols')]
+    index = SymbolIndex()
+    try:
+        results = await asyncio.gather(
+            *[asyncio.wait_for(markets[name].get_symbols(), timeout=timeout) for name in names],
+            return_exceptions=True,
+        )
+    finally:
+        await asyncio.gather(*[market.aclose() for market in own_markets.values()])
+    for name, result in zip(names, results):
+        if isinstance(result, Exception):
+            index.errors[name] = result
+        else:
+            index.add(name, result.data)
+    return index
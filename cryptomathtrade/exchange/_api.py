@@ -1,20 +1,148 @@
 import asyncio
 
-from ._request import Request, AsyncRequest, WebSocketRequest
-from .utils import check_api_keys, hmac_hashing, _prepare_params, get_timestamp
+from ._request import (
+    Request,
+    AsyncRequest,
+    WebSocketRequest,
+    create_session,
+    create_async_session,
+    POOL_SIZE,
+    DNS_CACHE_TTL,
+    KEEPALIVE_TIMEOUT,
+)
+from ._buffer import buffered, BLOCK
+from ._recorder import stream_name
+from ._signer import HmacSigner
+from .utils import check_api_keys, _prepare_params, get_timestamp
 
 
 class BaseAPI:
+    exchange = None  # exchange name, e.g. recorded with the WebSocket frames
+    rate_limiter = None  # RateLimiter shared by all instances of an exchange, None disables limiting
+    sign_digest = 'sha256'  # hash of the request signature HMAC
+    clock = None  # ServerClock of the exchange, None uses the local clock
+
     def __init__(self,
                  api_key=None,
                  api_secret=None,
                  headers=None,
+                 pool_size: int = POOL_SIZE,
+                 dns_cache_ttl: int = DNS_CACHE_TTL,
+                 keepalive_timeout: float = KEEPALIVE_TIMEOUT,
+                 trusted: bool = False,
+                 ws_buffer_size: int = 1024,
+                 ws_overflow: str = BLOCK,
+                 recorder=None,
+                 ws_source=None,
+                 clock=None,
                  ):
+        """
+        params:
+            api_key (str): API key for authentication.
+
+            api_secret (str): API secret for authentication.
+
+            headers (dict): Additional headers for API requests.
+
+            pool_size (int): Maximum number of pooled keep-alive connections.
+
+            dns_cache_ttl (int): Seconds to cache resolved hosts (async requests only).
+
+            keepalive_timeout (float): Seconds to keep an idle async connection open.
+
+            trusted (bool): Skip pydantic validation on hot paths. Order books are returned
+                as ArrayOrderBook instead of OrderBook, klines as KlineFrame instead of list[Kline].
+
+            ws_buffer_size (int): Frames buffered between a WebSocket reader and its consumer.
+
+            ws_overflow (str): Policy of a full WebSocket buffer: 'block', 'drop_oldest' or 'conflate'
+                (keep only the latest frame, for depth snapshot streams).
+
+            recorder (MarketRecorder): Log every received WebSocket frame, before buffering and decoding.
+
+            ws_source (MarketReplay): Read WebSocket frames from a recording instead of the exchange.
+
+            clock (ServerClock): Source of the timestamps of signed requests. Default: the class clock.
+        """
         self.api_key = api_key
         self.api_secret = api_secret
         self.headers = {}
         if headers:
             self.headers.update(headers)
+        self.pool_size = pool_size
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self.trusted = trusted
+        self.ws_buffer_size = ws_buffer_size
+        self.ws_overflow = ws_overflow
+        self.recorder = recorder
+        self.ws_source = ws_source
+        if clock is not None:
+            self.clock = clock
+        self._signer = None
+        self._session = None
+        self._async_session = None
+        self._async_session_loop = None
+
+    @property
+    def session(self):
+        """Pooled requests session shared by every sync call of this instance."""
+        if self._session is None:
+            self._session = create_session(self.pool_size)
+        return self._session
+
+    @property
+    def signer(self) -> HmacSigner:
+        """HMAC keyed with api_secret, rebuilt when the secret changes."""
+        signer = self._signer
+        if signer is None or signer.secret != self.api_secret:
+            signer = self._signer = HmacSigner(self.api_secret, self.sign_digest)
+        return signer
+
+    def _timestamp(self) -> int:
+        """Request timestamp in ms, corrected by the server clock offset when a clock is set."""
+        if self.clock is not None:
+            return self.clock.now()
+        return get_timestamp()
+
+    def _get_async_session(self):
+        """
+        Pooled aiohttp session shared by every async call of this instance.
+
+        The session is bound to the running event loop and is recreated if the instance
+        is reused from another loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_session is None or self._async_session.closed or self._async_session_loop is not loop:
+            self._async_session = create_async_session(self.pool_size, self.dns_cache_ttl, self.keepalive_timeout)
+            self._async_session_loop = loop
+        return self._async_session
+
+    def close(self):
+        """Close the pooled sync session."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    async def aclose(self):
+        """Close the pooled sync and async sessions."""
+        self.close()
+        if self._async_session is not None:
+            await self._async_session.close()
+            self._async_session = None
+            self._async_session_loop = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
 
     def _query(self,
                url: str,
@@ -29,7 +157,12 @@ class BaseAPI:
 
             method (str): HTTP method for the request (default is 'GET').
         """
-        return Request(headers=self.headers).send_request(method, url, params)
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(url, params, method)
+        response = Request(headers=self.headers, session=self.session).send_request(method, url, params)
+        if self.rate_limiter is not None:
+            self.rate_limiter.update(response.status_code, response.headers)
+        return response
 
     async def _async_query(self,
                            url: str,
@@ -44,7 +177,14 @@ class BaseAPI:
 
             method (str): HTTP method for the request (default is 'GET').
         """
-        return await AsyncRequest(headers=self.headers).send_request(method, url, params)
+        if self.rate_limiter is not None:
+            await self.rate_limiter.async_acquire(url, params, method)
+        response = await AsyncRequest(headers=self.headers,
+                                      session=self._get_async_session(),
+                                      ).send_request(method, url, params)
+        if self.rate_limiter is not None:
+            self.rate_limiter.update(response.status, response.headers)
+        return response
 
     async def _ws_query(self,
                         url: str,
@@ -74,6 +214,23 @@ class BaseAPI:
                     raise ConnectionError  # custom error
                 yield data
 
+    def _ws_buffered(self, **kwargs):
+        """
+        _ws_query frames received by a background task into a bounded buffer.
+
+        The consumer decodes frames after they leave the buffer, so conflated or dropped frames
+        are never decoded. Size and overflow policy are ws_buffer_size and ws_overflow.
+        With ws_source the recorded frames of the same stream are returned instead.
+        """
+        exchange = self.exchange
+        name = stream_name(kwargs.get('params', kwargs.get('url')))
+        if self.ws_source is not None:
+            return self.ws_source.stream(exchange, name)
+        stream = self._ws_query(**kwargs)
+        if self.recorder is not None:
+            stream = self.recorder.tap(stream, exchange, name)
+        return buffered(stream, self.ws_buffer_size, self.ws_overflow)
+
     @check_api_keys
     def get_payload(self, payload=None):
         """
@@ -85,7 +242,7 @@ class BaseAPI:
           """
         if payload is None:
             payload = {}
-        payload['timestamp'] = get_timestamp()
+        payload['timestamp'] = self._timestamp()
         query_string = _prepare_params(payload)
         payload['signature'] = self._get_sign(query_string)
         return payload
@@ -98,7 +255,7 @@ class BaseAPI:
         Returns:
             str: HMAC signature.
         """
-        return hmac_hashing(self.api_secret, payload)
+        return self.signer.hexdigest(payload)
 
     def return_args(self, **kwargs):
         # if self.headers:
@@ -0,0 +1,212 @@
+import asyncio
+import re
+
+from ._reconnect import Backoff
+from .errors import ParameterValueError
+from ..types import Kline, KlineFrame
+
+
+# Exchange name -> maximum candles per get_kline call
+KLINE_LIMITS = {
+    'binance': 1000,
+    'bingx': 1000,
+    'kucoin': 1500,
+    'htx': 2000,
+    'okx': 100,
+    'gate': 1000,
+    'mexc': 1000,
+    'bitget': 1000,
+    'bitmart': 200,
+}
+# get_kline without a time range parameter: only the latest `limit` candles are available
+NO_RANGE = ('htx',)
+# get_kline without a limit parameter
+NO_LIMIT = ('kucoin',)
+
+_UNITS = {
+    's': 1000, 'sec': 1000,
+    'm': 60_000, 'min': 60_000,
+    'h': 3_600_000, 'hour': 3_600_000,
+    'd': 86_400_000, 'day': 86_400_000,
+    'w': 604_800_000, 'week': 604_800_000,
+    'mon': 2_678_400_000, 'month': 2_678_400_000,  # 31 days, an upper bound keeps windows within the limit
+    'y': 31_622_400_000, 'year': 31_622_400_000,
+}
+
+
+def interval_to_ms(interval: str | int) -> int:
+    """
+    Length of a kline interval in ms, for the notations of every exchange:
+    '1m', '1min', '1H', '4hour', '1D', '1day', '1W', '1M' (month), '1mon', or a number of minutes (bitmart).
+    """
+    match = re.fullmatch(r'\s*(\d+)\s*([a-zA-Z]*)\s*', str(interval))
+    if match is None:
+        raise ParameterValueError(params=[str(interval)])
+    count, unit = int(match.group(1)), match.group(2)
+    if unit == 'M':
+        unit = 'month'
+    unit = unit.lower() or 'min'
+    if unit not in _UNITS:
+        raise ParameterValueError(params=[str(interval)])
+    return count * _UNITS[unit]
+
+
+def _to_ms(timestamp: int) -> int:
+    # Some exchanges return candle times in seconds
+    return timestamp * 1000 if timestamp < 100_000_000_000 else timestamp
+
+
+def _after(klines: list[Kline] | KlineFrame, time: int) -> list[Kline] | KlineFrame:
+    if isinstance(klines, KlineFrame):
+        return klines.between(time + 1)
+    return [kline for kline in klines if kline.openTime > time]
+
+
+def _last_time(klines: list[Kline] | KlineFrame) -> int:
+    if isinstance(klines, KlineFrame):
+        return klines.open_time[-1]
+    return klines[-1].openTime
+
+
+class KlineBackfill:
+    """
+    Download the klines of a [start, end) range in concurrent windows of one request each.
+
+    Windows are fetched under a semaphore (and the rate limiter of the market, if any), retried
+    with backoff, and emitted in time order as soon as every earlier window is done, sorted and
+    deduplicated. Windows still failing after `retries` are kept in `failed`; running the
+    backfill again fetches only the windows that are not done yet.
+
+    Usage:
+        backfill = KlineBackfill(binance.AsyncMarket(), "BTCUSDT", "1m", start, end)
+        async for klines in backfill.stream():
+            store(klines)
+
+    params:
+        market (AsyncMarket): Async market of one of the exchanges in KLINE_LIMITS.
+
+        symbol (str): The trading pair.
+
+        interval (str): Kline interval in the notation of the exchange.
+
+        start (int): First open time, ms.
+
+        end (int): End of the range (exclusive), ms.
+
+        exchange (str, optional): Exchange name. Default: the `exchange` of the market class.
+
+        limit (int, optional): Candles per request. Default: the maximum of the exchange.
+
+        concurrency (int | asyncio.Semaphore, optional): Simultaneous requests, or a semaphore
+            shared by several backfills. Default 4.
+
+        retries (int, optional): Attempts per window after the first failure. Default 3.
+
+        backoff (Backoff, optional): Delay policy between attempts.
+    """
+
+    def __init__(self,
+                 market,
+                 symbol: str,
+                 interval: str | int,
+                 start: int,
+                 end: int,
+                 exchange: str = None,
+                 limit: int = None,
+                 concurrency: int | asyncio.Semaphore = 4,
+                 retries: int = 3,
+                 backoff: Backoff = None,
+                 ):
+        if exchange is None:
+            exchange = getattr(market, 'exchange', None)
+        if exchange not in KLINE_LIMITS:
+            raise ParameterValueError(params=[exchange])
+        self.market = market
+        self.symbol = symbol
+        self.interval = interval
+        self.exchange = exchange
+        self.interval_ms = interval_to_ms(interval)
+        self.limit = min(limit or KLINE_LIMITS[exchange], KLINE_LIMITS[exchange])
+        self.start = start - start % self.interval_ms
+        self.end = end
+        self.concurrency = concurrency
+        self.retries = retries
+        self.backoff = backoff if backoff is not None else Backoff()
+        if exchange in NO_RANGE:
+            self.windows = [(self.start, self.end)]
+        else:
+            step = self.limit * self.interval_ms
+            self.windows = [(begin, min(begin + step, self.end)) for begin in range(self.start, self.end, step)]
+        self.done: set[tuple[int, int]] = set()
+        self.failed: dict[tuple[int, int], Exception] = {}
+
+    @property
+    def complete(self) -> bool:
+        return len(self.done) == len(self.windows)
+
+    async def _request(self, window: tuple[int, int]) -> list[Kline] | KlineFrame:
+        begin, end = window
+        params = {'symbol': self.symbol, 'interval': self.interval}
+        if self.exchange not in NO_LIMIT:
+            params['limit'] = self.limit
+        if self.exchange not in NO_RANGE:
+            # 1 ms wider on both sides: exclusive bounds of some exchanges still cover the window
+            params['startTime'] = begin - 1
+            params['endTime'] = end - 1
+        klines = (await self.market.get_kline(**params)).data
+        if isinstance(klines, KlineFrame):
+            return klines.sorted().between(begin, end)
+        for kline in klines:
+            kline.openTime = _to_ms(kline.openTime)
+        return sorted(
+            (kline for kline in klines if begin <= kline.openTime < end),
+            key=lambda kline: kline.openTime,
+        )
+
+    async def _fetch(self, semaphore: asyncio.Semaphore, window: tuple[int, int]) -> list[Kline] | KlineFrame:
+        backoff = Backoff(self.backoff.initial, self.backoff.maximum, self.backoff.factor)
+        for attempt in range(self.retries + 1):
+            try:
+                async with semaphore:
+                    return await self._request(window)
+            except Exception:
+                if attempt == self.retries:
+                    raise
+                await asyncio.sleep(backoff.next())
+
+    async def stream(self):
+        """
+        Yield the klines of each finished window in time order.
+
+        Items are lists of Kline, or KlineFrame views for markets created with trusted=True.
+        """
+        semaphore = self.concurrency
+        if not isinstance(semaphore, asyncio.Semaphore):
+            semaphore = asyncio.Semaphore(semaphore)
+        windows = [window for window in self.windows if window not in self.done]
+        tasks = [asyncio.create_task(self._fetch(semaphore, window)) for window in windows]
+        last_time = None
+        try:
+            for window, task in zip(windows, tasks):
+                try:
+                    klines = await task
+                except Exception as exc:
+                    self.failed[window] = exc
+                    continue
+                self.failed.pop(window, None)
+                self.done.add(window)
+                if last_time is not None:
+                    klines = _after(klines, last_time)
+                if len(klines):
+                    last_time = _last_time(klines)
+                    yield klines
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def fetch(self) -> list[Kline] | KlineFrame:
+        """All klines of the range; check `failed` for windows that could not be downloaded."""
+        batches = [klines async for klines in self.stream()]
+        if batches and isinstance(batches[0], KlineFrame):
+            return KlineFrame.concat(batches)
+        return [kline for klines in batches for kline in klines]
@@ -0,0 +1,139 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+from ..types import Side, TimeInForce
+
+
+def order_call(api, order: dict):
+    """
+    Zero-argument call placing one order of a batch.
+
+    An order with a "price" (or "type": "LIMIT") goes to new_limit_order, any other to
+    new_market_order. "side" and "timeInForce" may be given as enum members or strings.
+
+    params:
+        api (Spot | AsyncSpot): Instance placing the order.
+
+        order (dict): Keyword arguments of new_limit_order or new_market_order.
+    """
+    params = dict(order)
+    order_type = str(params.pop('type', 'LIMIT' if 'price' in params else 'MARKET')).upper()
+    if isinstance(params.get('side'), str):
+        params['side'] = Side(params['side'].upper())
+    if isinstance(params.get('timeInForce'), str):
+        params['timeInForce'] = TimeInForce(params['timeInForce'].upper())
+    method = api.new_limit_order if order_type == 'LIMIT' else api.new_market_order
+    return functools.partial(method, **params)
+
+
+def order_fields(order: dict) -> dict:
+    """
+    Plain fields of one order of a native batch request: "type" is filled in as in order_call,
+    enum members become their values and limit orders default to "timeInForce": "GTC".
+
+    params:
+        order (dict): Keyword arguments of new_limit_order or new_market_order.
+    """
+    fields = dict(order)
+    fields['type'] = str(fields.get('type', 'LIMIT' if 'price' in fields else 'MARKET')).upper()
+    if fields['type'] == 'LIMIT':
+        fields.setdefault('timeInForce', TimeInForce.GTC)
+    for key in ('side', 'timeInForce'):
+        value = fields.get(key)
+        if isinstance(value, (Side, TimeInForce)):
+            fields[key] = value.value
+        elif isinstance(value, str):
+            fields[key] = value.upper()
+    return {key: value for key, value in fields.items() if value is not None}
+
+
+def group_items(items, size: int, key=None) -> list[list[int]]:
+    """
+    Indices of items grouped for native batch requests, in the order the groups are first seen.
+
+    params:
+        items (Sequence): Items of the batch.
+
+        size (int): Items per request at most, larger groups are split.
+
+        key (Callable, optional): Items with equal key(item) share requests, e.g. the symbol.
+            Default: all items share requests.
+    """
+    groups = {}
+    for index, item in enumerate(items):
+        groups.setdefault(key(item) if key else None, []).append(index)
+    return [indices[i:i + size] for indices in groups.values() for i in range(0, len(indices), size)]
+
+
+def scatter_results(groups: list[list[int]], results: list, split) -> list:
+    """
+    Per-item results of native batch requests, in item order.
+
+    An exception of a request is the result of every item of its group.
+
+    params:
+        groups (list[list[int]]): Item indices of every request, from group_items.
+
+        results (list): Result or exception of every request, e.g. from run_calls or gather_calls.
+
+        split (Callable): Takes the result of a request and its item indices and returns
+            the result of each of those items.
+    """
+    scattered = [None] * sum(len(indices) for indices in groups)
+    for indices, result in zip(groups, results):
+        parts = [result] * len(indices) if isinstance(result, Exception) else split(result, indices)
+        for index, part in zip(indices, parts):
+            scattered[index] = part
+    return scattered
+
+
+async def gather_calls(calls, concurrency: int = None) -> list:
+    """
+    Run async calls concurrently and return the result or exception of each, in call order.
+
+    Every call still goes through the pooled session and rate limiter of its instance,
+    a failed item never cancels the others.
+
+    params:
+        calls (Iterable[Callable[[], Awaitable]]): Zero-argument callables, e.g. from order_call.
+
+        concurrency (int, optional): Calls in flight at once. Default: all of them.
+    """
+    calls = list(calls)
+    if concurrency:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def limited(call):
+            async with semaphore:
+                return await call()
+
+        return await asyncio.gather(*[limited(call) for call in calls], return_exceptions=True)
+    return await asyncio.gather(*[call() for call in calls], return_exceptions=True)
+
+
+def run_calls(api, calls, concurrency: int = None) -> list:
+    """
+    Run sync calls of one instance in a thread pool and return the result or exception of each,
+    in call order.
+
+    params:
+        api (BaseAPI): Instance whose pooled session the calls share.
+
+        calls (Iterable[Callable[[], Any]]): Zero-argument callables, e.g. from order_call.
+
+        concurrency (int, optional): Threads, i.e. requests in flight at once. Default: the pool size.
+    """
+    calls = list(calls)
+    if not calls:
+        return []
+    api.session  # created once here rather than raced by the threads
+
+    def capture(call):
+        try:
+            return call()
+        except Exception as exc:
+            return exc
+
+    with ThreadPoolExecutor(max_workers=min(concurrency or api.pool_size, len(calls))) as executor:
+        return list(executor.map(capture, calls))
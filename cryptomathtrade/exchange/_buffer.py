@@ -0,0 +1,84 @@
+import asyncio
+
+from .errors import ParameterValueError
+
+
+BLOCK = 'block'
+DROP_OLDEST = 'drop_oldest'
+CONFLATE = 'conflate'
+OVERFLOW_POLICIES = (BLOCK, DROP_OLDEST, CONFLATE)
+
+_END = object()
+
+
+class StreamBuffer(asyncio.Queue):
+    """
+    Bounded queue between a socket reader and a slower consumer.
+
+    params:
+        maxsize (int): Maximum buffered items, 0 for unbounded. Ignored with CONFLATE.
+
+        overflow (str): What to do when the buffer is full:
+            BLOCK waits for the consumer, so the reader stops draining the socket;
+            DROP_OLDEST discards the oldest item;
+            CONFLATE keeps only the latest item, for snapshot streams like partial depth.
+    """
+
+    def __init__(self, maxsize: int = 0, overflow: str = BLOCK):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ParameterValueError(params=[overflow])
+        super().__init__(1 if overflow == CONFLATE else maxsize)
+        self.overflow = overflow
+        self.dropped = 0
+
+    async def push(self, item):
+        if self.overflow == BLOCK:
+            await self.put(item)
+        else:
+            self.push_nowait(item)
+
+    def push_nowait(self, item):
+        """Add an item without waiting, discarding the oldest one if the buffer is full."""
+        if self.full():
+            self.get_nowait()
+            self.dropped += 1
+        self.put_nowait(item)
+
+
+async def buffered(stream, maxsize: int = 0, overflow: str = BLOCK):
+    """
+    Read an async iterator in a background task and yield its items through a StreamBuffer.
+
+    The reader keeps receiving while the consumer is busy, so with DROP_OLDEST or CONFLATE
+    a slow consumer never delays the socket. Errors of the stream are raised to the consumer.
+
+    params:
+        stream (AsyncIterator): Source, usually raw WebSocket frames.
+
+        maxsize (int): Maximum buffered items, 0 for unbounded.
+
+        overflow (str): BLOCK, DROP_OLDEST or CONFLATE.
+    """
+    buffer = StreamBuffer(maxsize, overflow)
+
+    async def read():
+        try:
+            async for item in stream:
+                await buffer.push(item)
+        except Exception as exc:
+            buffer.push_nowait(exc)
+        else:
+            buffer.push_nowait(_END)
+
+    reader = asyncio.create_task(read())
+    try:
+        while True:
+            item = await buffer.get()
+            if item is _END:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        reader.cancel()
+        await asyncio.wait([reader])
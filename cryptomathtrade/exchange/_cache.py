@@ -0,0 +1,187 @@
+import asyncio
+import inspect
+import json
+import os
+import threading
+import time
+
+from ..types import Symbol, Coin
+
+
+class MetadataCache:
+    """
+    TTL cache of slow-changing reference data (symbols, coins) with a per-key index.
+
+    Data younger than `ttl` is served from memory. Older data is still served while a refresh
+    runs in the background (a thread for sync sources, a task for async ones); it is only
+    awaited when nothing is cached yet or the data is older than `max_age`. With `path` the
+    data is also persisted as JSON, so a warm restart skips the download.
+
+    params:
+        fetch (Callable): Returns a Response with a list of models, e.g. market.get_symbols.
+            Sync or async; async sources must be read with the a-prefixed methods.
+
+        key (str): Model attribute indexed for get(), e.g. "symbol".
+
+        model (type[BaseModel]): Model of the items, used to restore them from disk.
+
+        ttl (float): Seconds during which the data is fresh.
+
+        max_age (float, optional): Seconds after which stale data is no longer served. Default: always served.
+
+        path (str, optional): JSON file to persist the data to.
+    """
+
+    def __init__(self,
+                 fetch,
+                 key: str,
+                 model=None,
+                 ttl: float = 3600,
+                 max_age: float = None,
+                 path: str = None,
+                 ):
+        self.fetch = fetch
+        self.key = key
+        self.model = model
+        self.ttl = ttl
+        self.max_age = max_age
+        self.path = os.path.expanduser(path) if path else None
+        self.items = None
+        self.index = {}
+        self.updated = 0.0
+        self.error = None
+        self._lock = threading.Lock()
+        self._refreshing = None
+        if self.path:
+            self._read_file()
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.updated
+
+    @property
+    def is_fresh(self) -> bool:
+        return self.items is not None and self.age < self.ttl
+
+    def _usable(self) -> bool:
+        return self.items is not None and (self.max_age is None or self.age < self.max_age)
+
+    def _store(self, items: list, updated: float = None):
+        index = {getattr(item, self.key): item for item in items}
+        with self._lock:
+            self.items = items
+            self.index = index
+            self.updated = updated if updated is not None else time.time()
+            self.error = None
+
+    def _read_file(self):
+        try:
+            with open(self.path) as file:
+                data = json.load(file)
+            items = data['items']
+            if self.model is not None:
+                items = [self.model.model_validate(item) for item in items]
+            self._store(items, data['updated'])
+        except (OSError, ValueError, KeyError):
+            pass
+
+    def _write_file(self):
+        items = [item.model_dump(mode='json') if hasattr(item, 'model_dump') else item for item in self.items]
+        temp_path = f'{self.path}.tmp'
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        with open(temp_path, 'w') as file:
+            json.dump({'updated': self.updated, 'items': items}, file)
+        os.replace(temp_path, self.path)
+
+    def _loaded(self, response):
+        self._store(response.data)
+        if self.path:
+            self._write_file()
+
+    def refresh(self) -> list:
+        """Download the data now (sync source)."""
+        self._loaded(self.fetch())
+        return self.items
+
+    async def arefresh(self) -> list:
+        """Download the data now (async source)."""
+        response = self.fetch()
+        if inspect.isawaitable(response):
+            response = await response
+        self._loaded(response)
+        return self.items
+
+    def _refresh_in_background(self):
+        try:
+            self.refresh()
+        except Exception as exc:
+            self.error = exc
+        finally:
+            self._refreshing = None
+
+    async def _arefresh_in_background(self):
+        try:
+            await self.arefresh()
+        except Exception as exc:
+            self.error = exc
+        finally:
+            self._refreshing = None
+
+    def load(self) -> list:
+        """All items, refreshed per the TTL policy (sync source)."""
+        if self.is_fresh:
+            return self.items
+        if not self._usable():
+            return self.refresh()
+        with self._lock:
+            if self._refreshing is None:
+                self._refreshing = threading.Thread(target=self._refresh_in_background, daemon=True)
+                self._refreshing.start()
+        return self.items
+
+    async def aload(self) -> list:
+        """All items, refreshed per the TTL policy (async source)."""
+        if self.is_fresh:
+            return self.items
+        if not self._usable():
+            return await self.arefresh()
+        if self._refreshing is None:
+            self._refreshing = asyncio.create_task(self._arefresh_in_background())
+        return self.items
+
+    def get(self, name: str):
+        """Item whose `key` attribute equals `name`, None if unknown (sync source)."""
+        self.load()
+        return self.index.get(name)
+
+    async def aget(self, name: str):
+        """Item whose `key` attribute equals `name`, None if unknown (async source)."""
+        await self.aload()
+        return self.index.get(name)
+
+    def invalidate(self):
+        """Force a blocking download on the next read."""
+        with self._lock:
+            self.items = None
+            self.index = {}
+            self.updated = 0.0
+
+
+class SymbolCache(MetadataCache):
+    """
+    Cached get_symbols of any exchange Market / AsyncMarket, indexed by symbol name.
+
+    Usage:
+        symbols = SymbolCache(binance.Market(), ttl=3600, path="~/.cache/cmt/binance_symbols.json")
+        symbols.get("BTCUSDT").tickSize
+    """
+
+    def __init__(self, market, ttl: float = 3600, max_age: float = None, path: str = None):
+        super().__init__(market.get_symbols, 'symbol', Symbol, ttl=ttl, max_age=max_age, path=path)
+
+
+class CoinCache(MetadataCache):
+    """Cached get_coins of any exchange Account / AsyncAccount, indexed by coin name."""
+
+    def __init__(self, account, ttl: float = 3600, max_age: float = None, path: str = None):
+        super().__init__(account.get_coins, 'coin', Coin, ttl=ttl, max_age=max_age, path=path)
@@ -0,0 +1,74 @@
+import threading
+import time
+from collections import deque
+
+
+class ServerClock:
+    """
+    Exchange clock estimated from server time samples, for the timestamps of signed requests.
+
+    A sample is (server time - local midpoint of the request, round trip). The offset is taken
+    from the sample with the smallest round trip among the last `samples`: the shortest request
+    has the least asymmetric network delay, so its midpoint is the most accurate. A daemon
+    thread re-samples every `interval` seconds; now() only reads the current estimate.
+
+    Usage:
+        clock = ServerClock(binance.Market()).start()
+        spot = binance.AsyncSpot(api_key, api_secret, clock=clock)
+
+    params:
+        market: Market (sync) with get_server_time(), or any callable returning the server time in ms.
+
+        interval (float): Seconds between samples.
+
+        samples (int): Samples kept for the minimum round trip filter.
+    """
+
+    def __init__(self, market, interval: float = 60, samples: int = 8):
+        self.fetch = market.get_server_time if hasattr(market, 'get_server_time') else market
+        self.interval = interval
+        self.samples = deque(maxlen=samples)  # (round trip, offset) in ms
+        self.offset = 0.0
+        self.rtt = None
+        self.error = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def synced(self) -> bool:
+        return self.rtt is not None
+
+    def now(self) -> int:
+        """Current server time in ms; the local clock until the first sample."""
+        return int(time.time() * 1000 + self.offset)
+
+    def sample(self) -> float:
+        """Measure the server time once and return the updated offset in ms."""
+        sent = time.time()
+        server_time = self.fetch()
+        received = time.time()
+        server_time = getattr(server_time, 'data', server_time)
+        rtt = (received - sent) * 1000
+        self.samples.append((rtt, server_time - (sent + received) * 500))
+        self.rtt, self.offset = min(self.samples)
+        return self.offset
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.sample()
+                self.error = None
+            except Exception as exc:
+                self.error = exc
+            self._stop.wait(self.interval)
+
+    def start(self) -> 'ServerClock':
+        """Sample in a background thread until stop()."""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name='ServerClock', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
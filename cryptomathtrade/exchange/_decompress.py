@@ -0,0 +1,33 @@
+import zlib
+
+
+GZIP = 16 + zlib.MAX_WBITS  # gzip header and trailer
+ZLIB = zlib.MAX_WBITS  # zlib header and trailer
+DEFLATE = -zlib.MAX_WBITS  # raw deflate, no header
+
+
+class Decompressor:
+    """
+    Decompress binary WebSocket frames with zlib in one pass, without file-like wrappers.
+
+    Text frames are returned unchanged, so feeds mixing compressed and plain frames work as is.
+
+    params:
+        wbits (int): GZIP, ZLIB or DEFLATE.
+
+        persistent (bool): Keep one decompression context across frames, for feeds compressed as
+            a single sync-flushed stream. Default: every frame is an independent compressed block.
+    """
+
+    def __init__(self, wbits: int = GZIP, persistent: bool = False):
+        self.wbits = wbits
+        self.persistent = persistent
+        self._decompressor = zlib.decompressobj(wbits) if persistent else None
+
+    def __call__(self, frame: bytes | str) -> bytes | str:
+        if isinstance(frame, str):
+            return frame
+        if self.persistent:
+            return self._decompressor.decompress(frame)
+        decompressor = zlib.decompressobj(self.wbits)
+        return decompressor.decompress(frame) + decompressor.flush()
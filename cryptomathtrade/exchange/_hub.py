@@ -0,0 +1,177 @@
+import asyncio
+import time
+from collections import deque
+
+
+class _Channel:
+    """One running stream of a hub and the ring buffer of its latest items."""
+
+    def __init__(self, hub: 'StreamHub', key: tuple, factory):
+        self.hub = hub
+        self.key = key
+        self.factory = factory
+        self.items = deque(maxlen=hub.capacity)  # (sequence number, publish time, item)
+        self.head = 0  # sequence number of the next item
+        self.subscribers = set()
+        self.done = False
+        self.error = None
+        self._event = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def _run(self):
+        try:
+            async for item in self.factory():
+                self.items.append((self.head, time.monotonic(), item))
+                self.head += 1
+                self._wake()
+        except Exception as exc:
+            self.error = exc
+        self.done = True
+        self._wake()
+
+    def _wake(self):
+        event, self._event = self._event, asyncio.Event()
+        event.set()
+
+    def close(self):
+        self._task.cancel()
+        self.done = True
+        self._wake()
+
+
+class HubSubscription:
+    """
+    Cursor of one consumer over a stream shared through a StreamHub.
+
+    A consumer that falls more than `capacity` items behind skips to the oldest item still
+    buffered; the skipped items are counted in `missed`.
+
+    Metrics:
+        lag (int): Items published but not read yet.
+
+        delivered (int): Items read.
+
+        missed (int): Items overwritten before they were read.
+
+        delay (float): Seconds between the publication and the read of the last item.
+    """
+
+    def __init__(self, channel: _Channel, last: bool = False):
+        self.channel = channel
+        self.cursor = channel.head - 1 if last and channel.items else channel.head
+        self.delivered = 0
+        self.missed = 0
+        self.delay = 0.0
+        self.closed = False
+        channel.subscribers.add(self)
+
+    @property
+    def lag(self) -> int:
+        return self.channel.head - self.cursor
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        channel = self.channel
+        while self.cursor >= channel.head:
+            if self.closed:
+                raise StopAsyncIteration
+            if channel.done:
+                if channel.error is not None:
+                    raise channel.error
+                raise StopAsyncIteration
+            await channel._event.wait()
+        oldest = channel.items[0][0]
+        if self.cursor < oldest:
+            self.missed += oldest - self.cursor
+            self.cursor = oldest
+        _, published, item = channel.items[self.cursor - oldest]
+        self.cursor += 1
+        self.delivered += 1
+        self.delay = time.monotonic() - published
+        return item
+
+    def close(self):
+        """Stop reading; the shared stream stops when its last subscriber closes."""
+        if self.closed:
+            return
+        self.closed = True
+        channel = self.channel
+        channel.subscribers.discard(self)
+        if not channel.subscribers:
+            channel.hub._remove(channel)
+        channel._wake()
+
+    async def aclose(self):
+        self.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class StreamHub:
+    """
+    Share streams of a WebSocket API instance between many consumers of one process.
+
+    The first subscriber of a (method, params) pair starts the stream; every item is
+    deserialized once and kept in a ring buffer that each subscriber reads with its own
+    cursor, so a slow consumer never delays the others.
+
+    Usage:
+        hub = StreamHub(WebSocketMarket())
+        async with hub.subscribe("get_depth", symbol="BTCUSDT") as depth:
+            async for response in depth:
+                ...
+
+    params:
+        market: Instance whose async generator methods are shared, e.g. binance WebSocketMarket.
+
+        capacity (int): Items kept per stream for lagging subscribers.
+    """
+
+    def __init__(self, market, capacity: int = 1024):
+        self.market = market
+        self.capacity = capacity
+        self._channels: dict[tuple, _Channel] = {}
+
+    def subscribe(self, method: str, last: bool = False, **params) -> HubSubscription:
+        """
+        Subscribe to `market.<method>(**params)`, starting it if nobody listens to it yet.
+
+        Must be called from inside a running event loop.
+
+        params:
+            method (str): Name of the stream method, e.g. "get_depth".
+
+            last (bool): Start with the latest published item instead of waiting for the next one.
+
+            params: Arguments of the stream method.
+        """
+        key = (method, tuple(sorted(params.items())))
+        channel = self._channels.get(key)
+        if channel is None or channel.done:
+            stream = getattr(self.market, method)
+            channel = _Channel(self, key, lambda: stream(**params))
+            self._channels[key] = channel
+        return HubSubscription(channel, last)
+
+    def _remove(self, channel: _Channel):
+        if self._channels.get(channel.key) is channel:
+            del self._channels[channel.key]
+        channel.close()
+
+    def stats(self) -> dict:
+        """(method, params) -> number of subscribers and published items of every running stream."""
+        return {
+            key: {'subscribers': len(channel.subscribers), 'published': channel.head}
+            for key, channel in self._channels.items()
+        }
+
+    def close(self):
+        """Stop every stream; subscribers end after reading what is already buffered."""
+        for channel in list(self._channels.values()):
+            self._remove(channel)
@@ -0,0 +1,43 @@
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+def _default_decoder():
+    if orjson is not None:
+        return orjson.loads
+    if msgspec is not None:
+        return msgspec.json.Decoder().decode
+    return json.loads
+
+
+_decoder = _default_decoder()
+
+
+def set_json_decoder(decoder=None):
+    """
+    Replace the function used to decode every REST response and WebSocket message.
+
+    params:
+        decoder (Callable): Takes bytes or str and returns the decoded object.
+            None restores the default: orjson, then msgspec if installed, else the stdlib json.
+    """
+    global _decoder
+    _decoder = decoder if decoder is not None else _default_decoder()
+
+
+def get_json_decoder():
+    return _decoder
+
+
+def json_loads(data: bytes | str):
+    """Decode a JSON document with the configured decoder, straight from bytes when possible."""
+    return _decoder(data)
@@ -0,0 +1,120 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from urllib.parse import urlsplit
+
+
+class RateLimiter:
+    """
+    Sliding-window request weight limiter shared by every API instance of one exchange.
+
+    Each request reserves its endpoint weight before being sent. When the window is full the
+    caller waits until enough weight expires. Server feedback (used weight headers, 429/418 with
+    Retry-After) corrects the local estimate.
+
+    params:
+        limit (int): Maximum total weight inside one window.
+
+        interval (float): Window length in seconds.
+
+        weights (dict): (HTTP method, endpoint path) or endpoint path (any method) -> weight (int)
+            or callable(params: dict) -> int.
+
+        default_weight (int): Weight of endpoints missing from `weights`.
+
+        used_weight_header (str): Response header with the weight the server counted in the current window.
+    """
+
+    def __init__(self,
+                 limit: int,
+                 interval: float,
+                 weights: dict = None,
+                 default_weight: int = 1,
+                 used_weight_header: str = None,
+                 ):
+        self.limit = limit
+        self.interval = interval
+        self.weights = weights or {}
+        self.default_weight = default_weight
+        self.used_weight_header = used_weight_header
+        self._entries = deque()
+        self._used = 0
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def get_weight(self, url: str, params: dict = None, method: str = 'GET') -> int:
+        path = urlsplit(url).path
+        weight = self.weights.get((method, path))
+        if weight is None:
+            weight = self.weights.get(path, self.default_weight)
+        if callable(weight):
+            weight = weight(params or {})
+        return weight
+
+    @property
+    def used(self) -> int:
+        """Weight reserved in the current window."""
+        with self._lock:
+            self._expire(time.monotonic())
+            return self._used
+
+    def _expire(self, now: float):
+        while self._entries and self._entries[0][0] <= now - self.interval:
+            self._used -= self._entries.popleft()[1]
+
+    def _reserve(self, weight: int) -> float:
+        """Reserve `weight` and return 0, or return the seconds to wait before retrying."""
+        with self._lock:
+            now = time.monotonic()
+            if now < self._blocked_until:
+                return self._blocked_until - now
+            self._expire(now)
+            weight = min(weight, self.limit)
+            if self._used + weight > self.limit:
+                excess = self._used + weight - self.limit
+                for timestamp, entry_weight in self._entries:
+                    excess -= entry_weight
+                    if excess <= 0:
+                        return timestamp + self.interval - now
+            self._entries.append((now, weight))
+            self._used += weight
+            return 0
+
+    def acquire(self, url: str, params: dict = None, method: str = 'GET'):
+        """Block the current thread until the request weight fits into the window."""
+        weight = self.get_weight(url, params, method)
+        while (delay := self._reserve(weight)) > 0:
+            time.sleep(delay)
+
+    async def async_acquire(self, url: str, params: dict = None, method: str = 'GET'):
+        """Wait without blocking the event loop until the request weight fits into the window."""
+        weight = self.get_weight(url, params, method)
+        while (delay := self._reserve(weight)) > 0:
+            await asyncio.sleep(delay)
+
+    def update(self, status: int, headers):
+        """
+        Correct the local state from a server response.
+
+        params:
+            status (int): HTTP status code.
+
+            headers (Mapping): Response headers.
+        """
+        if status in (418, 429):
+            retry_after = headers.get('Retry-After')
+            self.block(float(retry_after) if retry_after else self.interval)
+        if self.used_weight_header and headers.get(self.used_weight_header) is not None:
+            used = int(headers[self.used_weight_header])
+            with self._lock:
+                now = time.monotonic()
+                self._expire(now)
+                if used > self._used:
+                    self._entries.append((now, used - self._used))
+                    self._used = used
+
+    def block(self, seconds: float):
+        """Reject every request for the next `seconds`."""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
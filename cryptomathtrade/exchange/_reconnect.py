@@ -0,0 +1,93 @@
+import asyncio
+import inspect
+import random
+
+from .utils import get_timestamp
+from ..types import StreamGap
+
+
+class Backoff:
+    """
+    Exponential reconnect delays with jitter.
+
+    Each delay is half deterministic and half random, so clients dropped together do not
+    reconnect in lockstep.
+
+    params:
+        initial (float): First delay in seconds.
+
+        maximum (float): Upper bound of a delay.
+
+        factor (float): Growth of the delay per consecutive failure.
+    """
+
+    def __init__(self, initial: float = 0.5, maximum: float = 30.0, factor: float = 2.0):
+        self.initial = initial
+        self.maximum = maximum
+        self.factor = factor
+        self.failures = 0
+
+    def next(self) -> float:
+        delay = min(self.maximum, self.initial * self.factor ** self.failures)
+        self.failures += 1
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def reset(self):
+        self.failures = 0
+
+
+async def reconnecting(factory,
+                       backoff: Backoff = None,
+                       stall_timeout: float = None,
+                       max_retries: int = None,
+                       ):
+    """
+    Yield the items of a WebSocket stream forever, reopening it whenever it fails.
+
+    A disconnect, an error or no item for `stall_timeout` seconds closes the current stream,
+    yields a StreamGap, waits for the backoff delay and calls `factory` again, which
+    re-subscribes (and may fetch a fresh listen key).
+
+    Usage:
+        async for item in reconnecting(lambda: ws_market.get_trades("BTCUSDT"), stall_timeout=30):
+            if isinstance(item, StreamGap):
+                ...  # resync state
+            else:
+                ...
+
+    params:
+        factory (Callable): Returns a new async iterator (or an awaitable of one) of the stream.
+
+        backoff (Backoff, optional): Delay policy. Default Backoff().
+
+        stall_timeout (float, optional): Seconds without items after which the feed is considered stalled.
+
+        max_retries (int, optional): Consecutive failures before the last error is raised. Default: never.
+    """
+    backoff = backoff if backoff is not None else Backoff()
+    attempt = 0
+    while True:
+        iterator = None
+        try:
+            stream = factory()
+            if inspect.isawaitable(stream):
+                stream = await stream
+            iterator = stream.__aiter__()
+            while True:
+                item = await asyncio.wait_for(iterator.__anext__(), stall_timeout)
+                attempt = 0
+                backoff.reset()
+                yield item
+        except StopAsyncIteration:
+            error = ConnectionError('stream closed')
+        except Exception as exc:
+            error = exc
+        finally:
+            if iterator is not None and hasattr(iterator, 'aclose'):
+                await iterator.aclose()
+
+        attempt += 1
+        if max_retries is not None and attempt > max_retries:
+            raise error
+        yield StreamGap(error=error, attempt=attempt, time=get_timestamp())
+        await asyncio.sleep(backoff.next())
@@ -0,0 +1,222 @@
+import json
+import os
+import struct
+import threading
+import time
+import zlib
+from collections import deque
+
+
+# Segment file: MAGIC, then blocks of BLOCK header + the entries, zlib-compressed together
+MAGIC = b'CMTREC\x00\x02'
+# stored size, crc32 of the stored bytes, raw size, entry count, first and last receive time (ns), flags
+BLOCK = struct.Struct('<IIIIqqB')
+# receive time (ns), flags, exchange size, stream size, payload size; then exchange, stream, payload
+ENTRY = struct.Struct('<qBBHI')
+# Sidecar index of a segment, one per block: first and last receive time (ns), block offset
+INDEX_ENTRY = struct.Struct('<qqQ')
+
+FLAG_COMPRESSED = 1  # block flag
+FLAG_TEXT = 1  # entry flag: the payload was a str frame, stored as UTF-8
+
+SEGMENT_SUFFIX = '.seg'
+INDEX_SUFFIX = '.idx'
+
+
+def stream_name(params) -> str:
+    """Label of a subscription: the stream names of a list, compact JSON of a dict, the string itself."""
+    if isinstance(params, (list, tuple)):
+        return ','.join(map(str, params))
+    if isinstance(params, dict):
+        return json.dumps(params, sort_keys=True, separators=(',', ':'))
+    return str(params)
+
+
+class _Segment:
+    def __init__(self, path: str, created: float):
+        self.path = path
+        self.created = created
+        self.file = open(path, 'ab')
+        self.size = self.file.tell()
+        if self.size == 0:
+            self.file.write(MAGIC)
+            self.size = len(MAGIC)
+        self.index = bytearray()
+
+
+def _encode_entry(time_ns: int, exchange: str, stream: str, payload: str | bytes) -> bytes:
+    flags = 0
+    if isinstance(payload, str):
+        payload = payload.encode()
+        flags = FLAG_TEXT
+    exchange, stream = exchange.encode(), stream.encode()
+    header = ENTRY.pack(time_ns, flags, len(exchange), len(stream), len(payload))
+    return b''.join((header, exchange, stream, payload))
+
+
+class MarketRecorder:
+    """
+    Append-only binary log of raw WebSocket frames, split into segment files.
+
+    Every entry holds the receive time, exchange, stream and payload of one frame. write()
+    only queues the frame; a background thread packs the queue into blocks compressed with
+    zlib, appends them to the current segment and fsyncs once per `flush_interval`, so
+    recording costs the event loop one deque append per frame. Compressing a block of
+    similar frames together is what keeps small depth and trade messages compact.
+
+    A segment is closed when it reaches `segment_bytes` or `segment_seconds`, and gets a
+    sidecar .idx file with the time range and offset of each block for seeking by time.
+
+    Usage:
+        with MarketRecorder("data/binance") as recorder:
+            market = binance.WebSocketMarket(recorder=recorder)
+            async for depth in market.get_depth("BTCUSDT", interval=100):
+                ...
+
+    params:
+        directory (str): Folder of the segment files, created if missing.
+
+        prefix (str): File name prefix of the segments.
+
+        segment_bytes (int): Size after which a new segment is started.
+
+        segment_seconds (float): Age after which a new segment is started.
+
+        flush_interval (float): Seconds between writes and fsyncs of queued frames.
+
+        block_bytes (int): Uncompressed size after which a block is closed within one flush.
+
+        compress_level (int): zlib level 1-9, 0 stores the blocks uncompressed.
+    """
+
+    def __init__(self,
+                 directory: str,
+                 prefix: str = 'market',
+                 segment_bytes: int = 256 * 1024 * 1024,
+                 segment_seconds: float = 3600,
+                 flush_interval: float = 1.0,
+                 block_bytes: int = 1024 * 1024,
+                 compress_level: int = 1,
+                 ):
+        self.directory = os.path.expanduser(directory)
+        self.prefix = prefix
+        self.segment_bytes = segment_bytes
+        self.segment_seconds = segment_seconds
+        self.flush_interval = flush_interval
+        self.block_bytes = block_bytes
+        self.compress_level = compress_level
+        self.entries = 0
+        self.raw_bytes = 0
+        self.bytes_written = 0
+        self.segments = []
+        self.error = None
+        os.makedirs(self.directory, exist_ok=True)
+        self._pending = deque()
+        self._segment = None
+        self._io_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name='MarketRecorder', daemon=True)
+        self._thread.start()
+
+    def write(self, exchange: str, stream: str, payload: str | bytes, time_ns: int = None):
+        """Queue one frame; `time_ns` defaults to now."""
+        if self._closed:
+            raise ValueError('recorder is closed')
+        self._pending.append((time_ns if time_ns is not None else time.time_ns(), exchange, stream, payload))
+
+    async def tap(self, stream, exchange: str, name: str):
+        """Yield the frames of an async iterator unchanged, recording each one as it arrives."""
+        async for frame in stream:
+            self.write(exchange, name, frame)
+            yield frame
+
+    def _run(self):
+        while not self._closed:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as exc:
+                self.error = exc
+
+    def _current_segment(self, time_ns: int) -> _Segment:
+        segment = self._segment
+        if segment is not None and (
+                segment.size >= self.segment_bytes
+                or time.monotonic() - segment.created >= self.segment_seconds):
+            self._close_segment()
+            segment = None
+        if segment is None:
+            path = os.path.join(self.directory, f'{self.prefix}-{time_ns:019d}{SEGMENT_SUFFIX}')
+            segment = self._segment = _Segment(path, time.monotonic())
+            self.segments.append(path)
+        return segment
+
+    def _close_segment(self):
+        segment, self._segment = self._segment, None
+        segment.file.flush()
+        os.fsync(segment.file.fileno())
+        segment.file.close()
+        index_path = segment.path[:-len(SEGMENT_SUFFIX)] + INDEX_SUFFIX
+        with open(index_path, 'ab') as file:
+            file.write(segment.index)
+
+    def _write_block(self, segment: _Segment, block: bytearray, count: int, first: int, last: int):
+        flags = 0
+        data = block
+        if self.compress_level:
+            data = zlib.compress(block, self.compress_level)
+            flags = FLAG_COMPRESSED
+        header = BLOCK.pack(len(data), zlib.crc32(data), len(block), count, first, last, flags)
+        segment.index += INDEX_ENTRY.pack(first, last, segment.size)
+        segment.file.write(header)
+        segment.file.write(data)
+        segment.size += len(header) + len(data)
+        self.entries += count
+        self.raw_bytes += len(block)
+        self.bytes_written += len(header) + len(data)
+
+    def flush(self):
+        """Write and fsync every queued frame now."""
+        with self._io_lock:
+            pending = self._pending
+            if not pending:
+                return
+            while pending:
+                segment = self._current_segment(pending[0][0])
+                block = bytearray()
+                count = 0
+                first = last = pending[0][0]
+                while pending and len(block) < self.block_bytes:
+                    entry = pending.popleft()
+                    block += _encode_entry(*entry)
+                    count += 1
+                    first, last = min(first, entry[0]), max(last, entry[0])
+                self._write_block(segment, block, count, first, last)
+            self._segment.file.flush()
+            os.fsync(self._segment.file.fileno())
+
+    def rotate(self):
+        """Close the current segment now; the next frame starts a new one."""
+        self.flush()
+        with self._io_lock:
+            if self._segment is not None:
+                self._close_segment()
+
+    def close(self):
+        """Write the queued frames and close the current segment and its index."""
+        if self._closed:
+            return
+        self._closed = True
+        self._wakeup.set()
+        self._thread.join()
+        self.rotate()
+        if self.error is not None:
+            raise self.error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
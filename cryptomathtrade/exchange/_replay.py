@@ -0,0 +1,173 @@
+import asyncio
+import bisect
+import glob
+import mmap
+import os
+import struct
+import zlib
+from typing import NamedTuple
+
+from ._recorder import MAGIC, BLOCK, ENTRY, INDEX_ENTRY, FLAG_COMPRESSED, FLAG_TEXT, SEGMENT_SUFFIX, INDEX_SUFFIX
+
+
+class RecordedFrame(NamedTuple):
+    time_ns: int
+    exchange: str
+    stream: str
+    payload: str | bytes
+
+
+def _block_offset(path: str, start_ns: int) -> int | None:
+    """Offset of the first block that may hold frames at or after `start_ns`, from the segment index."""
+    try:
+        with open(path[:-len(SEGMENT_SUFFIX)] + INDEX_SUFFIX, 'rb') as file:
+            index = list(INDEX_ENTRY.iter_unpack(file.read()))
+    except (OSError, struct.error):
+        return None
+    position = bisect.bisect_left([last for _, last, _ in index], start_ns)
+    return index[position][2] if position < len(index) else None
+
+
+def read_segment(path: str, start_ns: int = None, end_ns: int = None, exchanges=None, streams=None):
+    """
+    Yield the RecordedFrame of a segment file in recorded order, read through mmap.
+
+    A torn or corrupt block at the end of a segment that was not closed cleanly ends the
+    iteration instead of raising.
+
+    params:
+        path (str): Segment file written by MarketRecorder.
+
+        start_ns, end_ns (int, optional): Receive time range [start_ns, end_ns).
+
+        exchanges, streams (Iterable[str], optional): Only frames of these exchanges / streams.
+    """
+    exchanges = {exchange.encode() for exchange in exchanges} if exchanges else None
+    streams = {stream.encode() for stream in streams} if streams else None
+    with open(path, 'rb') as file:
+        size = os.fstat(file.fileno()).st_size
+        if size <= len(MAGIC):
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if data[:len(MAGIC)] != MAGIC:
+                raise ValueError(f'{path} is not a recorder segment')
+            offset = len(MAGIC)
+            if start_ns is not None:
+                offset = _block_offset(path, start_ns) or offset
+            while offset + BLOCK.size <= size:
+                stored, crc, raw, count, first, last, flags = BLOCK.unpack_from(data, offset)
+                begin = offset + BLOCK.size
+                offset = begin + stored
+                if offset > size:
+                    return
+                if end_ns is not None and first >= end_ns:
+                    return
+                if start_ns is not None and last < start_ns:
+                    continue
+                block = data[begin:offset]
+                if zlib.crc32(block) != crc:
+                    return
+                if flags & FLAG_COMPRESSED:
+                    block = zlib.decompress(block, bufsize=raw)
+                position = 0
+                for _ in range(count):
+                    time_ns, entry_flags, exchange_size, stream_size, payload_size = ENTRY.unpack_from(block, position)
+                    position += ENTRY.size
+                    exchange = block[position:position + exchange_size]
+                    position += exchange_size
+                    stream = block[position:position + stream_size]
+                    position += stream_size
+                    payload_start = position
+                    position += payload_size
+                    if exchanges is not None and exchange not in exchanges:
+                        continue
+                    if streams is not None and stream not in streams:
+                        continue
+                    if start_ns is not None and time_ns < start_ns:
+                        continue
+                    if end_ns is not None and time_ns >= end_ns:
+                        return
+                    payload = block[payload_start:position]
+                    if entry_flags & FLAG_TEXT:
+                        payload = payload.decode()
+                    yield RecordedFrame(time_ns, exchange.decode(), stream.decode(), payload)
+
+
+class MarketReplay:
+    """
+    Replay the frames logged by a MarketRecorder.
+
+    frames() reads every segment in order; stream() serves one stream as an async iterator,
+    at recorded speed or as fast as possible. Passed as `ws_source` to an API instance, it
+    replaces the WebSocket connection: the stream methods decode and deserialize the recorded
+    frames with the same code as live frames.
+
+    Usage:
+        replay = MarketReplay("data/binance", speed=None)
+        market = binance.WebSocketMarket(ws_source=replay, trusted=True)
+        async for depth in market.get_depth("BTCUSDT", interval=100):
+            ...
+
+    params:
+        directory (str): Folder of the segment files.
+
+        prefix (str): File name prefix of the segments.
+
+        start, end (int, optional): Receive time range to replay, ns.
+
+        speed (float, optional): Playback rate of stream(), 1.0 for recorded timing, None for no delays.
+    """
+
+    def __init__(self,
+                 directory: str,
+                 prefix: str = 'market',
+                 start: int = None,
+                 end: int = None,
+                 speed: float = None,
+                 ):
+        self.directory = os.path.expanduser(directory)
+        self.prefix = prefix
+        self.start = start
+        self.end = end
+        self.speed = speed
+
+    @property
+    def segments(self) -> list[str]:
+        paths = sorted(glob.glob(os.path.join(glob.escape(self.directory), f'{self.prefix}-*{SEGMENT_SUFFIX}')))
+        if self.start is not None:
+            # Segment names are the receive time of their first frame
+            starts = [int(os.path.basename(path)[len(self.prefix) + 1:-len(SEGMENT_SUFFIX)]) for path in paths]
+            first = max(0, bisect.bisect_right(starts, self.start) - 1)
+            paths = paths[first:]
+        if self.end is not None:
+            paths = [path for path in paths
+                     if int(os.path.basename(path)[len(self.prefix) + 1:-len(SEGMENT_SUFFIX)]) < self.end]
+        return paths
+
+    def frames(self, exchanges=None, streams=None):
+        """RecordedFrame of every segment in recorded order, optionally of some exchanges / streams only."""
+        for path in self.segments:
+            yield from read_segment(path, self.start, self.end, exchanges, streams)
+
+    async def stream(self, exchange: str = None, stream: str = None, speed: float = None):
+        """
+        Payloads of one stream as an async iterator, paced by `speed` (default: the replay speed).
+
+        params:
+            exchange (str, optional): Exchange of the stream. Default: every exchange.
+
+            stream (str, optional): Stream name as recorded. Default: every stream.
+
+            speed (float, optional): Playback rate, None for no delays.
+        """
+        speed = speed if speed is not None else self.speed
+        loop = asyncio.get_running_loop()
+        origin = None
+        for frame in self.frames([exchange] if exchange else None, [stream] if stream else None):
+            if speed:
+                if origin is None:
+                    origin = (frame.time_ns, loop.time())
+                delay = origin[1] + (frame.time_ns - origin[0]) / 1e9 / speed - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            yield frame.payload
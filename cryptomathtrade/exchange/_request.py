@@ -2,10 +2,17 @@ import json
 import websockets
 import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
 
+from ._json import json_loads
 from .utils import clean_none_value, _prepare_params
 
 
+POOL_SIZE = 100
+DNS_CACHE_TTL = 300
+KEEPALIVE_TIMEOUT = 30
+
+
 def _dispatch_request(session, http_method):
     return {
         'GET': session.get,
@@ -15,43 +22,87 @@ def _dispatch_request(session, http_method):
     }.get(http_method, 'GET')
 
 
+def create_session(pool_size: int = POOL_SIZE) -> requests.Session:
+    """
+    Create a keep-alive requests session with a connection pool of the given size.
+
+    params:
+        pool_size (int): Maximum number of connections kept open per host.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def create_async_session(pool_size: int = POOL_SIZE,
+                         dns_cache_ttl: int = DNS_CACHE_TTL,
+                         keepalive_timeout: float = KEEPALIVE_TIMEOUT,
+                         ) -> aiohttp.ClientSession:
+    """
+    Create a keep-alive aiohttp session with a connection pool and DNS cache.
+
+    Must be called from inside a running event loop.
+
+    params:
+        pool_size (int): Maximum number of simultaneous connections.
+
+        dns_cache_ttl (int): Seconds to keep resolved host addresses.
+
+        keepalive_timeout (float): Seconds to keep an idle connection open.
+    """
+    connector = aiohttp.TCPConnector(limit=pool_size,
+                                     ttl_dns_cache=dns_cache_ttl,
+                                     keepalive_timeout=keepalive_timeout,
+                                     )
+    return aiohttp.ClientSession(connector=connector)
+
+
 class Request:
-    def __init__(self, timeout=None, headers=None):
-        self.session = requests.Session()
+    def __init__(self, timeout=None, headers=None, session=None):
+        self.session = session if session is not None else requests.Session()
         self.timeout = timeout
-        if headers:
-            self.session.headers.update(headers)
+        self.headers = headers
 
     def send_request(self, method: str, url: str, payload=None):
         if payload is None:
             payload = {}
         params = clean_none_value({'url': url,
                                    'params': _prepare_params(payload),
+                                   'headers': self.headers,
                                    'timeout': self.timeout,
                                    })
         response = _dispatch_request(self.session, method)(**params)
+        content = response.content
+        response.json = lambda **kwargs: json_loads(content)
         return response
 
 
 class AsyncRequest:
-    def __init__(self, timeout=None, headers=None):
+    def __init__(self, timeout=None, headers=None, session=None):
         self.timeout = timeout
         self.headers = headers
+        self.session = session
 
     async def send_request(self, method: str, url: str, payload: dict | None = None):
+        if self.session is None:
+            async with aiohttp.ClientSession() as session:
+                return await self._send_request(session, method, url, payload)
+        return await self._send_request(self.session, method, url, payload)
+
+    async def _send_request(self, session, method: str, url: str, payload: dict | None = None):
         if payload is None:
             payload = {}
         params = clean_none_value({'url': url,
                                    'params': clean_none_value(payload),
+                                   'headers': self.headers,
                                    'timeout': self.timeout,
                                    })
-        async with aiohttp.ClientSession(headers=self.headers) as session:
-            async with _dispatch_request(session, method)(**params) as response:
-                if response.content_type == 'application/json':
-                    response.json = await response.json()
-                else:
-                    response.json = json.loads(await response.text())
-                return response
+        async with _dispatch_request(session, method)(**params) as response:
+            body = await response.read()
+            response.json = json_loads(body) if body else None
+            return response
 
 
 class WebSocketRequest:
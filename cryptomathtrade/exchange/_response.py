@@ -2,6 +2,8 @@ from typing import Generic, TypeVar
 
 from pydantic import BaseModel
 
+from ..types import ArrayOrderBook, KlineFrame, Order, OrderBook
+
 
 data = TypeVar('data')
 response_object = TypeVar('response_object')
@@ -21,3 +23,99 @@ class Response(BaseModel, Generic[data, response_object]):
 
     def __str__(self):
         return str(self.data)
+
+
+def depth_response(asks,
+                   bids,
+                   response,
+                   trusted: bool = False,
+                   price=0,
+                   volume=1,
+                   lastUpdateId: int = None,
+                   ) -> Response:
+    """
+    Depth response of every exchange deserializer.
+
+    The data is a validated OrderBook of Decimal levels, or with `trusted` (API instances
+    created with trusted=True) the ArrayOrderBook of float levels of trusted_depth.
+
+    params:
+        asks, bids: Exchange levels, lists or dicts.
+
+        response: The response object from the server.
+
+        trusted (bool): Skip validation and build an ArrayOrderBook.
+
+        price, volume: Index (or key for dict levels) of the price and volume in a level.
+
+        lastUpdateId (int): Sequence number of the book, when provided by the exchange.
+    """
+    if trusted:
+        return trusted_depth(asks, bids, response, price, volume, lastUpdateId)
+    return Response(
+        data=OrderBook(
+            asks=[Order(price=level[price], volume=level[volume]) for level in asks],
+            bids=[Order(price=level[price], volume=level[volume]) for level in bids],
+            lastUpdateId=lastUpdateId,
+        ),
+        response_object=response,
+    )
+
+
+def trusted_depth(asks,
+                  bids,
+                  response,
+                  price=0,
+                  volume=1,
+                  lastUpdateId: int = None,
+                  ) -> Response:
+    """
+    Build a depth response without validation or a model object per level.
+
+    Used by deserializers of API instances created with trusted=True. The data is an
+    ArrayOrderBook, not an OrderBook: same asks/bids, best-first order and price/volume
+    meaning, but levels are (price, volume) float pairs instead of Order with Decimal
+    values (ArrayOrderBook.to_order_book() converts it).
+
+    params:
+        asks, bids: Exchange levels, lists or dicts.
+
+        response: The response object from the server.
+
+        price, volume: Index (or key for dict levels) of the price and volume in a level.
+
+        lastUpdateId (int): Sequence number of the book, when provided by the exchange.
+    """
+    if price != 0 or volume != 1:
+        asks = ((level[price], level[volume]) for level in asks)
+        bids = ((level[price], level[volume]) for level in bids)
+    return Response.model_construct(
+        data=ArrayOrderBook.from_levels(asks, bids, lastUpdateId),
+        response_object=response,
+    )
+
+
+def trusted_kline(rows,
+                  response,
+                  columns=(0, 1, 2, 3, 4, 5),
+                  time_unit: int = 1,
+                  ) -> Response:
+    """
+    Build a kline response without validation or a model object per candle.
+
+    Used by deserializers of API instances created with trusted=True. The data is a
+    KlineFrame in the order of the exchange, with open times in ms.
+
+    params:
+        rows: Exchange kline rows, lists or dicts.
+
+        response: The response object from the server.
+
+        columns: Index (or key for dict rows) of open time, open, high, low, close and volume.
+
+        time_unit (int): 1000 for exchanges returning open times in seconds.
+    """
+    return Response.model_construct(
+        data=KlineFrame.from_rows(rows, columns, time_unit),
+        response_object=response,
+    )
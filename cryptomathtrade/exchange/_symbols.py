@@ -0,0 +1,160 @@
+QUOTES = ('USDT', 'USDC', 'FDUSD', 'TUSD', 'BUSD', 'USDE', 'DAI', 'USD', 'EUR', 'TRY', 'BRL',
+          'BTC', 'ETH', 'BNB', 'SOL', 'TRX', 'XRP', 'DOGE')
+SEPARATORS = ('-', '_', '/')
+
+# Exchange name -> (template, lowercase) of native symbol names, used for exchanges not indexed yet
+SYMBOL_FORMATS = {
+    'binance': ('{base}{quote}', False),
+    'bingx': ('{base}-{quote}', False),
+    'bybit': ('{base}{quote}', False),
+    'kucoin': ('{base}-{quote}', False),
+    'okx': ('{base}-{quote}', False),
+    'htx': ('{base}{quote}', True),
+    'bitmart': ('{base}_{quote}', False),
+    'gate': ('{base}_{quote}', False),
+    'mexc': ('{base}_{quote}', False),
+    'bitget': ('{base}{quote}', False),
+    'ascendex': ('{base}/{quote}', False),
+    'lbank': ('{base}_{quote}', True),
+    'xt': ('{base}_{quote}', True),
+    'weex': ('{base}{quote}_SPBL', False),
+    'coinex': ('{base}{quote}', False),
+    'ourbit': ('{base}{quote}', False),
+    'poloniex': ('{base}_{quote}', False),
+    'whitebit': ('{base}_{quote}', False),
+    'bitunix': ('{base}{quote}', False),
+    'backpack': ('{base}_{quote}', False),
+    'bitrue': ('{base}{quote}', False),
+    'orangex': ('{base}-{quote}', False),  # get_depth appends the -SPOT instrument suffix
+    'tapbit': ('{base}/{quote}', False),
+    'toobit': ('{base}{quote}', False),
+    'hotcoin': ('{base}_{quote}', True),
+    'coinw': ('{base}_{quote}', False),
+    'digifinex': ('{base}_{quote}', True),
+    'kcex': ('{base}_{quote}', False),
+}
+
+_QUOTES_BY_LENGTH = sorted(QUOTES, key=len, reverse=True)
+
+
+def split_symbol(symbol: str) -> tuple[str, str] | None:
+    """
+    Canonical (BASE, QUOTE) of a native symbol name: 'BTC-USDT', 'btc_usdt', 'BTCUSDT' -> ('BTC', 'USDT').
+
+    Names without a separator are split on the longest known quote coin suffix; None if none matches.
+    """
+    upper = symbol.upper()
+    for separator in SEPARATORS:
+        if separator in upper:
+            base, _, quote = upper.partition(separator)
+            return base, quote
+    for quote in _QUOTES_BY_LENGTH:
+        if upper.endswith(quote) and len(upper) > len(quote):
+            return upper[:-len(quote)], quote
+    return None
+
+
+def parse_symbol(exchange: str, symbol: str) -> tuple[str, str] | None:
+    """Canonical (BASE, QUOTE) of a native name, without the fixed suffix of the exchange template if any."""
+    template = SYMBOL_FORMATS.get(exchange, ('',))[0]
+    suffix = template.partition('{quote}')[2].upper()
+    if suffix and symbol.upper().endswith(suffix):
+        symbol = symbol[:-len(suffix)]
+    return split_symbol(symbol)
+
+
+def format_symbol(exchange: str, base: str, quote: str) -> str | None:
+    """Native symbol name by the naming convention of the exchange, None if it is not in SYMBOL_FORMATS."""
+    if exchange not in SYMBOL_FORMATS:
+        return None
+    template, lowercase = SYMBOL_FORMATS[exchange]
+    symbol = template.format(base=base.upper(), quote=quote.upper())
+    return symbol.lower() if lowercase else symbol
+
+
+class SymbolIndex:
+    """
+    Bidirectional map between canonical (BASE, QUOTE) pairs and the native symbol names of exchanges.
+
+    Filled once from the get_symbols listings; every lookup is then a dict access. Exchanges
+    without get_symbols (or not indexed yet) are served from the naming convention in
+    SYMBOL_FORMATS, which covers every exchange of Exchanges.
+
+    Usage:
+        index = await get_symbol_index(["binance", "bingx", "okx"])
+        index.native("okx", "BTC", "USDT")          # 'BTC-USDT'
+        index.canonical("binance", "BTCUSDT")       # ('BTC', 'USDT')
+        await get_depths(index.exchanges("BTC", "USDT"))
+    """
+
+    def __init__(self):
+        self._native: dict[tuple[str, str], dict[str, str]] = {}
+        self._canonical: dict[str, dict[str, tuple[str, str]]] = {}
+        self.errors: dict[str, Exception] = {}
+
+    def add(self, exchange: str, symbols):
+        """
+        Index the listing of an exchange.
+
+        params:
+            exchange (str): Exchange name.
+
+            symbols (Iterable[Symbol | str]): Symbol models (firstCoin / secondCoin are used when set)
+                or native names.
+        """
+        canonical = self._canonical.setdefault(exchange, {})
+        for symbol in symbols:
+            if isinstance(symbol, str):
+                name, pair = symbol, parse_symbol(exchange, symbol)
+            else:
+                name = symbol.symbol
+                if symbol.firstCoin and symbol.secondCoin:
+                    pair = (symbol.firstCoin.upper(), symbol.secondCoin.upper())
+                else:
+                    pair = parse_symbol(exchange, name)
+            if pair is None:
+                continue
+            canonical[name] = pair
+            self._native.setdefault(pair, {})[exchange] = name
+
+    def remove(self, exchange: str):
+        for pair in self._canonical.pop(exchange, {}).values():
+            natives = self._native.get(pair)
+            if natives is not None:
+                natives.pop(exchange, None)
+                if not natives:
+                    del self._native[pair]
+
+    def native(self, exchange: str, base: str, quote: str) -> str | None:
+        """
+        Native name of a pair on an exchange.
+
+        None if the indexed exchange does not list it; exchanges not indexed fall back to SYMBOL_FORMATS.
+        """
+        if exchange not in self._canonical:
+            return format_symbol(exchange, base, quote)
+        return self._native.get((base.upper(), quote.upper()), {}).get(exchange)
+
+    def canonical(self, exchange: str, symbol: str) -> tuple[str, str] | None:
+        """(BASE, QUOTE) of a native symbol; exchanges not indexed fall back to parse_symbol."""
+        if exchange not in self._canonical:
+            return parse_symbol(exchange, symbol)
+        return self._canonical[exchange].get(symbol)
+
+    def exchanges(self, base: str, quote: str) -> dict[str, str]:
+        """Exchange name -> native name of every indexed exchange listing the pair, the `symbols` of get_depths."""
+        return dict(self._native.get((base.upper(), quote.upper()), {}))
+
+    def pairs(self, min_exchanges: int = 2) -> list[tuple[str, str]]:
+        """Pairs listed on at least `min_exchanges` indexed exchanges, the candidates for arbitrage."""
+        return [pair for pair, natives in self._native.items() if len(natives) >= min_exchanges]
+
+    @property
+    def indexed(self) -> list[str]:
+        return list(self._canonical)
+
+    def __len__(self):
+        return len(self._native)
+
+    def __contains__(self, pair: tuple[str, str]):
+        return (pair[0].upper(), pair[1].upper()) in self._native
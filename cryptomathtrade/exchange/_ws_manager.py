@@ -0,0 +1,308 @@
+import asyncio
+import itertools
+import json
+from abc import ABC, abstractmethod
+
+import websockets
+
+from ._buffer import StreamBuffer, BLOCK
+from ._json import json_loads
+
+
+_CLOSED = object()
+
+
+class Subscription:
+    """
+    Async iterator over the decoded messages of some streams of a WebSocketManager.
+
+    Closing it (aclose() or leaving `async with`) unsubscribes the streams nobody else listens to.
+    A failure of the underlying socket is raised from the iterator.
+
+    Messages wait in a StreamBuffer; with the BLOCK policy a full buffer pauses the reader of
+    the shared connection, so prefer DROP_OLDEST or CONFLATE for consumers that may lag.
+    """
+
+    def __init__(self, manager: 'WebSocketManager', streams, maxsize: int = 0, overflow: str = BLOCK):
+        self.manager = manager
+        self.streams = tuple(dict.fromkeys(streams))
+        self.queue = StreamBuffer(maxsize, overflow)
+        self.closed = False
+        self._released = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        item = await self.queue.get()
+        if item is _CLOSED:
+            self.queue.push_nowait(_CLOSED)
+            raise StopAsyncIteration
+        if isinstance(item, Exception):
+            self.closed = True
+            self.queue.push_nowait(_CLOSED)
+            raise item
+        return item
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    def _finish(self, item=_CLOSED):
+        if not self.closed:
+            self.closed = True
+            self.queue.push_nowait(item)
+
+    async def aclose(self):
+        self._finish()
+        if not self._released:
+            self._released = True
+            await self.manager._unsubscribe(self)
+
+
+class _Connection:
+    def __init__(self, manager: 'WebSocketManager'):
+        self.manager = manager
+        self.streams = set()
+        self.client = None
+        self.reader = None
+        self._send_lock = asyncio.Lock()
+        self._last_send = 0.0
+
+    async def open(self):
+        self.client = await websockets.connect(self.manager.url, extra_headers=self.manager.headers)
+        self.reader = asyncio.create_task(self._read())
+
+    async def send_streams(self, build_message, streams: list):
+        """Send (un)subscribe requests for `streams`, split and paced to the exchange limits."""
+        manager = self.manager
+        size = manager.max_streams_per_message or len(streams)
+        for start in range(0, len(streams), size):
+            message = build_message(streams[start:start + size], next(manager._ids))
+            async with self._send_lock:
+                loop = asyncio.get_running_loop()
+                delay = self._last_send + manager.message_interval - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                await self.client.send(json.dumps(message))
+                self._last_send = loop.time()
+
+    async def _read(self):
+        manager = self.manager
+        try:
+            async for frame in self.client:
+                message = json_loads(frame)
+                stream = manager.route(message)
+                if stream is not None:
+                    if manager.recorder is not None:
+                        manager.recorder.write(manager.exchange, stream, frame)
+                    for subscription in tuple(manager._routes.get(stream, ())):
+                        if not subscription.closed:
+                            await subscription.queue.push(message)
+        except Exception as exc:
+            error = exc
+        else:
+            error = ConnectionError('stream connection closed')
+        try:
+            # Release the socket and its keepalive / writer tasks before the connection is dropped
+            await self.client.close()
+        except Exception:
+            pass
+        manager._drop(self, error)
+
+    async def close(self):
+        if self.reader is not None:
+            self.reader.cancel()
+        if self.client is not None:
+            await self.client.close()
+
+
+class WebSocketManager(ABC):
+    """
+    Many stream subscriptions multiplexed over a few shared WebSocket connections.
+
+    Streams are packed onto open connections up to `max_streams` each; a new connection is
+    opened only when all of them are full. Every frame is decoded once and routed by stream
+    name to the subscriptions listening to it, so one stream wanted by several consumers is
+    subscribed on the exchange only once.
+
+    Exchanges implement subscribe_message(), unsubscribe_message() and route().
+
+    Usage:
+        async with manager.subscribe(["btcusdt@trade", "ethusdt@trade"]) as subscription:
+            async for message in subscription:
+                ...
+
+    params:
+        url (str): Endpoint of the multiplexed stream connection.
+
+        max_streams (int): Streams per connection before sharding to a new one.
+
+        headers (dict): Additional headers of the WebSocket handshake.
+
+        recorder (MarketRecorder): Log every routed frame under its stream name.
+    """
+    exchange = None  # name recorded with the frames
+    url = None
+    max_streams = 200
+    max_streams_per_message = None  # None sends every stream of a request in one message
+    message_interval = 0.0  # minimum seconds between control messages on one connection
+
+    def __init__(self, url: str = None, max_streams: int = None, headers: dict = None, recorder=None):
+        if url is not None:
+            self.url = url
+        if max_streams is not None:
+            self.max_streams = max_streams
+        self.headers = headers
+        self.recorder = recorder
+        self._connections: list[_Connection] = []
+        self._routes: dict[str, set[Subscription]] = {}
+        self._stream_connection: dict[str, _Connection] = {}
+        self._ids = itertools.count(1)
+        self._lock = asyncio.Lock()
+
+    @abstractmethod
+    def subscribe_message(self, streams: list, request_id: int) -> dict:
+        """Control message subscribing `streams`."""
+
+    @abstractmethod
+    def unsubscribe_message(self, streams: list, request_id: int) -> dict:
+        """Control message unsubscribing `streams`."""
+
+    @abstractmethod
+    def route(self, message) -> str | None:
+        """Stream name of a decoded message, None for control replies."""
+
+    def payload(self, message):
+        """Data part of a routed message."""
+        return message
+
+    @property
+    def connections(self) -> int:
+        return len(self._connections)
+
+    @property
+    def streams(self) -> list[str]:
+        return list(self._stream_connection)
+
+    def subscribe(self, streams: str | list, maxsize: int = 0, overflow: str = BLOCK) -> '_Subscribe':
+        """
+        Subscribe to one or many streams.
+
+        Await the result for a Subscription, or use it directly with `async with`.
+
+        params:
+            streams (str | list): Stream names.
+
+            maxsize (int): Buffered messages of the subscription, 0 for unbounded.
+
+            overflow (str): BLOCK, DROP_OLDEST or CONFLATE, see StreamBuffer.
+        """
+        if isinstance(streams, str):
+            streams = [streams]
+        return _Subscribe(self, Subscription(self, streams, maxsize, overflow))
+
+    async def _subscribe(self, subscription: Subscription) -> Subscription:
+        async with self._lock:
+            new_streams = [stream for stream in subscription.streams if stream not in self._stream_connection]
+            for stream in subscription.streams:
+                self._routes.setdefault(stream, set()).add(subscription)
+            try:
+                await self._add_streams(new_streams)
+            except BaseException:
+                self._remove_routes(subscription)
+                raise
+        return subscription
+
+    async def _add_streams(self, streams: list):
+        while streams:
+            connection = await self._free_connection()
+            free = self.max_streams - len(connection.streams)
+            batch, streams = streams[:free], streams[free:]
+            connection.streams.update(batch)
+            for stream in batch:
+                self._stream_connection[stream] = connection
+            await connection.send_streams(self.subscribe_message, batch)
+
+    async def _free_connection(self) -> _Connection:
+        for connection in self._connections:
+            if len(connection.streams) < self.max_streams:
+                return connection
+        connection = _Connection(self)
+        await connection.open()
+        self._connections.append(connection)
+        return connection
+
+    def _remove_routes(self, subscription: Subscription) -> dict:
+        """Detach a subscription; return connection -> streams left without listeners."""
+        released = {}
+        for stream in subscription.streams:
+            subscribers = self._routes.get(stream)
+            if subscribers is None:
+                continue
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._routes[stream]
+                connection = self._stream_connection.pop(stream, None)
+                if connection is not None:
+                    connection.streams.discard(stream)
+                    released.setdefault(connection, []).append(stream)
+        return released
+
+    async def _unsubscribe(self, subscription: Subscription):
+        async with self._lock:
+            for connection, streams in self._remove_routes(subscription).items():
+                if connection not in self._connections:
+                    continue
+                if connection.streams:
+                    await connection.send_streams(self.unsubscribe_message, streams)
+                else:
+                    self._connections.remove(connection)
+                    await connection.close()
+
+    def _drop(self, connection: _Connection, error: Exception):
+        """Fail every subscription of a connection that stopped reading."""
+        if connection in self._connections:
+            self._connections.remove(connection)
+        for stream in connection.streams:
+            self._stream_connection.pop(stream, None)
+            for subscription in self._routes.pop(stream, ()):
+                subscription._finish(error)
+        connection.streams.clear()
+
+    async def close(self):
+        """Close every connection and end all subscriptions."""
+        async with self._lock:
+            for subscriptions in self._routes.values():
+                for subscription in subscriptions:
+                    subscription._finish()
+            self._routes.clear()
+            self._stream_connection.clear()
+            connections, self._connections = self._connections, []
+            for connection in connections:
+                await connection.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+
+class _Subscribe:
+    """Awaitable / async context manager returned by WebSocketManager.subscribe()."""
+
+    def __init__(self, manager: WebSocketManager, subscription: Subscription):
+        self.manager = manager
+        self.subscription = subscription
+
+    def __await__(self):
+        return self.manager._subscribe(self.subscription).__await__()
+
+    async def __aenter__(self) -> Subscription:
+        return await self.manager._subscribe(self.subscription)
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.subscription.aclose()
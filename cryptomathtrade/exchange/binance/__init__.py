@@ -1,2 +1,12 @@
 from .urls import URLS
-from .api import Market, AsyncMarket, Spot, AsyncSpot, Account, AsyncAccount
+from .api import (
+    Market,
+    AsyncMarket,
+    WebSocketMarket,
+    Spot,
+    AsyncSpot,
+    Account,
+    AsyncAccount,
+    LocalOrderBook,
+    StreamManager,
+)
@@ -1,3 +1,5 @@
-from .market import Market, AsyncMarket
+from .market import Market, AsyncMarket, WebSocketMarket
 from .account import Account, AsyncAccount
 from .spot import Spot, AsyncSpot
+from .order_book import LocalOrderBook
+from .stream import StreamManager
@@ -1,8 +1,18 @@
+from ..urls import URLS
 from ..._api import BaseAPI
+from ..._rate_limit import RateLimiter
 
 
 class API(BaseAPI):
-    def __init__(self, api_key=None, api_secret=None, headers=None):
+    exchange = "binance"
+    rate_limiter = RateLimiter(
+        URLS.RATE_LIMIT,
+        URLS.RATE_LIMIT_INTERVAL,
+        weights=URLS.WEIGHTS,
+        used_weight_header=URLS.USED_WEIGHT_HEADER,
+    )
+
+    def __init__(self, api_key=None, api_secret=None, headers=None, **kwargs):
         """
         params:
             api_key (str): API key for authentication.
@@ -10,8 +20,11 @@ class API(BaseAPI):
             api_secret (str): API secret for authentication.
 
             headers (dict): Additional headers for API requests.
+
+            kwargs: BaseAPI options (pool_size, dns_cache_ttl, keepalive_timeout, trusted,
+                ws_buffer_size, ws_overflow, recorder, ws_source, clock).
         """
-        super().__init__()
+        super().__init__(**kwargs)
         self.api_key = api_key
         self.api_secret = api_secret
         self.headers = {"X-MBX-APIKEY": self.api_key} if self.api_key else {}
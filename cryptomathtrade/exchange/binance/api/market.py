@@ -1,8 +1,8 @@
-import json
-
 from .api import API
+from .stream import StreamManager
 from ..deserialize import market as deserialize
 from ..core.market import MarketCore, WebSocketMarketCore
+from ..._json import json_loads
 from ...utils import validate_response
 
 
@@ -14,6 +14,8 @@ class Market(API):
 
         https://binance-docs.github.io/apidocs/spot/en/#order-book
 
+        Returns an OrderBook, or an ArrayOrderBook of float levels for instances created with trusted=True.
+
         params:
             symbol (str): the trading pair.
 
@@ -23,7 +25,7 @@ class Market(API):
             self._query(**MarketCore.get_depth(self, symbol=symbol, limit=limit))
         )
         json_data = response.json()
-        return deserialize.deserialize_depth(json_data, response)
+        return deserialize.deserialize_depth(json_data, response, trusted=self.trusted)
 
     def get_trades(self, symbol: str, limit: int = 500):
         """Recent Trades List
@@ -125,7 +127,21 @@ class Market(API):
             )
         )
         json_data = response.json()
-        return deserialize.deserialize_kline(json_data, response)
+        return deserialize.deserialize_kline(json_data, response, trusted=self.trusted)
+
+    def get_server_time(self):
+        """Check Server Time
+
+        GET /api/v3/time
+
+        https://binance-docs.github.io/apidocs/spot/en/#check-server-time
+
+        Returns:
+            Response[int]: Server time in ms.
+        """
+        response = validate_response(self._query(**MarketCore.get_server_time(self)))
+        json_data = response.json()
+        return deserialize.deserialize_server_time(json_data, response)
 
 
 class AsyncMarket(API):
@@ -136,6 +152,8 @@ class AsyncMarket(API):
 
         https://binance-docs.github.io/apidocs/spot/en/#order-book
 
+        Returns an OrderBook, or an ArrayOrderBook of float levels for instances created with trusted=True.
+
         params:
             symbol (str): the trading pair.
 
@@ -147,7 +165,7 @@ class AsyncMarket(API):
             )
         )
         json_data = response.json
-        return deserialize.deserialize_depth(json_data, response)
+        return deserialize.deserialize_depth(json_data, response, trusted=self.trusted)
 
     async def get_trades(self, symbol: str, limit: int = 500):
         """Recent Trades List
@@ -255,10 +273,63 @@ class AsyncMarket(API):
             )
         )
         json_data = response.json
-        return deserialize.deserialize_kline(json_data, response)
+        return deserialize.deserialize_kline(json_data, response, trusted=self.trusted)
+
+    async def get_server_time(self):
+        """Check Server Time
+
+        GET /api/v3/time
+
+        https://binance-docs.github.io/apidocs/spot/en/#check-server-time
+
+        Returns:
+            Response[int]: Server time in ms.
+        """
+        response = validate_response(
+            await self._async_query(**MarketCore.get_server_time(self))
+        )
+        json_data = response.json
+        return deserialize.deserialize_server_time(json_data, response)
 
 
 class WebSocketMarket(API):
+    def __init__(self, manager: StreamManager = None, **kwargs):
+        """
+        params:
+            manager (StreamManager, optional): Shared multiplexed connections to subscribe through.
+                Default: every stream opens its own connection.
+
+            kwargs: API options (api_key, api_secret, headers, ...).
+        """
+        super().__init__(**kwargs)
+        self.manager = manager
+
+    async def _ws_messages(self, url: str, params: list, method: str = "SUBSCRIBE"):
+        """Yield (decoded payload, raw message) of the streams, through the manager if any.
+
+        Frames are buffered per the ws_buffer_size / ws_overflow options and decoded on the consumer side.
+        With ws_source the recording is replayed even if a manager is set.
+        """
+        if self.manager is None or self.ws_source is not None:
+            async for response in self._ws_buffered(
+                url=url, params=params, method=method
+            ):
+                json_data = json_loads(response)
+                if (
+                    isinstance(json_data, dict)
+                    and "stream" in json_data
+                    and "data" in json_data
+                ):
+                    # Combined stream envelope, as recorded by a StreamManager
+                    json_data = json_data["data"]
+                yield json_data, response
+            return
+        async with self.manager.subscribe(
+            params, maxsize=self.ws_buffer_size, overflow=self.ws_overflow
+        ) as subscription:
+            async for message in subscription:
+                yield self.manager.payload(message), message
+
     async def get_depth(self, symbol: str, limit: int = 20, interval: int = 1000):
         """Partial Book Depth Streams
 
@@ -266,6 +337,8 @@ class WebSocketMarket(API):
 
         https://binance-docs.github.io/apidocs/spot/en/#partial-book-depth-streams
 
+        Returns an OrderBook, or an ArrayOrderBook of float levels for instances created with trusted=True.
+
         params:
             symbol (str): the trading pair
 
@@ -273,7 +346,7 @@ class WebSocketMarket(API):
 
             interval (int, optional): 1000ms or 100ms.
         """
-        async for response in self._ws_query(
+        async for json_data, response in self._ws_messages(
             **WebSocketMarketCore.get_depth(
                 self,
                 symbol=symbol,
@@ -281,9 +354,10 @@ class WebSocketMarket(API):
                 interval=interval,
             )
         ):
-            json_data = json.loads(response)
             if "result" not in json_data:
-                yield deserialize.deserialize_depth(json_data, response)
+                yield deserialize.deserialize_depth(
+                    json_data, response, trusted=self.trusted
+                )
 
     async def get_trades(self, symbol: str):
         """Trade Streams
@@ -298,9 +372,32 @@ class WebSocketMarket(API):
         params:
            symbol (str): the trading pair.
         """
-        async for response in self._ws_query(
+        async for json_data, response in self._ws_messages(
             **WebSocketMarketCore.get_trades(self, symbol=symbol)
         ):
-            json_data = json.loads(response)
             if "result" not in json_data:
                 yield deserialize.deserialize_trades_for_ws(json_data, response)
+
+    async def get_diff_depth(self, symbol: str, interval: int = 1000):
+        """Diff. Depth Stream
+
+        Order book price and quantity depth updates used to locally manage an order book.
+
+        Stream Name: <symbol>@depth OR <symbol>@depth@100ms
+
+        https://binance-docs.github.io/apidocs/spot/en/#diff-depth-stream
+
+        params:
+            symbol (str): the trading pair.
+
+            interval (int, optional): 1000ms or 100ms.
+        """
+        async for json_data, response in self._ws_messages(
+            **WebSocketMarketCore.get_diff_depth(
+                self,
+                symbol=symbol,
+                interval=interval,
+            )
+        ):
+            if "result" not in json_data:
+                yield deserialize.deserialize_diff_depth_for_ws(json_data, response)
@@ -0,0 +1,170 @@
+import asyncio
+
+from .market import AsyncMarket, WebSocketMarket
+from ..._reconnect import Backoff, reconnecting
+from ...errors import ResponseError
+from ....types import ArrayOrderBook, OrderBook, OrderBookUpdate, StreamGap
+
+
+class LocalOrderBook:
+    """Full-depth order book maintained locally from the diff. depth stream.
+
+    Follows https://binance-docs.github.io/apidocs/spot/en/#how-to-manage-a-local-order-book-correctly:
+    diffs are buffered while a REST snapshot is downloaded, applied in update id order,
+    and the book is resynchronized from a new snapshot whenever a gap is detected.
+    The diff stream reconnects by itself; the update ids after a reconnect no longer
+    follow the book, which triggers the resync.
+
+    Usage:
+        async for book in LocalOrderBook("BTCUSDT"):
+            book.get_order_book(limit=20)
+
+    params:
+        symbol (str): the trading pair.
+
+        limit (int, optional): Snapshot depth. Default 5000; max 5000.
+
+        interval (int, optional): Diff stream speed, 1000ms or 100ms. Default 100.
+
+        market (AsyncMarket, optional): Instance used for snapshots, to share its connection pool.
+            Default: a trusted AsyncMarket, snapshots skip pydantic validation.
+
+        ws_market (WebSocketMarket, optional): Instance used for the diff stream.
+
+        backoff (Backoff, optional): Reconnect delay policy of the diff stream.
+
+        stall_timeout (float, optional): Seconds without diffs after which the stream reconnects.
+
+        snapshot_retries (int, optional): Snapshot downloads older than the buffered diffs tried
+            again, with backoff delays in between, before giving up. Default 5.
+
+        tick_size (str, optional): Price step of the symbol; prices are kept as exact integer ticks.
+    """
+
+    def __init__(
+        self,
+        symbol: str,
+        limit: int = 5000,
+        interval: int = 100,
+        market: AsyncMarket = None,
+        ws_market: WebSocketMarket = None,
+        backoff: Backoff = None,
+        stall_timeout: float = None,
+        snapshot_retries: int = 5,
+        tick_size: str = None,
+    ):
+        self.symbol = symbol
+        self.limit = limit
+        self.interval = interval
+        self._own_market = market is None
+        self.market = market if market is not None else AsyncMarket(trusted=True)
+        self.ws_market = ws_market if ws_market is not None else WebSocketMarket()
+        self.backoff = backoff
+        self.stall_timeout = stall_timeout
+        self.snapshot_retries = snapshot_retries
+        self.tick_size = tick_size
+        self.book = ArrayOrderBook(tick_size)
+        self.resyncs = 0
+        self.gaps = 0
+
+    @property
+    def last_update_id(self) -> int | None:
+        return self.book.last_update_id
+
+    def __aiter__(self):
+        return self.stream()
+
+    async def stream(self):
+        """Yield the book itself after every applied diff."""
+        queue = asyncio.Queue()
+        reader = asyncio.create_task(self._read(queue))
+        try:
+            update = await self._next(queue)
+            while True:
+                await self._load_snapshot(update.firstUpdateId)
+                while update.lastUpdateId <= self.last_update_id:
+                    update = await self._next(queue)
+                if update.firstUpdateId > self.last_update_id + 1:
+                    self.resyncs += 1
+                    continue
+                self._apply(update)
+                yield self
+                update = await self._next(queue)
+                while update.firstUpdateId == self.last_update_id + 1:
+                    self._apply(update)
+                    yield self
+                    update = await self._next(queue)
+                self.resyncs += 1
+        finally:
+            reader.cancel()
+            if self._own_market:
+                await self.market.aclose()
+
+    async def _read(self, queue: asyncio.Queue):
+        try:
+            async for response in reconnecting(
+                lambda: self.ws_market.get_diff_depth(
+                    symbol=self.symbol, interval=self.interval
+                ),
+                backoff=self.backoff,
+                stall_timeout=self.stall_timeout,
+            ):
+                if isinstance(response, StreamGap):
+                    self.gaps += 1
+                else:
+                    queue.put_nowait(response.data)
+        except Exception as exc:
+            queue.put_nowait(exc)
+
+    @staticmethod
+    async def _next(queue: asyncio.Queue) -> OrderBookUpdate:
+        item = await queue.get()
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    async def _load_snapshot(self, first_update_id: int):
+        # A deep snapshot costs up to 250 weight: wait before asking a lagging REST cache again
+        backoff = Backoff()
+        if self.backoff is not None:
+            backoff = Backoff(
+                self.backoff.initial, self.backoff.maximum, self.backoff.factor
+            )
+        for attempt in range(self.snapshot_retries + 1):
+            if attempt:
+                await asyncio.sleep(backoff.next())
+            snapshot = (
+                await self.market.get_depth(symbol=self.symbol, limit=self.limit)
+            ).data
+            if isinstance(snapshot, OrderBook):
+                snapshot = ArrayOrderBook.from_order_book(snapshot, self.tick_size)
+            elif self.tick_size is not None:
+                snapshot = ArrayOrderBook.from_levels(
+                    snapshot.asks, snapshot.bids, snapshot.last_update_id, self.tick_size
+                )
+            if snapshot.last_update_id >= first_update_id:
+                self.book = snapshot
+                return
+        raise ResponseError(
+            f"{self.symbol} snapshot {snapshot.last_update_id} is still older than "
+            f"diff {first_update_id} after {self.snapshot_retries} retries"
+        )
+
+    def _apply(self, update: OrderBookUpdate):
+        self.book.update(
+            ((order.price, order.volume) for order in update.asks),
+            ((order.price, order.volume) for order in update.bids),
+            update.lastUpdateId,
+        )
+
+    @property
+    def best_ask(self) -> tuple[float, float] | None:
+        return self.book.best_ask
+
+    @property
+    def best_bid(self) -> tuple[float, float] | None:
+        return self.book.best_bid
+
+    def get_order_book(self, limit: int = None) -> OrderBook:
+        """Current state of the book, best levels first."""
+        return self.book.to_order_book(limit)
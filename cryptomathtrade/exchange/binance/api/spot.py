@@ -1,6 +1,9 @@
+import functools
+
 from .api import API
 from ..deserialize import spot as deserialize
 from ..core.spot import SpotCore
+from ..._batch import order_call, gather_calls, run_calls
 from ...utils import validate_response
 from ....types import Side, TimeInForce
 
@@ -235,6 +238,60 @@ class Spot(API):
         json_data = response.json()
         return deserialize.deserialize_order(json_data, response)
 
+    def new_orders(self, orders: list[dict], concurrency: int = None) -> list:
+        """New Orders (TRADE)
+
+        Post several orders concurrently, one request each. Returns the response or the
+        exception of every order, in the order given; a rejected order does not stop the others.
+
+        POST /api/v3/order
+
+        params:
+            orders (list[dict]): Keyword arguments of new_limit_order, or of new_market_order
+                for orders without "price". "side" and "timeInForce" may be strings.
+
+            concurrency (int, optional): Requests in flight at once. Default: the pool size.
+        """
+        calls = [order_call(self, order) for order in orders]
+        return run_calls(self, calls, concurrency)
+
+    def cancel_orders(self, orders: list[dict], concurrency: int = None) -> list:
+        """Cancel Orders (TRADE)
+
+        Cancel several active orders concurrently, one request each. Returns the response or
+        the exception of every cancel, in the order given.
+
+        DELETE /api/v3/order
+
+        params:
+            orders (list[dict]): Keyword arguments of cancel_open_order, e.g.
+                {"symbol": "BTCUSDT", "orderId": 1}.
+
+            concurrency (int, optional): Requests in flight at once. Default: the pool size.
+        """
+        calls = [functools.partial(self.cancel_open_order, **order) for order in orders]
+        return run_calls(self, calls, concurrency)
+
+    def cancel_all_open_orders(
+        self, symbols: list[str], concurrency: int = None
+    ) -> list:
+        """Cancel All Open Orders (TRADE)
+
+        Cancel every open order of several symbols concurrently, one request per symbol.
+        Returns the response or the exception of every symbol, in the order given.
+
+        DELETE /api/v3/openOrders
+
+        params:
+            symbols (list[str])
+
+            concurrency (int, optional): Requests in flight at once. Default: the pool size.
+        """
+        calls = [
+            functools.partial(self.cancel_open_orders, symbol) for symbol in symbols
+        ]
+        return run_calls(self, calls, concurrency)
+
 
 class AsyncSpot(API):
     async def get_orders(
@@ -465,3 +522,57 @@ class AsyncSpot(API):
         )
         json_data = response.json
         return deserialize.deserialize_order(json_data, response)
+
+    async def new_orders(self, orders: list[dict], concurrency: int = None) -> list:
+        """New Orders (TRADE)
+
+        Post several orders concurrently, one request each. Returns the response or the
+        exception of every order, in the order given; a rejected order does not stop the others.
+
+        POST /api/v3/order
+
+        params:
+            orders (list[dict]): Keyword arguments of new_limit_order, or of new_market_order
+                for orders without "price". "side" and "timeInForce" may be strings.
+
+            concurrency (int, optional): Requests in flight at once. Default: all of them.
+        """
+        calls = [order_call(self, order) for order in orders]
+        return await gather_calls(calls, concurrency)
+
+    async def cancel_orders(self, orders: list[dict], concurrency: int = None) -> list:
+        """Cancel Orders (TRADE)
+
+        Cancel several active orders concurrently, one request each. Returns the response or
+        the exception of every cancel, in the order given.
+
+        DELETE /api/v3/order
+
+        params:
+            orders (list[dict]): Keyword arguments of cancel_open_order, e.g.
+                {"symbol": "BTCUSDT", "orderId": 1}.
+
+            concurrency (int, optional): Requests in flight at once. Default: all of them.
+        """
+        calls = [functools.partial(self.cancel_open_order, **order) for order in orders]
+        return await gather_calls(calls, concurrency)
+
+    async def cancel_all_open_orders(
+        self, symbols: list[str], concurrency: int = None
+    ) -> list:
+        """Cancel All Open Orders (TRADE)
+
+        Cancel every open order of several symbols concurrently, one request per symbol.
+        Returns the response or the exception of every symbol, in the order given.
+
+        DELETE /api/v3/openOrders
+
+        params:
+            symbols (list[str])
+
+            concurrency (int, optional): Requests in flight at once. Default: all of them.
+        """
+        calls = [
+            functools.partial(self.cancel_open_orders, symbol) for symbol in symbols
+        ]
+        return await gather_calls(calls, concurrency)
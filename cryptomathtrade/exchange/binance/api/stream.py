@@ -0,0 +1,36 @@
+from ..urls import URLS
+from ..._ws_manager import WebSocketManager
+
+
+class StreamManager(WebSocketManager):
+    """Binance market streams multiplexed over combined stream connections.
+
+    Frames of the combined endpoint are wrapped as {"stream": <name>, "data": <payload>},
+    which is what subscriptions yield. Streams are (un)subscribed live with SUBSCRIBE /
+    UNSUBSCRIBE requests, at most 1024 per connection and 5 requests per second.
+
+    https://binance-docs.github.io/apidocs/spot/en/#live-subscribing-unsubscribing-to-streams
+
+    Usage:
+        manager = StreamManager()
+        market = WebSocketMarket(manager=manager)
+        async for trade in market.get_trades("BTCUSDT"):
+            ...
+    """
+
+    exchange = "binance"
+    url = URLS.WS_STREAM_URL
+    max_streams = URLS.WS_MAX_STREAMS
+    message_interval = URLS.WS_MESSAGE_INTERVAL
+
+    def subscribe_message(self, streams: list, request_id: int) -> dict:
+        return {"method": "SUBSCRIBE", "params": streams, "id": request_id}
+
+    def unsubscribe_message(self, streams: list, request_id: int) -> dict:
+        return {"method": "UNSUBSCRIBE", "params": streams, "id": request_id}
+
+    def route(self, message) -> str | None:
+        return message.get("stream")
+
+    def payload(self, message):
+        return message["data"]
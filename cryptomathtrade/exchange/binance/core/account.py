@@ -1,6 +1,6 @@
 from ..api.api import API
 from ..urls import URLS
-from ...utils import get_timestamp, replace_param, check_require_params
+from ...utils import replace_param, check_require_params
 
 
 class AccountCore(API):
@@ -11,7 +11,7 @@ class AccountCore(API):
 
         https://binance-docs.github.io/apidocs/spot/en/#all-coins-39-information-user_data
         """
-        params["timestamp"] = get_timestamp()
+        params["timestamp"] = self._timestamp()
         return self.return_args(
             method="GET",
             url=URLS.BASE_URL + URLS.GET_COINS_URL,
@@ -50,7 +50,7 @@ class AccountCore(API):
             amount (float, optional).
         """
         replace_param(params, "asset", "coin")
-        params["timestamp"] = get_timestamp()
+        params["timestamp"] = self._timestamp()
         return self.return_args(
             method="GET",
             url=URLS.BASE_URL + URLS.GET_DEPOSIT_ADDRESS_URL,
@@ -82,7 +82,7 @@ class AccountCore(API):
             with a length of less than 100 characters
         """
         replace_param(params, "asset", "coin")
-        params["timestamp"] = get_timestamp()
+        params["timestamp"] = self._timestamp()
         return self.return_args(
             method="POST",
             url=URLS.BASE_URL + URLS.WITHDRAW_URL,
@@ -112,7 +112,7 @@ class AccountCore(API):
             txId (str, optional).
         """
         replace_param(params, "asset", "coin")
-        params["timestamp"] = get_timestamp()
+        params["timestamp"] = self._timestamp()
         return self.return_args(
             method="GET",
             url=URLS.BASE_URL + URLS.GET_DEPOSIT_HISTORY,
@@ -142,7 +142,7 @@ class AccountCore(API):
             offset (int, optional).
         """
         replace_param(params, "asset", "coin")
-        params["timestamp"] = get_timestamp()
+        params["timestamp"] = self._timestamp()
         return self.return_args(
             method="GET",
             url=URLS.BASE_URL + URLS.GET_WITHDRAW_HISTORY,
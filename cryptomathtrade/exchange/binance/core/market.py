@@ -114,6 +114,17 @@ class MarketCore(API):
             method="GET", url=URLS.BASE_URL + URLS.KLINE_URL, params=params
         )
 
+    def get_server_time(self, **params) -> dict:
+        """Check Server Time
+
+        GET /api/v3/time
+
+        https://binance-docs.github.io/apidocs/spot/en/#check-server-time
+        """
+        return self.return_args(
+            method="GET", url=URLS.BASE_URL + URLS.SERVER_TIME_URL, params=params
+        )
+
 
 class WebSocketMarketCore(API):
     @check_require_params(("symbol",))
@@ -157,3 +168,24 @@ class WebSocketMarketCore(API):
             url=URLS.WS_BASE_URL,
             params=[f'{params["symbol"].lower()}@trade'],
         )
+
+    @check_require_params(("symbol",))
+    def get_diff_depth(self, **params) -> dict:
+        """Diff. Depth Stream
+
+        Stream Name: <symbol>@depth OR <symbol>@depth@100ms
+
+        https://binance-docs.github.io/apidocs/spot/en/#diff-depth-stream
+
+        params:
+            symbol (str): the trading pair.
+
+            interval (int, optional): 1000ms or 100ms.
+        """
+        interval = params.get("interval", 1000)
+        speed = "" if interval == 1000 else f"@{interval}ms"
+        return self.return_args(
+            method="SUBSCRIBE",
+            url=URLS.WS_BASE_URL,
+            params=[f'{params["symbol"].lower()}@depth{speed}'],
+        )
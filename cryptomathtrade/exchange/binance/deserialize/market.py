@@ -1,6 +1,7 @@
-from ..._response import Response
+from ..._response import Response, depth_response, trusted_kline
 from ....types import (
     OrderBook,
+    OrderBookUpdate,
     Trade,
     Ticker,
     Order,
@@ -10,13 +11,15 @@ from ....types import (
 )
 
 
-def deserialize_depth(data, response) -> Response[OrderBook, object]:
-    return Response(
-        data=OrderBook(
-            asks=[Order(price=ask[0], volume=ask[1]) for ask in data["asks"]],
-            bids=[Order(price=bid[0], volume=bid[1]) for bid in data["bids"]],
-        ),
-        response_object=response,
+def deserialize_depth(
+    data, response, trusted: bool = False
+) -> Response[OrderBook, object]:
+    return depth_response(
+        data["asks"],
+        data["bids"],
+        response,
+        trusted,
+        lastUpdateId=data.get("lastUpdateId"),
     )
 
 
@@ -48,13 +51,53 @@ def deserialize_ticker(data, response) -> Response[list[Ticker], object]:
 
 
 def deserialize_symbols(data, response) -> Response[list[Symbol], object]:
-    # TODO:
-    return Response(data=data, response_object=response)
+    symbols = []
+    for i in data["symbols"]:
+        filters = {f["filterType"]: f for f in i.get("filters", ())}
+        price_filter = filters.get("PRICE_FILTER", {})
+        lot_size = filters.get("LOT_SIZE", {})
+        notional = filters.get("NOTIONAL") or filters.get("MIN_NOTIONAL") or {}
+        symbols.append(
+            Symbol(
+                symbol=i["symbol"],
+                firstCoin=i.get("baseAsset"),
+                secondCoin=i.get("quoteAsset"),
+                minQty=lot_size.get("minQty"),
+                maxQty=lot_size.get("maxQty"),
+                status=i["status"],
+                minNotional=notional.get("minNotional"),
+                maxNotional=notional.get("maxNotional"),
+                tickSize=price_filter.get("tickSize"),
+                stepSize=lot_size.get("stepSize"),
+            )
+        )
+    return Response(data=symbols, response_object=response)
 
 
-def deserialize_kline(data, response) -> Response[list[Kline], object]:
-    # TODO:
-    return Response(data=data, response_object=response)
+def deserialize_kline(
+    data, response, trusted: bool = False
+) -> Response[list[Kline], object]:
+    if trusted:
+        return trusted_kline(data, response)
+    return Response(
+        data=[
+            Kline(
+                openTime=i[0],
+                openPrice=i[1],
+                highPrice=i[2],
+                lowerPrice=i[3],
+                closePrice=i[4],
+                closeTime=i[6],
+                amount=i[5],
+            )
+            for i in data
+        ],
+        response_object=response,
+    )
+
+
+def deserialize_server_time(data, response) -> Response[int, object]:
+    return Response(data=data["serverTime"], response_object=response)
 
 
 def deserialize_trades_for_ws(data, response) -> Response[list[Trade], object]:
@@ -68,3 +111,16 @@ def deserialize_trades_for_ws(data, response) -> Response[list[Trade], object]:
         ),
         response_object=response,
     )
+
+
+def deserialize_diff_depth_for_ws(data, response) -> Response[OrderBookUpdate, object]:
+    return Response(
+        data=OrderBookUpdate(
+            asks=[Order(price=ask[0], volume=ask[1]) for ask in data["a"]],
+            bids=[Order(price=bid[0], volume=bid[1]) for bid in data["b"]],
+            firstUpdateId=data["U"],
+            lastUpdateId=data["u"],
+            time=data.get("E"),
+        ),
+        response_object=response,
+    )
@@ -10,6 +10,7 @@ class URLS:
     TRADES_URL = "/api/v3/trades"  # https://binance-docs.github.io/apidocs/spot/en/#recent-trades-list
     TICKER_URL = "/api/v3/ticker/24hr"  # https://binance-docs.github.io/apidocs/spot/en/#24hr-ticker-price-change-statistics
     KLINE_URL = "/api/v3/klines"  # https://binance-docs.github.io/apidocs/spot/en/#kline-candlestick-data
+    SERVER_TIME_URL = "/api/v3/time"  # https://binance-docs.github.io/apidocs/spot/en/#check-server-time
     SYMBOLS_URL = "/api/v3/exchangeInfo"  # https://binance-docs.github.io/apidocs/spot/en/#exchange-information
 
     # Spot
@@ -30,3 +31,47 @@ class URLS:
 
     # WS
     WS_BASE_URL = "wss://stream.binance.com:443/ws"
+    WS_STREAM_URL = "wss://stream.binance.com:443/stream"  # https://binance-docs.github.io/apidocs/spot/en/#websocket-market-streams
+    WS_MAX_STREAMS = 1024  # streams per connection
+    WS_MESSAGE_INTERVAL = 0.2  # 5 incoming messages per second per connection
+
+    # Rate limits  # https://binance-docs.github.io/apidocs/spot/en/#limits
+    RATE_LIMIT = 6000  # REQUEST_WEIGHT per RATE_LIMIT_INTERVAL
+    RATE_LIMIT_INTERVAL = 60
+    USED_WEIGHT_HEADER = "X-MBX-USED-WEIGHT-1M"
+    WEIGHTS = {  # (HTTP method, path) -> weight
+        ("GET", DEPTH_URL): lambda params: _depth_weight(
+            int(params.get("limit", 100))
+        ),
+        ("GET", TRADES_URL): 25,
+        ("GET", TICKER_URL): lambda params: _ticker_weight(params),
+        ("GET", KLINE_URL): 2,
+        ("GET", SYMBOLS_URL): 20,
+        ("GET", SERVER_TIME_URL): 1,
+        ("GET", ORDER_URL): 4,
+        ("POST", CREATE_ORDER_URL): 1,
+        ("DELETE", CANCEL_ORDER_URL): 1,
+        ("GET", GET_ORDERS_URL): 20,
+        ("GET", OPEN_ORDERS_URL): lambda params: 6 if params.get("symbol") else 80,
+        ("DELETE", CANCEL_ORDERS_URL): 1,
+        ("GET", GET_COINS_URL): 10,
+    }
+
+
+def _depth_weight(limit: int) -> int:
+    if limit <= 100:
+        return 5
+    if limit <= 500:
+        return 25
+    if limit <= 1000:
+        return 50
+    return 250
+
+
+def _ticker_weight(params: dict) -> int:
+    if params.get("symbol"):
+        return 2
+    if params.get("symbols"):
+        count = params["symbols"].count(",") + 1
+        return 2 if count <= 20 else 40 if count <= 100 else 80
+    return 80
@@ -1,3 +1,3 @@
-from .market import Market, AsyncMarket
+from .market import Market, AsyncMarket, WebSocketMarket
 from .account import Account, AsyncAccount
 from .spot import Spot, AsyncSpot
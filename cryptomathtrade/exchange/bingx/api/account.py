@@ -1,11 +1,10 @@
-import gzip
-import io
-import json
-import time
+import asyncio
 
 from .api import API
 from ..deserialize import account as deserialize
 from ..core.account import AccountCore, WSAccountCore
+from ..._json import json_loads
+from ..._reconnect import Backoff, reconnecting
 from ...utils import validate_response
 
 
@@ -39,6 +38,22 @@ class Account(API):
         json_data = response.json()
         return deserialize.deserialize_listen_key(json_data, response)
 
+    def extend_listen_key(self, listenKey: str):
+        """Extend Listen Key Validity Period
+
+        PUT openApi/user/auth/userDataStream
+
+        https://bingx-api.github.io/docs/#/en-us/spot/socket/listenKey.html#extend%20Listen%20Key%20Validity%20period
+
+        params:
+            listenKey (str): Listen key to keep valid for another 60 minutes.
+        """
+        response = validate_response(
+            self._query(**AccountCore.extend_listen_key(self, listenKey=listenKey))
+        )
+        json_data = response.json() if response.content else None
+        return deserialize.deserialize_extend_listen_key(json_data, response)
+
     def get_balance(self):
         """Query Assets
 
@@ -257,6 +272,24 @@ class AsyncAccount(API):
         json_data = response.json
         return deserialize.deserialize_listen_key(json_data, response)
 
+    async def extend_listen_key(self, listenKey: str):
+        """Extend Listen Key Validity Period
+
+        PUT openApi/user/auth/userDataStream
+
+        https://bingx-api.github.io/docs/#/en-us/spot/socket/listenKey.html#extend%20Listen%20Key%20Validity%20period
+
+        params:
+            listenKey (str): Listen key to keep valid for another 60 minutes.
+        """
+        response = validate_response(
+            await self._async_query(
+                **AccountCore.extend_listen_key(self, listenKey=listenKey)
+            )
+        )
+        json_data = response.json
+        return deserialize.deserialize_extend_listen_key(json_data, response)
+
     async def get_balance(self):
         """Query Assets
 
@@ -456,17 +489,70 @@ class WebSocketAccount(API):
 
         https://bingx-api.github.io/docs/#/en-us/spot/socket/account.html#Subscription%20order%20update%20data
 
+        The listen key expires after 1 hour unless it is extended with Account.extend_listen_key;
+        account_update_stream manages the key and reconnects by itself.
+
         :params:
             listenKey (str): Account.generate_listen_key, (listen key Valid for 1 hour).
         """
-        time_end = time.time() + 3600
         async for response in self._ws_query(
             **WSAccountCore.account_update(self, listenKey=listenKey)
         ):
-            if time.time() >= time_end:
-                break
-            json_data = json.loads(
-                gzip.GzipFile(fileobj=io.BytesIO(response), mode="rb").read().decode()
-            )
+            json_data = json_loads(response)
             if "a" in json_data:
                 yield deserialize.deserialize_account_update_for_ws(json_data, response)
+
+    async def account_update_stream(
+        self,
+        keepalive_interval: float = 1800,
+        backoff: Backoff = None,
+        stall_timeout: float = None,
+    ):
+        """Account balance push that survives disconnects and listen key expiry.
+
+        A listen key is generated for every connection and extended every `keepalive_interval`
+        seconds while it is open. When the connection drops a StreamGap is yielded, then the
+        stream reconnects with a fresh key after the backoff delay.
+
+        :params:
+            keepalive_interval (float, optional): Seconds between listen key extensions. Default 1800.
+
+            backoff (Backoff, optional): Reconnect delay policy.
+
+            stall_timeout (float, optional): Seconds without messages after which to reconnect.
+        """
+
+        async def connect():
+            listen_key = (await self._generate_listen_key()).data
+            keepalive = asyncio.create_task(
+                self._keep_listen_key(listen_key, keepalive_interval)
+            )
+            try:
+                async for update in self.account_update(listenKey=listen_key):
+                    yield update
+            finally:
+                keepalive.cancel()
+
+        async for item in reconnecting(
+            connect, backoff=backoff, stall_timeout=stall_timeout
+        ):
+            yield item
+
+    async def _generate_listen_key(self):
+        response = validate_response(
+            await self._async_query(**AccountCore.generate_listen_key(self))
+        )
+        return deserialize.deserialize_listen_key(response.json, response)
+
+    async def _keep_listen_key(self, listen_key: str, interval: float):
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                response = validate_response(
+                    await self._async_query(
+                        **AccountCore.extend_listen_key(self, listenKey=listen_key)
+                    )
+                )
+                deserialize.deserialize_extend_listen_key(response.json, response)
+            except Exception:
+                continue  # retried next interval, the key is valid for 60 minutes
@@ -1,12 +1,20 @@
 import asyncio
+import json
 import uuid
 
+from ..urls import URLS
 from ..._request import WebSocketRequest
 from ..._api import BaseAPI
+from ..._decompress import Decompressor, GZIP
+from ..._json import json_loads
+from ..._rate_limit import RateLimiter
 
 
 class API(BaseAPI):
-    def __init__(self, api_key=None, api_secret=None, headers=None):
+    exchange = "bingx"
+    rate_limiter = RateLimiter(URLS.RATE_LIMIT, URLS.RATE_LIMIT_INTERVAL)
+
+    def __init__(self, api_key=None, api_secret=None, headers=None, **kwargs):
         """
         params:
             api_key (str): API key for authentication.
@@ -14,8 +22,11 @@ class API(BaseAPI):
             api_secret (str): API secret for authentication.
 
             headers (dict): Additional headers for API requests.
+
+            kwargs: BaseAPI options (pool_size, dns_cache_ttl, keepalive_timeout, trusted,
+                ws_buffer_size, ws_overflow, recorder, ws_source, clock).
         """
-        super().__init__()
+        super().__init__(**kwargs)
         self.api_key = api_key
         self.api_secret = api_secret
         self.headers = {"X-BX-APIKEY": self.api_key} if self.api_key else {}
@@ -34,7 +45,10 @@ class API(BaseAPI):
             method (str): Method for the WebSocket request (default is 'SUBSCRIBE').
 
             timeout_seconds (int): Timeout duration for the WebSocket connection.
+
+        Frames are gunzipped once; heartbeats are answered here and only data frames are yielded.
         """
+        decompress = Decompressor(GZIP)
         payload = {"reqType": method, "dataType": params, "id": str(uuid.uuid4())}
         connect = WebSocketRequest(headers=self.headers).open_connect(
             url=url, payload=payload
@@ -44,5 +58,16 @@ class API(BaseAPI):
                 data = await asyncio.wait_for(client.recv(), timeout=timeout_seconds)
                 if not data:
                     raise ConnectionError  # custom error
-                await client.send("Pong")
+                data = decompress(data)
+                if isinstance(data, str):
+                    data = data.encode()  # text frames pass through the decompressor
+                if data == b"Ping":
+                    await client.send("Pong")
+                    continue
+                if data.startswith(b'{"ping"'):
+                    ping = json_loads(data)
+                    await client.send(
+                        json.dumps({"pong": ping["ping"], "time": ping.get("time")})
+                    )
+                    continue
                 yield data
@@ -1,10 +1,7 @@
-import gzip
-import io
-import json
-
 from .api import API
 from ..deserialize import market as deserialize
 from ..core.market import MarketCore, WebSocketMarketCore
+from ..._json import json_loads
 from ...utils import validate_response
 
 
@@ -16,6 +13,8 @@ class Market(API):
 
         https://bingx-api.github.io/docs/#/en-us/spot/market-api.html#Query%20depth%20information
 
+        Returns an OrderBook, or an ArrayOrderBook of float levels for instances created with trusted=True.
+
         param:
             symbol (str): the trading pair.
 
@@ -25,7 +24,7 @@ class Market(API):
             self._query(**MarketCore.get_depth(self, symbol=symbol, limit=limit))
         )
         json_data = response.json()
-        return deserialize.deserialize_depth(json_data, response)
+        return deserialize.deserialize_depth(json_data, response, trusted=self.trusted)
 
     def get_trades(self, symbol: str, limit: int = 100):
         """Recent Trades List
@@ -115,7 +114,19 @@ class Market(API):
             )
         )
         json_data = response.json()
-        return deserialize.deserialize_kline(json_data, response)
+        return deserialize.deserialize_kline(json_data, response, trusted=self.trusted)
+
+    def get_server_time(self):
+        """Check Server Time
+
+        GET /openApi/spot/v1/server/time
+
+        Returns:
+            Response[int]: Server time in ms.
+        """
+        response = validate_response(self._query(**MarketCore.get_server_time(self)))
+        json_data = response.json()
+        return deserialize.deserialize_server_time(json_data, response)
 
 
 class AsyncMarket(API):
@@ -126,6 +137,8 @@ class AsyncMarket(API):
 
         https://bingx-api.github.io/docs/#/en-us/spot/market-api.html#Query%20depth%20information
 
+        Returns an OrderBook, or an ArrayOrderBook of float levels for instances created with trusted=True.
+
         param:
             symbol (str): the trading pair.
 
@@ -137,7 +150,7 @@ class AsyncMarket(API):
             )
         )
         json_data = response.json
-        return deserialize.deserialize_depth(json_data, response)
+        return deserialize.deserialize_depth(json_data, response, trusted=self.trusted)
 
     async def get_trades(self, symbol: str, limit: int = 100):
         """Recent Trades List
@@ -229,7 +242,21 @@ class AsyncMarket(API):
             )
         )
         json_data = response.json
-        return deserialize.deserialize_kline(json_data, response)
+        return deserialize.deserialize_kline(json_data, response, trusted=self.trusted)
+
+    async def get_server_time(self):
+        """Check Server Time
+
+        GET /openApi/spot/v1/server/time
+
+        Returns:
+            Response[int]: Server time in ms.
+        """
+        response = validate_response(
+            await self._async_query(**MarketCore.get_server_time(self))
+        )
+        json_data = response.json
+        return deserialize.deserialize_server_time(json_data, response)
 
 
 class WebSocketMarket(API):
@@ -240,19 +267,21 @@ class WebSocketMarket(API):
 
         https://bingx-api.github.io/docs/#/en-us/spot/socket/market.html#Subscribe%20Market%20Depth%20Data
 
+        Returns an OrderBook, or an ArrayOrderBook of float levels for instances created with trusted=True.
+
         param:
             symbol (str): the trading pair.
 
             limit (int, optional): Valid are 50.
         """
-        async for response in self._ws_query(
+        async for response in self._ws_buffered(
             **WebSocketMarketCore.get_depth(self, symbol=symbol, limit=limit)
         ):
-            json_data = json.loads(
-                gzip.GzipFile(fileobj=io.BytesIO(response), mode="rb").read().decode()
-            )
+            json_data = json_loads(response)
             if "data" in json_data:
-                yield deserialize.deserialize_depth(json_data, response)
+                yield deserialize.deserialize_depth(
+                    json_data, response, trusted=self.trusted
+                )
 
     async def get_trades(self, symbol: str):
         """Trade Streams
@@ -267,11 +296,9 @@ class WebSocketMarket(API):
         param:
            symbol (str): the trading pair.
         """
-        async for response in self._ws_query(
+        async for response in self._ws_buffered(
             **WebSocketMarketCore.get_trades(self, symbol=symbol)
         ):
-            json_data = json.loads(
-                gzip.GzipFile(fileobj=io.BytesIO(response), mode="rb").read().decode()
-            )
+            json_data = json_loads(response)
             if "data" in json_data:
                 yield deserialize.deserialize_trades_for_ws(json_data, response)
@@ -1,10 +1,69 @@
+import functools
+import json
+
 from .api import API
 from ..core.spot import SpotCore
+from ..urls import URLS
+from ..._batch import (
+    order_fields,
+    group_items,
+    scatter_results,
+    gather_calls,
+    run_calls,
+)
+from ..._response import Response
+from ...errors import ResponseError
 from ...utils import validate_response
 from ..deserialize import spot as deserialize
 from ....types import TimeInForce, Side
 
 
+def _cancel_key(order: dict):
+    """Orders of one symbol cancelled by id share requests, as do those by client id."""
+    return order["symbol"], order.get("orderId") is None
+
+
+def _cancel_params(orders: list[dict], indices: list[int]) -> dict:
+    """Params of cancel_batch_orders for the orders of one group."""
+    group = [orders[i] for i in indices]
+    if group[0].get("orderId") is None:
+        ids = {"clientOrderIDs": ",".join(str(i["clientOrderID"]) for i in group)}
+    else:
+        ids = {"orderIds": ",".join(str(i["orderId"]) for i in group)}
+    return {"symbol": group[0]["symbol"], **ids}
+
+
+def _split_batch(orders: list[dict]):
+    """
+    Split the response of a batch request into a response per order.
+
+    Orders with an orderId are matched by it, the others by position. An order missing
+    from the response gets a ResponseError.
+    """
+
+    def split(result, indices):
+        returned = result.data
+        by_id = {order.orderId: order for order in returned}
+        parts = []
+        for position, index in enumerate(indices):
+            order_id = orders[index].get("orderId")
+            if order_id is not None:
+                order = by_id.get(int(order_id))
+            else:
+                order = returned[position] if position < len(returned) else None
+            if order is None:
+                parts.append(
+                    ResponseError(f"{orders[index]} missing from the batch response")
+                )
+            else:
+                parts.append(
+                    Response(data=order, response_object=result.response_object)
+                )
+        return parts
+
+    return split
+
+
 class Spot(API):
     def get_orders(
         self,
@@ -246,6 +305,128 @@ class Spot(API):
         json_data = response.json()
         return deserialize.deserialize_order(json_data, response)
 
+    def new_batch_orders(self, orders: list[dict], sync: bool = None):
+        """Place Multiple Orders (TRADE)
+
+        Post several orders in one request.
+
+        POST /openApi/spot/v1/trade/batchOrders
+
+        https://bingx-api.github.io/docs/#/en-us/spot/trade-api.html#Place%20multiple%20orders
+
+        params:
+            orders (list[dict]). At most URLS.BATCH_ORDERS_LIMIT orders, keyword arguments of
+                new_limit_order, or of new_market_order for orders without "price".
+
+            sync (bool, optional). Place the orders one after another. Default: False.
+        """
+        data = json.dumps([order_fields(order) for order in orders], default=str)
+        response = validate_response(
+            self._query(**SpotCore.new_batch_orders(self, data=data, sync=sync))
+        )
+        json_data = response.json()
+        return deserialize.deserialize_batch_orders(json_data, response)
+
+    def cancel_batch_orders(
+        self, symbol: str, orderIds: str = None, clientOrderIDs: str = None
+    ):
+        """Cancel Multiple Orders (TRADE)
+
+        Cancel several active orders of a symbol in one request.
+
+        POST /openApi/spot/v1/trade/cancelOrders
+
+        https://bingx-api.github.io/docs/#/en-us/spot/trade-api.html#Cancel%20multiple%20orders
+
+        params:
+            symbol (str).
+
+            orderIds (str, optional). Comma separated order ids.
+
+            clientOrderIDs (str, optional). Comma separated client order ids.
+        """
+        response = validate_response(
+            self._query(
+                **SpotCore.cancel_batch_orders(
+                    self,
+                    symbol=symbol,
+                    orderIds=orderIds,
+                    clientOrderIDs=clientOrderIDs,
+                )
+            )
+        )
+        json_data = response.json()
+        return deserialize.deserialize_batch_orders(json_data, response)
+
+    def new_orders(self, orders: list[dict], concurrency: int = None) -> list:
+        """New Orders (TRADE)
+
+        Post several orders through the native batch endpoint, URLS.BATCH_ORDERS_LIMIT orders
+        per request. Returns the response or the exception of every order, in the order given;
+        a failed request is the exception of each of its orders.
+
+        POST /openApi/spot/v1/trade/batchOrders
+
+        params:
+            orders (list[dict]). Keyword arguments of new_limit_order, or of new_market_order
+                for orders without "price". "side" and "timeInForce" may be strings.
+
+            concurrency (int, optional). Requests in flight at once. Default: the pool size.
+        """
+        groups = group_items(orders, URLS.BATCH_ORDERS_LIMIT)
+        calls = [
+            functools.partial(self.new_batch_orders, [orders[i] for i in indices])
+            for indices in groups
+        ]
+        results = run_calls(self, calls, concurrency)
+        return scatter_results(groups, results, _split_batch(orders))
+
+    def cancel_orders(self, orders: list[dict], concurrency: int = None) -> list:
+        """Cancel Orders (TRADE)
+
+        Cancel several active orders through the native batch endpoint, one request per
+        symbol (split every URLS.CANCEL_BATCH_LIMIT orders). Returns the response or the
+        exception of every cancel, in the order given; a failed request is the exception
+        of each of its orders.
+
+        POST /openApi/spot/v1/trade/cancelOrders
+
+        params:
+            orders (list[dict]). Keyword arguments of cancel_open_order, e.g.
+                {"symbol": "BTCUSDT", "orderId": 1}.
+
+            concurrency (int, optional). Requests in flight at once. Default: the pool size.
+        """
+        groups = group_items(orders, URLS.CANCEL_BATCH_LIMIT, key=_cancel_key)
+        calls = [
+            functools.partial(
+                self.cancel_batch_orders, **_cancel_params(orders, indices)
+            )
+            for indices in groups
+        ]
+        results = run_calls(self, calls, concurrency)
+        return scatter_results(groups, results, _split_batch(orders))
+
+    def cancel_all_open_orders(
+        self, symbols: list[str], concurrency: int = None
+    ) -> list:
+        """Cancel All Open Orders (TRADE)
+
+        Cancel every open order of several symbols concurrently, one request per symbol.
+        Returns the response or the exception of every symbol, in the order given.
+
+        POST /openApi/spot/v1/trade/cancelOpenOrders
+
+        params:
+            symbols (list[str]).
+
+            concurrency (int, optional). Requests in flight at once. Default: the pool size.
+        """
+        calls = [
+            functools.partial(self.cancel_open_orders, symbol) for symbol in symbols
+        ]
+        return run_calls(self, calls, concurrency)
+
 
 class AsyncSpot(API):
     async def get_orders(
@@ -487,3 +668,127 @@ class AsyncSpot(API):
         )
         json_data = response.json
         return deserialize.deserialize_order(json_data, response)
+
+    async def new_batch_orders(self, orders: list[dict], sync: bool = None):
+        """Place Multiple Orders (TRADE)
+
+        Post several orders in one request.
+
+        POST /openApi/spot/v1/trade/batchOrders
+
+        https://bingx-api.github.io/docs/#/en-us/spot/trade-api.html#Place%20multiple%20orders
+
+        params:
+            orders (list[dict]). At most URLS.BATCH_ORDERS_LIMIT orders, keyword arguments of
+                new_limit_order, or of new_market_order for orders without "price".
+
+            sync (bool, optional). Place the orders one after another. Default: False.
+        """
+        data = json.dumps([order_fields(order) for order in orders], default=str)
+        response = validate_response(
+            await self._async_query(
+                **SpotCore.new_batch_orders(self, data=data, sync=sync)
+            )
+        )
+        json_data = response.json
+        return deserialize.deserialize_batch_orders(json_data, response)
+
+    async def cancel_batch_orders(
+        self, symbol: str, orderIds: str = None, clientOrderIDs: str = None
+    ):
+        """Cancel Multiple Orders (TRADE)
+
+        Cancel several active orders of a symbol in one request.
+
+        POST /openApi/spot/v1/trade/cancelOrders
+
+        https://bingx-api.github.io/docs/#/en-us/spot/trade-api.html#Cancel%20multiple%20orders
+
+        params:
+            symbol (str).
+
+            orderIds (str, optional). Comma separated order ids.
+
+            clientOrderIDs (str, optional). Comma separated client order ids.
+        """
+        response = validate_response(
+            await self._async_query(
+                **SpotCore.cancel_batch_orders(
+                    self,
+                    symbol=symbol,
+                    orderIds=orderIds,
+                    clientOrderIDs=clientOrderIDs,
+                )
+            )
+        )
+        json_data = response.json
+        return deserialize.deserialize_batch_orders(json_data, response)
+
+    async def new_orders(self, orders: list[dict], concurrency: int = None) -> list:
+        """New Orders (TRADE)
+
+        Post several orders through the native batch endpoint, URLS.BATCH_ORDERS_LIMIT orders
+        per request. Returns the response or the exception of every order, in the order given;
+        a failed request is the exception of each of its orders.
+
+        POST /openApi/spot/v1/trade/batchOrders
+
+        params:
+            orders (list[dict]). Keyword arguments of new_limit_order, or of new_market_order
+                for orders without "price". "side" and "timeInForce" may be strings.
+
+            concurrency (int, optional). Requests in flight at once. Default: all of them.
+        """
+        groups = group_items(orders, URLS.BATCH_ORDERS_LIMIT)
+        calls = [
+            functools.partial(self.new_batch_orders, [orders[i] for i in indices])
+            for indices in groups
+        ]
+        results = await gather_calls(calls, concurrency)
+        return scatter_results(groups, results, _split_batch(orders))
+
+    async def cancel_orders(self, orders: list[dict], concurrency: int = None) -> list:
+        """Cancel Orders (TRADE)
+
+        Cancel several active orders through the native batch endpoint, one request per
+        symbol (split every URLS.CANCEL_BATCH_LIMIT orders). Returns the response or the
+        exception of every cancel, in the order given; a failed request is the exception
+        of each of its orders.
+
+        POST /openApi/spot/v1/trade/cancelOrders
+
+        params:
+            orders (list[dict]). Keyword arguments of cancel_open_order, e.g.
+                {"symbol": "BTCUSDT", "orderId": 1}.
+
+            concurrency (int, optional). Requests in flight at once. Default: all of them.
+        """
+        groups = group_items(orders, URLS.CANCEL_BATCH_LIMIT, key=_cancel_key)
+        calls = [
+            functools.partial(
+                self.cancel_batch_orders, **_cancel_params(orders, indices)
+            )
+            for indices in groups
+        ]
+        results = await gather_calls(calls, concurrency)
+        return scatter_results(groups, results, _split_batch(orders))
+
+    async def cancel_all_open_orders(
+        self, symbols: list[str], concurrency: int = None
+    ) -> list:
+        """Cancel All Open Orders (TRADE)
+
+        Cancel every open order of several symbols concurrently, one request per symbol.
+        Returns the response or the exception of every symbol, in the order given.
+
+        POST /openApi/spot/v1/trade/cancelOpenOrders
+
+        params:
+            symbols (list[str]).
+
+            concurrency (int, optional). Requests in flight at once. Default: all of them.
+        """
+        calls = [
+            functools.partial(self.cancel_open_orders, symbol) for symbol in symbols
+        ]
+        return await gather_calls(calls, concurrency)
@@ -1,6 +1,6 @@
 from ..api.api import API
 from ..urls import URLS
-from ...utils import replace_param, get_timestamp, check_require_params
+from ...utils import replace_param, check_require_params
 
 
 class AccountCore(API):
@@ -14,7 +14,7 @@ class AccountCore(API):
         params:
             coin (str, optional).
         """
-        params["timestamp"] = get_timestamp()
+        params["timestamp"] = self._timestamp()
         return self.return_args(
             method="GET",
             url=URLS.BASE_URL + URLS.GET_COINS_URL,
@@ -34,6 +34,25 @@ class AccountCore(API):
             params=self.get_payload(params),
         )
 
+    @check_require_params(("listenKey",))
+    def extend_listen_key(self, **params) -> dict:
+        """Extend Listen Key Validity Period
+
+        PUT openApi/user/auth/userDataStream
+
+        The validity period is extended to 60 minutes after this call, it is recommended to send a ping every 30 minutes.
+
+        https://bingx-api.github.io/docs/#/en-us/spot/socket/listenKey.html#extend%20Listen%20Key%20Validity%20period
+
+        params:
+            listenKey (str).
+        """
+        return self.return_args(
+            method="PUT",
+            url=URLS.BASE_URL + URLS.LISTEN_KEY,
+            params=self.get_payload(params),
+        )
+
     def get_balance(self, **params) -> dict:
         """Query Assets
 
@@ -63,7 +82,7 @@ class AccountCore(API):
             offset (int): Starting record number, default is 0.
         """
         replace_param(params, "asset", "coin")
-        params["timestamp"] = get_timestamp()
+        params["timestamp"] = self._timestamp()
         return self.return_args(
             method="GET",
             url=URLS.BASE_URL + URLS.GET_DEPOSIT_ADDRESS_URL,
@@ -98,7 +117,7 @@ class AccountCore(API):
             withdrawOrderId (str, optional): client id for withdraw
         """
         replace_param(params, "asset", "coin")
-        params["timestamp"] = get_timestamp()
+        params["timestamp"] = self._timestamp()
         return self.return_args(
             method="POST",
             url=URLS.BASE_URL + URLS.WITHDRAW_URL,
@@ -126,7 +145,7 @@ class AccountCore(API):
             offset (int, optional): Default: 0.
         """
         replace_param(params, "asset", "coin")
-        params["timestamp"] = get_timestamp()
+        params["timestamp"] = self._timestamp()
         return self.return_args(
             method="GET",
             url=URLS.BASE_URL + URLS.GET_DEPOSIT_HISTORY,
@@ -158,7 +177,7 @@ class AccountCore(API):
             offset (int, optional): Default: 0.
         """
         replace_param(params, "asset", "coin")
-        params["timestamp"] = get_timestamp()
+        params["timestamp"] = self._timestamp()
         return self.return_args(
             method="GET",
             url=URLS.BASE_URL + URLS.GET_WITHDRAW_HISTORY,
@@ -1,6 +1,6 @@
 from ..api.api import API
 from ..urls import URLS
-from ...utils import get_timestamp, check_require_params
+from ...utils import check_require_params
 
 
 class MarketCore(API):
@@ -54,7 +54,7 @@ class MarketCore(API):
         params:
             symbol (str, optional): the trading pair.
         """
-        params["timestamp"] = get_timestamp()
+        params["timestamp"] = self._timestamp()
         return self.return_args(
             method="GET", url=URLS.BASE_URL + URLS.TICKER_URL, params=params
         )
@@ -99,6 +99,15 @@ class MarketCore(API):
             method="GET", url=URLS.BASE_URL + URLS.KLINE_URL, params=params
         )
 
+    def get_server_time(self, **params) -> dict:
+        """Check Server Time
+
+        GET /openApi/spot/v1/server/time
+        """
+        return self.return_args(
+            method="GET", url=URLS.BASE_URL + URLS.SERVER_TIME_URL, params=params
+        )
+
 
 class WebSocketMarketCore(API):
     @check_require_params(("symbol",))
@@ -175,3 +175,51 @@ class SpotCore(API):
             url=URLS.BASE_URL + URLS.CREATE_ORDER_URL,
             params=self.get_payload(params),
         )
+
+    @check_require_params(("data",))
+    def new_batch_orders(self, **params) -> dict:
+        """Place Multiple Orders (TRADE)
+
+        Post several orders in one request.
+
+        POST /openApi/spot/v1/trade/batchOrders
+
+        https://bingx-api.github.io/docs/#/en-us/spot/trade-api.html#Place%20multiple%20orders
+
+        params:
+            data (str): JSON array of orders, each with the params of new_order.
+
+            sync (bool, optional): Place the orders one after another. Default: False.
+        """
+        return self.return_args(
+            method="POST",
+            url=URLS.BASE_URL + URLS.BATCH_ORDERS_URL,
+            params=self.get_payload(params),
+        )
+
+    @check_require_params(("symbol",))
+    def cancel_batch_orders(self, **params) -> dict:
+        """Cancel Multiple Orders (TRADE)
+
+        Cancel several active orders of a symbol in one request.
+
+        POST /openApi/spot/v1/trade/cancelOrders
+
+        https://bingx-api.github.io/docs/#/en-us/spot/trade-api.html#Cancel%20multiple%20orders
+
+        params:
+            symbol (str)
+
+            orderIds (str, optional): Comma separated order ids.
+
+            clientOrderIDs (str, optional): Comma separated client order ids.
+        """
+        if not params.get("orderIds") and not params.get("clientOrderIDs"):
+            raise ValueError(
+                'Param "orderIds" or "clientOrderIDs" must be sent, but both were empty/null!'
+            )
+        return self.return_args(
+            method="POST",
+            url=URLS.BASE_URL + URLS.CANCEL_BATCH_URL,
+            params=self.get_payload(params),
+        )
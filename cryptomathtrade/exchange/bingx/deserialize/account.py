@@ -50,6 +50,12 @@ def deserialize_listen_key(data, response) -> Response[str, object]:
     return Response(data=data["listenKey"], response_object=response)
 
 
+def deserialize_extend_listen_key(data, response) -> Response[bool, object]:
+    if data and data.get("code", 0) != 0:
+        raise ResponseError(data)
+    return Response(data=True, response_object=response)
+
+
 @validate_data
 def deserialize_account_update_for_ws(data, response) -> Response[object, object]:
     return Response(data=data, response_object=response)
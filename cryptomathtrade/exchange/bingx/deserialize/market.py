@@ -1,10 +1,9 @@
 from .utils import validate_data
-from ..._response import Response
+from ..._response import Response, depth_response, trusted_kline
 from ....types import (
     OrderBook,
     Trade,
     Ticker,
-    Order,
     Side,
     Kline,
     Symbol,
@@ -12,16 +11,12 @@ from ....types import (
 
 
 @validate_data
-def deserialize_depth(data, response) -> Response[OrderBook, object]:
+def deserialize_depth(
+    data, response, trusted: bool = False
+) -> Response[OrderBook, object]:
     data = data["data"]
     data["asks"] = data["asks"][::-1]
-    return Response(
-        data=OrderBook(
-            asks=[Order(price=ask[0], volume=ask[1]) for ask in data["asks"]],
-            bids=[Order(price=bid[0], volume=bid[1]) for bid in data["bids"]],
-        ),
-        response_object=response,
-    )
+    return depth_response(data["asks"], data["bids"], response, trusted)
 
 
 @validate_data
@@ -76,8 +71,12 @@ def deserialize_symbols(data, response) -> Response[list[Symbol], object]:
 
 
 @validate_data
-def deserialize_kline(data, response) -> Response[list[Kline], object]:
+def deserialize_kline(
+    data, response, trusted: bool = False
+) -> Response[list[Kline], object]:
     data = data["data"]
+    if trusted:
+        return trusted_kline(data, response, columns=(0, 1, 2, 3, 4, 7))
     return Response(
         data=[
             Kline(
@@ -96,6 +95,11 @@ def deserialize_kline(data, response) -> Response[list[Kline], object]:
     )
 
 
+@validate_data
+def deserialize_server_time(data, response) -> Response[int, object]:
+    return Response(data=data["data"]["serverTime"], response_object=response)
+
+
 @validate_data
 def deserialize_trades_for_ws(data, response) -> Response[list[Trade], object]:
     data = data["data"]
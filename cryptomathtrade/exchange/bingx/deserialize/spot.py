@@ -16,3 +16,12 @@ def deserialize_orders(data, response) -> Response[list[FullOrder], object]:
         data=[FullOrder(**i) for i in data["orders"]] if data["orders"] else [],
         response_object=response,
     )
+
+
+@validate_data
+def deserialize_batch_orders(data, response) -> Response[list[FullOrder], object]:
+    data = data["data"]
+    return Response(
+        data=[FullOrder(**i) for i in data.get("orders") or []],
+        response_object=response,
+    )
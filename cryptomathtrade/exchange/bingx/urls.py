@@ -8,6 +8,7 @@ class URLS:
     TICKER_URL = "/openApi/spot/v1/ticker/24hr"  # https://bingx-api.github.io/docs/#/en-us/spot/market-api.html#24-hour%20price%20changes
     SYMBOLS_URL = "/openApi/spot/v1/common/symbols"  # https://bingx-api.github.io/docs/#/en-us/spot/market-api.html#Query%20Symbols
     KLINE_URL = "/openApi/market/his/v1/kline"  # https://bingx-api.github.io/docs/#/en-us/spot/market-api.html#Historical%20K-line%20data
+    SERVER_TIME_URL = "/openApi/spot/v1/server/time"
 
     # SPOT
     ORDER_URL = "/openApi/spot/v1/trade/query"  # https://bingx-api.github.io/docs/#/en-us/spot/trade-api.html#Query%20Orders
@@ -16,6 +17,10 @@ class URLS:
     GET_ORDERS_URL = "/openApi/spot/v1/trade/historyOrders"  # https://bingx-api.github.io/docs/#/en-us/spot/trade-api.html#Query%20Order%20History
     OPEN_ORDERS_URL = "/openApi/spot/v1/trade/openOrders"  # https://bingx-api.github.io/docs/#/en-us/spot/trade-api.html#Query%20Open%20Orders
     CANCEL_ORDERS_URL = "/openApi/spot/v1/trade/cancelOpenOrders"  # https://bingx-api.github.io/docs/#/en-us/spot/trade-api.html#Cancel%20orders%20by%20symbol
+    BATCH_ORDERS_URL = "/openApi/spot/v1/trade/batchOrders"  # https://bingx-api.github.io/docs/#/en-us/spot/trade-api.html#Place%20multiple%20orders
+    CANCEL_BATCH_URL = "/openApi/spot/v1/trade/cancelOrders"  # https://bingx-api.github.io/docs/#/en-us/spot/trade-api.html#Cancel%20multiple%20orders
+    BATCH_ORDERS_LIMIT = 5  # orders per batchOrders request
+    CANCEL_BATCH_LIMIT = 100  # orders per cancelOrders request
 
     # ACCOUNT
     GET_COINS_URL = "/openApi/wallets/v1/capital/config/getall"  # https://bingx-api.github.io/docs/#/en-us/common/wallet-api.html#All%20Coins'%20Information
@@ -28,3 +33,7 @@ class URLS:
     # WS
     WS_BASE_URL = "wss://open-api-ws.bingx.com/market"  # https://bingx-api.github.io/docs/#/en-us/spot/socket/account.html#Subscription%20order%20update%20data
     LISTEN_KEY = "/openApi/user/auth/userDataStream"  # https://bingx-api.github.io/docs/#/en-us/spot/socket/listenKey.html#generate%20Listen%20Key
+
+    # Rate limits  # https://bingx-api.github.io/docs/#/en-us/spot/base-info.html#Rate%20limit
+    RATE_LIMIT = 100  # requests per RATE_LIMIT_INTERVAL per IP
+    RATE_LIMIT_INTERVAL = 10
@@ -12,6 +12,8 @@ class Market(API):
 
         https://www.bitget.com/api-doc/spot/market/Get-Orderbook
 
+        Returns an OrderBook, or an ArrayOrderBook of float levels for instances created with trusted=True.
+
         params:
             symbol (str): the trading pair
 
@@ -27,7 +29,7 @@ class Market(API):
             )
         )
         json_data = response.json()
-        return deserialize.deserialize_depth(json_data, response)
+        return deserialize.deserialize_depth(json_data, response, trusted=self.trusted)
 
     def get_trades(self, symbol: str, limit: int = 100):
         """Recent Trades List
@@ -121,7 +123,7 @@ class Market(API):
             )
         )
         json_data = response.json()
-        return deserialize.deserialize_kline(json_data, response)
+        return deserialize.deserialize_kline(json_data, response, trusted=self.trusted)
 
 
 class AsyncMarket(API):
@@ -132,6 +134,8 @@ class AsyncMarket(API):
 
         https://www.bitget.com/api-doc/spot/market/Get-Orderbook
 
+        Returns an OrderBook, or an ArrayOrderBook of float levels for instances created with trusted=True.
+
         params:
             symbol (str): the trading pair
 
@@ -147,7 +151,7 @@ class AsyncMarket(API):
             )
         )
         json_data = response.json
-        return deserialize.deserialize_depth(json_data, response)
+        return deserialize.deserialize_depth(json_data, response, trusted=self.trusted)
 
     async def get_trades(self, symbol: str, limit: int = 100):
         """Recent Trades List
@@ -243,7 +247,7 @@ class AsyncMarket(API):
             )
         )
         json_data = response.json
-        return deserialize.deserialize_kline(json_data, response)
+        return deserialize.deserialize_kline(json_data, response, trusted=self.trusted)
 
 
 # TODO:  WebSocketMarket
@@ -14,3 +14,7 @@ class URLS:
 
     # WS
     WS_BASE_URL = "wss://ws.bitget.com/v2/ws/public"  # https://www.bitget.com/api-doc/spot/websocket/public/Depth-Channel
+
+    # Rate limits  # https://www.bitget.com/api-doc/common/intro
+    RATE_LIMIT = 20  # requests per RATE_LIMIT_INTERVAL per IP
+    RATE_LIMIT_INTERVAL = 1
@@ -1,11 +1,21 @@
 import asyncio
 
+from ..urls import URLS
 from ..._api import BaseAPI
+from ..._decompress import Decompressor, DEFLATE
+from ..._rate_limit import RateLimiter
 from ..._request import WebSocketRequest
 
 
 class API(BaseAPI):
-    def __init__(self, api_key=None, api_secret=None, headers=None):
+    exchange = "bitmart"
+    rate_limiter = RateLimiter(
+        URLS.RATE_LIMIT,
+        URLS.RATE_LIMIT_INTERVAL,
+        weights=URLS.WEIGHTS,
+    )
+
+    def __init__(self, api_key=None, api_secret=None, headers=None, **kwargs):
         """
         params:
             api_key (str): API key for authentication.
@@ -13,8 +23,11 @@ class API(BaseAPI):
             api_secret (str): API secret for authentication.
 
             headers (dict): Additional headers for API requests.
+
+            kwargs: BaseAPI options (pool_size, dns_cache_ttl, keepalive_timeout, trusted,
+                ws_buffer_size, ws_overflow, recorder, ws_source, clock).
         """
-        super().__init__()
+        super().__init__(**kwargs)
         self.api_key = api_key
         self.api_secret = api_secret
         self.headers = {"X-BM-KEY": self.api_key} if self.api_key else {}
@@ -41,7 +54,10 @@ class API(BaseAPI):
             timeout_seconds (int): Timeout duration for the WebSocket connection.
 
             headers (dict): Additional headers for the request.
+
+        The compressed endpoint sends raw deflate binary frames; they are inflated once here.
         """
+        decompress = Decompressor(DEFLATE)
         payload = {
             "op": method,
             "args": params,
@@ -54,4 +70,4 @@ class API(BaseAPI):
                 data = await asyncio.wait_for(client.recv(), timeout=timeout_seconds)
                 if not data:
                     raise ConnectionError  # custom error
-                yield data
+                yield decompress(data)
@@ -12,6 +12,8 @@ class Market(API):
 
         https://developer-pro.bitmart.com/en/spot/#get-depth-v3
 
+        Returns an OrderBook, or an ArrayOrderBook of float levels for instances created with trusted=True.
+
         params:
             symbol (str): the trading pair.
 
@@ -23,7 +25,7 @@ class Market(API):
             )
         )
         json_data = response.json()
-        return deserialize.deserialize_depth(json_data, response)
+        return deserialize.deserialize_depth(json_data, response, trusted=self.trusted)
 
     def get_trades(self, symbol: str, limit: int = 50):
         """Recent Trades List
@@ -114,7 +116,7 @@ class Market(API):
             )
         )
         json_data = response.json()
-        return deserialize.deserialize_kline(json_data, response)
+        return deserialize.deserialize_kline(json_data, response, trusted=self.trusted)
 
 
 class AsyncMarket(API):
@@ -125,6 +127,8 @@ class AsyncMarket(API):
 
         https://developer-pro.bitmart.com/en/spot/#get-depth-v3
 
+        Returns an OrderBook, or an ArrayOrderBook of float levels for instances created with trusted=True.
+
         params:
             symbol (str): the trading pair.
 
@@ -136,7 +140,7 @@ class AsyncMarket(API):
             )
         )
         json_data = response.json
-        return deserialize.deserialize_depth(json_data, response)
+        return deserialize.deserialize_depth(json_data, response, trusted=self.trusted)
 
     async def get_trades(self, symbol: str, limit: int = 50):
         """Recent Trades List
@@ -231,7 +235,7 @@ class AsyncMarket(API):
             )
         )
         json_data = response.json
-        return deserialize.deserialize_kline(json_data, response)
+        return deserialize.deserialize_kline(json_data, response, trusted=self.trusted)
 
 
 # TODO: WebSocketMarket
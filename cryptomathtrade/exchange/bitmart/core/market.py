@@ -84,8 +84,11 @@ class MarketCore(Core):
             endTime (int, optional): Unit: ms.
         """
         replace_param(params, "interval", "step")
-        replace_param(params, "startTime", "before")
-        replace_param(params, "endTime", "after")
+        for param in ("startTime", "endTime"):
+            if params.get(param) is not None:
+                params[param] = int(params[param]) // 1000  # the API takes seconds
+        replace_param(params, "startTime", "after")
+        replace_param(params, "endTime", "before")
         return self.return_args(
             method="GET", url=URLS.BASE_URL + URLS.KLINE_URL, params=params
         )
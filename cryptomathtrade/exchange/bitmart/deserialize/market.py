@@ -2,20 +2,16 @@ import time
 
 from .utils import validate_data
 from ...errors import ResponseError
-from ..._response import Response
-from ....types import OrderBook, Trade, Ticker, Order, Side, Symbol, Kline
+from ..._response import Response, depth_response, trusted_kline
+from ....types import OrderBook, Trade, Ticker, Side, Symbol, Kline
 
 
 @validate_data
-def deserialize_depth(data, response) -> Response[OrderBook, object]:
+def deserialize_depth(
+    data, response, trusted: bool = False
+) -> Response[OrderBook, object]:
     data = data["data"]
-    return Response(
-        data=OrderBook(
-            asks=[Order(price=ask[0], volume=ask[1]) for ask in data["asks"]],
-            bids=[Order(price=bid[0], volume=bid[1]) for bid in data["bids"]],
-        ),
-        response_object=response,
-    )
+    return depth_response(data["asks"], data["bids"], response, trusted)
 
 
 @validate_data
@@ -91,8 +87,12 @@ def deserialize_symbols(data, response) -> Response[list[Symbol], object]:
 
 
 @validate_data
-def deserialize_kline(data, response) -> Response[list[Kline], object]:
+def deserialize_kline(
+    data, response, trusted: bool = False
+) -> Response[list[Kline], object]:
     data = data["data"]
+    if trusted:
+        return trusted_kline(data, response, time_unit=1000)
     return Response(
         data=[
             Kline(
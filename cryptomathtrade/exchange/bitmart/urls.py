@@ -12,3 +12,15 @@ class URLS:
 
     # WS
     WS_BASE_URL = "wss://ws-manager-compress.bitmart.com/api?protocol=1.1"
+
+    # Rate limits  # https://developer-pro.bitmart.com/en/spot/#rate-limit
+    RATE_LIMIT = 30  # 15 requests / 2 s of most market endpoints
+    RATE_LIMIT_INTERVAL = 2
+    WEIGHTS = {
+        DEPTH_URL: 2,  # 15 / 2 s
+        TRADES_URL: 2,  # 15 / 2 s
+        TICKER_URL: 2,  # 15 / 2 s
+        TICKERS_URL: 3,  # 10 / 2 s
+        SYMBOLS_URL: 3,  # 12 / 2 s
+        KLINE_URL: 2,  # 15 / 2 s
+    }
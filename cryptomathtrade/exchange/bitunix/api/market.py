@@ -12,6 +12,8 @@ class Market(API):
 
         https://www.bitunix.com/api-docs/spots/en_us/public/#2-get-depth-data
 
+        Returns an OrderBook, or an ArrayOrderBook of float levels for instances created with trusted=True.
+
         param:
             symbol (str): the trading pair
         """
@@ -19,7 +21,7 @@ class Market(API):
             self._query(**MarketCore(headers=self.headers).get_depth(symbol=symbol))
         )
         json_data = response.json()
-        return deserialize.deserialize_depth(json_data, response)
+        return deserialize.deserialize_depth(json_data, response, trusted=self.trusted)
 
 
 class AsyncMarket(API):
@@ -30,6 +32,8 @@ class AsyncMarket(API):
 
         https://www.bitunix.com/api-docs/spots/en_us/public/#2-get-depth-data
 
+        Returns an OrderBook, or an ArrayOrderBook of float levels for instances created with trusted=True.
+
         param:
             symbol (str): the trading pair
         """
@@ -39,4 +43,4 @@ class AsyncMarket(API):
             )
         )
         json_data = response.json
-        return deserialize.deserialize_depth(json_data, response)
+        return deserialize.deserialize_depth(json_data, response, trusted=self.trusted)
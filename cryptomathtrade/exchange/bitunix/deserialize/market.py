@@ -1,19 +1,13 @@
-from ..._response import Response
+from ..._response import Response, depth_response
 from .utils import validate_data
-from ....types import OrderBook, Order, Ticker
+from ....types import OrderBook, Ticker
 
 
 @validate_data
-def deserialize_depth(data, response) -> Response[OrderBook, object]:
+def deserialize_depth(
+    data, response, trusted: bool = False
+) -> Response[OrderBook, object]:
     data = data["data"]
-    return Response(
-        data=OrderBook(
-            asks=[
-                Order(price=ask["price"], volume=ask["volume"]) for ask in data["asks"]
-            ],
-            bids=[
-                Order(price=bid["price"], volume=bid["volume"]) for bid in data["bids"]
-            ],
-        ),
-        response_object=response,
+    return depth_response(
+        data["asks"], data["bids"], response, trusted, price="price", volume="volume"
     )
@@ -1,4 +1,5 @@
 from ..._api import BaseAPI
 
 
-class API(BaseAPI): ...
+class API(BaseAPI):
+    exchange = "bybit"
@@ -12,6 +12,8 @@ class Market(API):
 
         https://bybit-exchange.github.io/docs/v5/market/orderbook
 
+        Returns an OrderBook, or an ArrayOrderBook of float levels for instances created with trusted=True.
+
         params:
             symbol (str): the trading pair.
 
@@ -21,7 +23,7 @@ class Market(API):
             self._query(**MarketCore.get_depth(self, symbol=symbol, limit=limit))
         )
         json_data = response.json()
-        return deserialize.deserialize_depth(json_data, response)
+        return deserialize.deserialize_depth(json_data, response, trusted=self.trusted)
 
 
 class AsyncMarket(API):
@@ -32,6 +34,8 @@ class AsyncMarket(API):
 
         https://bybit-exchange.github.io/docs/v5/market/orderbook
 
+        Returns an OrderBook, or an ArrayOrderBook of float levels for instances created with trusted=True.
+
         params:
             symbol (str): the trading pair.
 
@@ -43,4 +47,4 @@ class AsyncMarket(API):
             )
         )
         json_data = response.json
-        return deserialize.deserialize_depth(json_data, response)
+        return deserialize.deserialize_depth(json_data, response, trusted=self.trusted)
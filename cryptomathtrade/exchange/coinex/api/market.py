@@ -12,6 +12,8 @@ class Market(API):
 
         https://docs.coinex.com/api/v2/spot/market/http/list-market-depth
 
+        Returns an OrderBook, or an ArrayOrderBook of float levels for instances created with trusted=True.
+
         param:
             symbol (str): the trading pair
 
@@ -25,7 +27,7 @@ class Market(API):
             )
         )
         json_data = response.json()
-        return deserialize.deserialize_depth(json_data, response)
+        return deserialize.deserialize_depth(json_data, response, trusted=self.trusted)
 
 
 class AsyncMarket(API):
@@ -36,6 +38,8 @@ class AsyncMarket(API):
 
         https://docs.coinex.com/api/v2/spot/market/http/list-market-depth
 
+        Returns an OrderBook, or an ArrayOrderBook of float levels for instances created with trusted=True.
+
         param:
             symbol (str): the trading pair
 
@@ -49,4 +53,4 @@ class AsyncMarket(API):
             )
         )
         json_data = response.json
-        return deserialize.deserialize_depth(json_data, response)
+        return deserialize.deserialize_depth(json_data, response, trusted=self.trusted)
@@ -12,6 +12,8 @@ class Market(API):
 
         https://www.coinw.com/api-doc/en/spot-trading/market/get-order-book
 
+        Returns an OrderBook, or an ArrayOrderBook of float levels for instances created with trusted=True.
+
         param:
             symbol (str): the trading pair
 
@@ -23,7 +25,7 @@ class Market(API):
             )
         )
         json_data = response.json()
-        return deserialize.deserialize_depth(json_data, response)
+        return deserialize.deserialize_depth(json_data, response, trusted=self.trusted)
 
 
 class AsyncMarket(API):
@@ -34,6 +36,8 @@ class AsyncMarket(API):
 
         https://www.coinw.com/api-doc/en/spot-trading/market/get-order-book
 
+        Returns an OrderBook, or an ArrayOrderBook of float levels for instances created with trusted=True.
+
         param:
             symbol (str): the trading pair
 
@@ -45,4 +49,4 @@ class AsyncMarket(API):
             )
         )
         json_data = response.json
-        return deserialize.deserialize_depth(json_data, response)
+        return deserialize.deserialize_depth(json_data, response, trusted=self.trusted)
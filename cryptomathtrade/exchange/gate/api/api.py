@@ -1,10 +1,10 @@
 import asyncio
-import hashlib
-import hmac
-import time
 
+from ..urls import URLS
 from ..._api import BaseAPI
+from ..._rate_limit import RateLimiter
 from ..._request import WebSocketRequest
+from ..._signer import EMPTY_SHA512
 from ...utils import (
     check_api_keys,
     _prepare_params,
@@ -12,7 +12,11 @@ from ...utils import (
 
 
 class API(BaseAPI):
-    def __init__(self, api_key=None, api_secret=None, headers=None):
+    exchange = "gate"
+    rate_limiter = RateLimiter(URLS.RATE_LIMIT, URLS.RATE_LIMIT_INTERVAL)
+    sign_digest = "sha512"
+
+    def __init__(self, api_key=None, api_secret=None, headers=None, **kwargs):
         """
         params:
             api_key (str): API key for authentication.
@@ -20,8 +24,11 @@ class API(BaseAPI):
             api_secret (str): API secret for authentication.
 
             headers (dict): Additional headers for API requests.
+
+            kwargs: BaseAPI options (pool_size, dns_cache_ttl, keepalive_timeout, trusted,
+                ws_buffer_size, ws_overflow, recorder, ws_source, clock).
         """
-        super().__init__()
+        super().__init__(**kwargs)
         self.api_key = api_key
         self.api_secret = api_secret
         self.headers = {"KEY": self.api_key} if self.api_key else {}
@@ -65,10 +72,7 @@ class API(BaseAPI):
                 yield data
 
     def _get_sign(self, message: str):
-        sign = hmac.new(
-            self.api_secret.encode("utf-8"), message.encode("utf-8"), hashlib.sha512
-        ).hexdigest()
-        return sign
+        return self.signer.hexdigest(message)
 
     @check_api_keys
     def get_payload(self, path: str, method: str, payload: dict = None):
@@ -83,10 +87,8 @@ class API(BaseAPI):
             payload = _prepare_params(payload)
         else:
             payload = ""
-        t = time.time()
-        m = hashlib.sha512()
-        hashed_payload = m.hexdigest()
-        message = "%s\n%s\n%s\n%s\n%s" % (method, path, payload, hashed_payload, t)
+        t = self._timestamp() / 1000
+        message = "%s\n%s\n%s\n%s\n%s" % (method, path, payload, EMPTY_SHA512, t)
         return {
             "KEY": self.api_key,
             "Timestamp": str(t),
@@ -12,6 +12,8 @@ class Market(API):
 
         https://www.gate.io/docs/developers/apiv4/en/#retrieve-order-book
 
+        Returns an OrderBook, or an ArrayOrderBook of float levels for instances created with trusted=True.
+
         params:
             symbol (str): the trading pair.
 
@@ -23,7 +25,7 @@ class Market(API):
             )
         )
         json_data = response.json()
-        return deserialize.deserialize_depth(json_data, response)
+        return deserialize.deserialize_depth(json_data, response, trusted=self.trusted)
 
     def get_trades(self, symbol: str, limit: int = 100):
         """Recent Trades List
@@ -112,7 +114,7 @@ class Market(API):
             )
         )
         json_data = response.json()
-        return deserialize.deserialize_kline(json_data, response)
+        return deserialize.deserialize_kline(json_data, response, trusted=self.trusted)
 
 
 class AsyncMarket(API):
@@ -123,6 +125,8 @@ class AsyncMarket(API):
 
         https://www.gate.io/docs/developers/apiv4/en/#retrieve-order-book
 
+        Returns an OrderBook, or an ArrayOrderBook of float levels for instances created with trusted=True.
+
         params:
             symbol (str): the trading pair.
 
@@ -134,7 +138,7 @@ class AsyncMarket(API):
             )
         )
         json_data = response.json
-        return deserialize.deserialize_depth(json_data, response)
+        return deserialize.deserialize_depth(json_data, response, trusted=self.trusted)
 
     async def get_trades(self, symbol: str, limit: int = 100):
         """Recent Trades List
@@ -226,8 +230,8 @@ class AsyncMarket(API):
                 )
             )
         )
-        json_data = response.json()
-        return deserialize.deserialize_kline(json_data, response)
+        json_data = response.json
+        return deserialize.deserialize_kline(json_data, response, trusted=self.trusted)
 
 
 # TODO: WebSocketMarket
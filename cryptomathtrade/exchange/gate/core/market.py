@@ -86,6 +86,11 @@ class MarketCore(API):
 
             endTime (int, optional): Unit: ms.
         """
+        for param in ("startTime", "endTime"):
+            if params.get(param) is not None:
+                params[param] = int(params[param]) // 1000  # the API takes seconds
+        if params.get("startTime") is not None or params.get("endTime") is not None:
+            params.pop("limit", None)  # limit is rejected together with from / to
         replace_param(params, "symbol", "currency_pair")
         replace_param(params, "startTime", "from")
         replace_param(params, "endTime", "to")
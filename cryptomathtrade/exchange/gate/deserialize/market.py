@@ -1,19 +1,15 @@
 import time
 
 from .utils import validate_data
-from ..._response import Response
-from ....types import OrderBook, Order, Trade, Side, Ticker, Symbol, Kline
+from ..._response import Response, depth_response, trusted_kline
+from ....types import OrderBook, Trade, Side, Ticker, Symbol, Kline
 
 
 @validate_data
-def deserialize_depth(data, response) -> Response[OrderBook, object]:
-    return Response(
-        data=OrderBook(
-            asks=[Order(price=ask[0], volume=ask[1]) for ask in data["asks"]],
-            bids=[Order(price=bid[0], volume=bid[1]) for bid in data["bids"]],
-        ),
-        response_object=response,
-    )
+def deserialize_depth(
+    data, response, trusted: bool = False
+) -> Response[OrderBook, object]:
+    return depth_response(data["asks"], data["bids"], response, trusted)
 
 
 @validate_data
@@ -75,7 +71,11 @@ def deserialize_symbols(data, response) -> Response[list[Symbol], object]:
 
 
 @validate_data
-def deserialize_kline(data, response) -> Response[list[Kline], object]:
+def deserialize_kline(
+    data, response, trusted: bool = False
+) -> Response[list[Kline], object]:
+    if trusted:
+        return trusted_kline(data, response, columns=(0, 5, 3, 4, 2, 6), time_unit=1000)
     return Response(
         data=[
             Kline(
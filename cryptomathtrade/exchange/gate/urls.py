@@ -14,3 +14,7 @@ class URLS:
 
     # WS
     WS_BASE_URL = 'wss://api.gateio.ws/ws/v4/'
+
+    # Rate limits  # https://www.gate.io/docs/developers/apiv4/en/#frequency-limit-rule
+    RATE_LIMIT = 200  # public requests per RATE_LIMIT_INTERVAL per IP
+    RATE_LIMIT_INTERVAL = 10
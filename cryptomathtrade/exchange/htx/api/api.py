@@ -1,12 +1,18 @@
 import asyncio
-import gzip
 import json
 
+from ..urls import URLS
 from ..._api import BaseAPI
+from ..._decompress import Decompressor, GZIP
+from ..._json import json_loads
+from ..._rate_limit import RateLimiter
 from ..._request import WebSocketRequest
 
 
 class API(BaseAPI):
+    exchange = "htx"
+    rate_limiter = RateLimiter(URLS.RATE_LIMIT, URLS.RATE_LIMIT_INTERVAL)
+
     @classmethod
     async def _ws_query(
         cls,
@@ -27,7 +33,10 @@ class API(BaseAPI):
             timeout_seconds (int): Timeout duration for the WebSocket connection.
 
             headers (dict): Additional headers for the request.
+
+        Frames are gunzipped once; pings are answered here and only data frames are yielded.
         """
+        decompress = Decompressor(GZIP)
         payload = {
             "method": method,
             "sub": params,
@@ -40,7 +49,10 @@ class API(BaseAPI):
                 data = await asyncio.wait_for(client.recv(), timeout=timeout_seconds)
                 if not data:
                     raise ConnectionError  # custom error
-                json_data = json.loads(gzip.decompress(data))
-                if "ping" in json_data:
-                    await client.send("pong")
+                data = decompress(data)
+                if isinstance(data, str):
+                    data = data.encode()  # text frames pass through the decompressor
+                if data.startswith(b'{"ping"'):
+                    await client.send(json.dumps({"pong": json_loads(data)["ping"]}))
+                    continue
                 yield data
@@ -17,3 +17,7 @@ class URLS:
 
     # WS
     WS_BASE_URL = "wss://api.huobi.pro/ws"
+
+    # Rate limits  # https://huobiapi.github.io/docs/spot/v1/en/#rate-limiting-rule
+    RATE_LIMIT = 100  # market requests per RATE_LIMIT_INTERVAL per IP
+    RATE_LIMIT_INTERVAL = 10
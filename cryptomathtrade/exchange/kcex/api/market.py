@@ -10,6 +10,8 @@ class Market(API):
 
         GET /spot/api/spot/market/depth
 
+        Returns an OrderBook, or an ArrayOrderBook of float levels for instances created with trusted=True.
+
         param:
             symbol (str): the trading pair
         """
@@ -17,7 +19,7 @@ class Market(API):
             self._query(**MarketCore(headers=self.headers).get_depth(symbol=symbol))
         )
         json_data = response.json()
-        return deserialize.deserialize_depth(json_data, response)
+        return deserialize.deserialize_depth(json_data, response, trusted=self.trusted)
 
 
 class AsyncMarket(API):
@@ -26,6 +28,8 @@ class AsyncMarket(API):
 
         GET /spot/api/spot/market/depth
 
+        Returns an OrderBook, or an ArrayOrderBook of float levels for instances created with trusted=True.
+
         param:
             symbol (str): the trading pair
         """
@@ -35,4 +39,4 @@ class AsyncMarket(API):
             )
         )
         json_data = response.json
-        return deserialize.deserialize_depth(json_data, response)
+        return deserialize.deserialize_depth(json_data, response, trusted=self.trusted)
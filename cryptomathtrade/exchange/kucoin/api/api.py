@@ -1,15 +1,21 @@
 import asyncio
-import base64
-import hashlib
-import hmac
 
+from ..urls import URLS
 from ..._api import BaseAPI
+from ..._rate_limit import RateLimiter
 from ..._request import WebSocketRequest
-from ...utils import check_api_keys, get_timestamp
+from ...utils import check_api_keys
 
 
 class API(BaseAPI):
-    def __init__(self, api_key=None, api_secret=None, passphrase=None, headers=None):
+    exchange = "kucoin"
+    rate_limiter = RateLimiter(
+        URLS.RATE_LIMIT,
+        URLS.RATE_LIMIT_INTERVAL,
+        weights=URLS.WEIGHTS,
+    )
+
+    def __init__(self, api_key=None, api_secret=None, passphrase=None, headers=None, **kwargs):
         """
         params:
             api_key (str): API key for authentication.
@@ -17,8 +23,11 @@ class API(BaseAPI):
             api_secret (str): API secret for authentication.
 
             headers (dict): Additional headers for API requests.
+
+            kwargs: BaseAPI options (pool_size, dns_cache_ttl, keepalive_timeout, trusted,
+                ws_buffer_size, ws_overflow, recorder, ws_source, clock).
         """
-        super().__init__()
+        super().__init__(**kwargs)
         self.api_key = api_key
         self.api_secret = api_secret
         self.passphrase = passphrase
@@ -86,25 +95,12 @@ class API(BaseAPI):
         Returns:
             dict: Payload with timestamp and signature.
         """
-        t = str(get_timestamp())
+        t = str(self._timestamp())
         str_to_sign = t + method.upper() + path
         if payload:
             str_to_sign += self.parse_params_to_str(payload)
-        signature = base64.b64encode(
-            hmac.new(
-                self.api_secret.encode("utf-8"),
-                str_to_sign.encode("utf-8"),
-                hashlib.sha256,
-            ).digest()
-        )
-
-        passphrase = base64.b64encode(
-            hmac.new(
-                self.api_secret.encode("utf-8"),
-                self.passphrase.encode("utf-8"),
-                hashlib.sha256,
-            ).digest()
-        )
+        signature = self.signer.b64digest(str_to_sign)
+        passphrase = self.signer.constant_b64digest(self.passphrase)
         return {
             "KC-API-SIGN": signature,
             "KC-API-TIMESTAMP": t,
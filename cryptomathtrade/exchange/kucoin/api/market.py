@@ -12,6 +12,8 @@ class Market(API):
 
         https://www.kucoin.com/docs/rest/spot-trading/market-data/get-part-order-book-aggregated-
 
+        Returns an OrderBook, or an ArrayOrderBook of float levels for instances created with trusted=True.
+
         param:
             symbol (str): the trading pair
         """
@@ -19,7 +21,7 @@ class Market(API):
             self._query(**MarketCore(headers=self.headers).get_depth(symbol=symbol))
         )
         json_data = response.json()
-        return deserialize.deserialize_depth(json_data, response)
+        return deserialize.deserialize_depth(json_data, response, trusted=self.trusted)
 
     def get_trades(self, symbol: str):
         """Recent Trades List
@@ -101,7 +103,7 @@ class Market(API):
             )
         )
         json_data = response.json()
-        return deserialize.deserialize_kline(json_data, response)
+        return deserialize.deserialize_kline(json_data, response, trusted=self.trusted)
 
 
 class AsyncMarket(API):
@@ -112,6 +114,8 @@ class AsyncMarket(API):
 
         https://www.kucoin.com/docs/rest/spot-trading/market-data/get-part-order-book-aggregated-
 
+        Returns an OrderBook, or an ArrayOrderBook of float levels for instances created with trusted=True.
+
         param:
             symbol (str): the trading pair
         """
@@ -121,7 +125,7 @@ class AsyncMarket(API):
             )
         )
         json_data = response.json
-        return deserialize.deserialize_depth(json_data, response)
+        return deserialize.deserialize_depth(json_data, response, trusted=self.trusted)
 
     async def get_trades(self, symbol: str):
         """Recent Trades List
@@ -209,7 +213,7 @@ class AsyncMarket(API):
             )
         )
         json_data = response.json
-        return deserialize.deserialize_kline(json_data, response)
+        return deserialize.deserialize_kline(json_data, response, trusted=self.trusted)
 
 
 # TODO: WebSocketMarket
@@ -78,6 +78,9 @@ class MarketCore(API):
 
             endTime (int, optional): Unit: ms.
         """
+        for param in ("startTime", "endTime"):
+            if params.get(param) is not None:
+                params[param] = int(params[param]) // 1000  # the API takes seconds
         replace_param(params, "interval", "type")
         replace_param(params, "startTime", "startAt")
         replace_param(params, "endTime", "endAt")
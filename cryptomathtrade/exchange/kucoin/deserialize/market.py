@@ -1,20 +1,16 @@
 import time
 
 from .utils import validate_data
-from ..._response import Response
-from ....types import OrderBook, Trade, Ticker, Order, Side, Symbol, Kline
+from ..._response import Response, depth_response, trusted_kline
+from ....types import OrderBook, Trade, Ticker, Side, Symbol, Kline
 
 
 @validate_data
-def deserialize_depth(data, response) -> Response[OrderBook, object]:
+def deserialize_depth(
+    data, response, trusted: bool = False
+) -> Response[OrderBook, object]:
     data = data["data"]
-    return Response(
-        data=OrderBook(
-            asks=[Order(price=ask[0], volume=ask[1]) for ask in data["asks"]],
-            bids=[Order(price=bid[0], volume=bid[1]) for bid in data["bids"]],
-        ),
-        response_object=response,
-    )
+    return depth_response(data["asks"], data["bids"], response, trusted)
 
 
 @validate_data
@@ -101,8 +97,12 @@ def deserialize_symbols(data, response) -> Response[list[Symbol], object]:
 
 
 @validate_data
-def deserialize_kline(data, response) -> Response[list[Kline], object]:
+def deserialize_kline(
+    data, response, trusted: bool = False
+) -> Response[list[Kline], object]:
     data = data["data"]
+    if trusted:
+        return trusted_kline(data, response, columns=(0, 1, 3, 4, 2, 5), time_unit=1000)
     return Response(
         data=[
             Kline(
@@ -15,3 +15,16 @@ class URLS:
 
     # WS
     WS_BASE_URL = "wss://ws-api-spot.kucoin.com/"
+
+    # Rate limits  # https://www.kucoin.com/docs/basic-info/request-rate-limit/rest-api
+    RATE_LIMIT = 2000  # public resource pool weight per RATE_LIMIT_INTERVAL per IP
+    RATE_LIMIT_INTERVAL = 30
+    WEIGHTS = {
+        DEPTH_URL: 2,
+        TRADES_URL: 3,
+        TICKER_URL: 15,
+        TICKERS_URL: 15,
+        SYMBOLS_URL: 4,
+        KLINE_URL: 3,
+        COINS_URL: 3,
+    }
@@ -12,6 +12,8 @@ class Market(API):
 
         https://www.lbank.com/docs/index.html#depth-information
 
+        Returns an OrderBook, or an ArrayOrderBook of float levels for instances created with trusted=True.
+
         param:
             symbol (str): the trading pair
 
@@ -23,7 +25,7 @@ class Market(API):
             )
         )
         json_data = response.json()
-        return deserialize.deserialize_depth(json_data, response)
+        return deserialize.deserialize_depth(json_data, response, trusted=self.trusted)
 
     def get_ticker(self, symbol: str = None):
         """24hr Ticker Price Change Statistics
@@ -50,6 +52,8 @@ class AsyncMarket(API):
 
         https://www.lbank.com/docs/index.html#depth-information
 
+        Returns an OrderBook, or an ArrayOrderBook of float levels for instances created with trusted=True.
+
         param:
             symbol (str): the trading pair
 
@@ -61,7 +65,7 @@ class AsyncMarket(API):
             )
         )
         json_data = response.json
-        return deserialize.deserialize_depth(json_data, response)
+        return deserialize.deserialize_depth(json_data, response, trusted=self.trusted)
 
     async def get_ticker(self, symbol: str = None):
         """24hr Ticker Price Change Statistics
@@ -1,17 +1,13 @@
-from ..._response import Response
+from ..._response import Response, depth_response, trusted_kline
 from .utils import validate_data
-from ....types import OrderBook, Trade, Order, Ticker, Side, Symbol, Kline
+from ....types import OrderBook, Trade, Ticker, Side, Symbol, Kline
 
 
 @validate_data
-def deserialize_depth(data, response) -> Response[OrderBook, object]:
-    return Response(
-        data=OrderBook(
-            asks=[Order(price=ask[0], volume=ask[1]) for ask in data["asks"]],
-            bids=[Order(price=bid[0], volume=bid[1]) for bid in data["bids"]],
-        ),
-        response_object=response,
-    )
+def deserialize_depth(
+    data, response, trusted: bool = False
+) -> Response[OrderBook, object]:
+    return depth_response(data["asks"], data["bids"], response, trusted)
 
 
 @validate_data
@@ -42,25 +38,28 @@ def deserialize_ticker(data, response) -> Response[list[Ticker], object]:
 
 @validate_data
 def deserialize_symbols(data, response) -> Response[list[Symbol], object]:
-    data = data["data"]
-    return Response(
-        data=[
+    symbols = []
+    for i in data["data"]:
+        first_coin, _, second_coin = i["symbol"].partition("_")
+        symbols.append(
             Symbol(
-                symbol=i.get("symbol"),
-                firstCoin=i.get("symbol").split("_")[0],
-                secondCoin=i.get("symbol").split("_")[1],
+                symbol=i["symbol"],
+                firstCoin=first_coin,
+                secondCoin=second_coin,
                 minQty=i.get("min_amount"),
                 maxQty=i.get("max_amount"),
                 status=i.get("state"),
             )
-            for i in data
-        ],
-        response_object=response,
-    )
+        )
+    return Response(data=symbols, response_object=response)
 
 
 @validate_data
-def deserialize_kline(data, response) -> Response[list[Kline], object]:
+def deserialize_kline(
+    data, response, trusted: bool = False
+) -> Response[list[Kline], object]:
+    if trusted:
+        return trusted_kline(data, response)
     return Response(
         data=[
             Kline(
@@ -79,13 +78,9 @@ def deserialize_kline(data, response) -> Response[list[Kline], object]:
 
 
 @validate_data
-def deserialize_depth_for_ws(data, response):
-    return Response(
-        data=OrderBook(
-            asks=[Order(price=ask["p"], volume=ask["v"]) for ask in data["asks"]],
-            bids=[Order(price=bid["p"], volume=bid["v"]) for bid in data["bids"]],
-        ),
-        response_object=response,
+def deserialize_depth_for_ws(data, response, trusted: bool = False):
+    return depth_response(
+        data["asks"], data["bids"], response, trusted, price="p", volume="v"
     )
 
 
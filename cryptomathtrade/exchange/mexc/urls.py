@@ -17,3 +17,14 @@ class URLS:
 
     # WS
     WS_BASE_URL = "wss://wbs.mexc.com/ws"
+
+    # Rate limits  # https://mexcdevelop.github.io/apidocs/spot_v3_en/#limits
+    RATE_LIMIT = 500  # weight per RATE_LIMIT_INTERVAL per IP
+    RATE_LIMIT_INTERVAL = 10
+    WEIGHTS = {
+        DEPTH_URL: 1,
+        TRADES_URL: 5,
+        TICKER_URL: lambda params: 1 if params.get("symbol") else 40,
+        KLINE_URL: 1,
+        COINS_URL: 10,
+    }
@@ -1,15 +1,22 @@
 import asyncio
-import base64
 import datetime
-import hmac
 
+from ..urls import URLS
 from ..._api import BaseAPI
+from ..._rate_limit import RateLimiter
 from ..._request import WebSocketRequest
 from ...utils import check_api_keys
 
 
 class API(BaseAPI):
-    def __init__(self, api_key=None, api_secret=None, passphrase=None, headers=None):
+    exchange = "okx"
+    rate_limiter = RateLimiter(
+        URLS.RATE_LIMIT,
+        URLS.RATE_LIMIT_INTERVAL,
+        weights=URLS.WEIGHTS,
+    )
+
+    def __init__(self, api_key=None, api_secret=None, passphrase=None, headers=None, **kwargs):
         """
         params:
             api_key (str): API key for authentication.
@@ -17,8 +24,11 @@ class API(BaseAPI):
             api_secret (str): API secret for authentication.
 
             headers (dict): Additional headers for API requests.
+
+            kwargs: BaseAPI options (pool_size, dns_cache_ttl, keepalive_timeout, trusted,
+                ws_buffer_size, ws_overflow, recorder, ws_source, clock).
         """
-        super().__init__()
+        super().__init__(**kwargs)
         self.api_key = api_key
         self.api_secret = api_secret
         self.passphrase = passphrase
@@ -66,13 +76,7 @@ class API(BaseAPI):
         return str(timestamp) + str.upper(method) + request_path + body
 
     def _get_sign(self, message: str):
-        mac = hmac.new(
-            bytes(self.api_secret, encoding="utf8"),
-            bytes(message, encoding="utf-8"),
-            digestmod="sha256",
-        )
-        d = mac.digest()
-        return base64.b64encode(d)
+        return self.signer.b64digest(message)
 
     @check_api_keys
     def get_payload(self, path: str, method: str, payload: dict = None):
@@ -85,7 +89,9 @@ class API(BaseAPI):
         """
         if payload is None:
             payload = {}
-        now = datetime.datetime.utcnow()
+        now = datetime.datetime.fromtimestamp(
+            self._timestamp() / 1000, datetime.timezone.utc
+        ).replace(tzinfo=None)
         t = now.isoformat("T", "milliseconds")
         timestamp = t + "Z"
         sign = self._get_sign(self.pre_hash(timestamp, method, path, ""))
@@ -12,6 +12,8 @@ class Market(API):
 
         https://www.okx.com/docs-v5/en/#order-book-trading-market-data-get-order-book
 
+        Returns an OrderBook, or an ArrayOrderBook of float levels for instances created with trusted=True.
+
         param:
             symbol (str): the trading pair
 
@@ -23,7 +25,7 @@ class Market(API):
             )
         )
         json_data = response.json()
-        return deserialize.deserialize_depth(json_data, response)
+        return deserialize.deserialize_depth(json_data, response, trusted=self.trusted)
 
     def get_trades(self, symbol: str, limit: int = 100):
         """Recent Trades List
@@ -121,7 +123,21 @@ class Market(API):
             )
         )
         json_data = response.json()
-        return deserialize.deserialize_kline(json_data, response)
+        return deserialize.deserialize_kline(json_data, response, trusted=self.trusted)
+
+    def get_server_time(self):
+        """Check Server Time
+
+        GET /api/v5/public/time
+
+        https://www.okx.com/docs-v5/en/#public-data-rest-api-get-system-time
+
+        Returns:
+            Response[int]: Server time in ms.
+        """
+        response = validate_response(self._query(**MarketCore.get_server_time(self)))
+        json_data = response.json()
+        return deserialize.deserialize_server_time(json_data, response)
 
 
 class AsyncMarket(API):
@@ -132,6 +148,8 @@ class AsyncMarket(API):
 
         https://www.okx.com/docs-v5/en/#order-book-trading-market-data-get-order-book
 
+        Returns an OrderBook, or an ArrayOrderBook of float levels for instances created with trusted=True.
+
         param:
             symbol (str): the trading pair
 
@@ -143,7 +161,7 @@ class AsyncMarket(API):
             )
         )
         json_data = response.json
-        return deserialize.deserialize_depth(json_data, response)
+        return deserialize.deserialize_depth(json_data, response, trusted=self.trusted)
 
     async def get_trades(self, symbol: str, limit: int = 100):
         """Recent Trades List
@@ -243,7 +261,23 @@ class AsyncMarket(API):
             )
         )
         json_data = response.json
-        return deserialize.deserialize_kline(json_data, response)
+        return deserialize.deserialize_kline(json_data, response, trusted=self.trusted)
+
+    async def get_server_time(self):
+        """Check Server Time
+
+        GET /api/v5/public/time
+
+        https://www.okx.com/docs-v5/en/#public-data-rest-api-get-system-time
+
+        Returns:
+            Response[int]: Server time in ms.
+        """
+        response = validate_response(
+            await self._async_query(**MarketCore.get_server_time(self))
+        )
+        json_data = response.json
+        return deserialize.deserialize_server_time(json_data, response)
 
 
 # TODO: WebSocketMarket
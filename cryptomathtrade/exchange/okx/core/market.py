@@ -98,13 +98,25 @@ class MarketCore(API):
             endTime (int, optional): Unit: ms.
         """
         replace_param(params, "symbol", "instId")
-        replace_param(params, "startTime", "after")
-        replace_param(params, "endTime", "before")
+        # "before" returns records newer than the timestamp, "after" records older than it
+        replace_param(params, "startTime", "before")
+        replace_param(params, "endTime", "after")
         replace_param(params, "interval", "bar")
         return self.return_args(
             method="GET", url=URLS.BASE_URL + URLS.KLINE_URL, params=params
         )
 
+    def get_server_time(self, **params) -> dict:
+        """Check Server Time
+
+        GET /api/v5/public/time
+
+        https://www.okx.com/docs-v5/en/#public-data-rest-api-get-system-time
+        """
+        return self.return_args(
+            method="GET", url=URLS.BASE_URL + URLS.SERVER_TIME_URL, params=params
+        )
+
 
 # TODO: WebSocketMarketCore
 
@@ -1,20 +1,16 @@
 import time
 
-from ..._response import Response
+from ..._response import Response, depth_response, trusted_kline
 from .utils import validate_data
-from ....types import OrderBook, Trade, Order, Ticker, Side, Symbol, Kline
+from ....types import OrderBook, Trade, Ticker, Side, Symbol, Kline
 
 
 @validate_data
-def deserialize_depth(data, response) -> Response[OrderBook, object]:
+def deserialize_depth(
+    data, response, trusted: bool = False
+) -> Response[OrderBook, object]:
     data = data["data"][0]
-    return Response(
-        data=OrderBook(
-            asks=[Order(price=ask[0], volume=ask[1]) for ask in data["asks"]],
-            bids=[Order(price=bid[0], volume=bid[1]) for bid in data["bids"]],
-        ),
-        response_object=response,
-    )
+    return depth_response(data["asks"], data["bids"], response, trusted)
 
 
 @validate_data
@@ -77,8 +73,12 @@ def deserialize_symbols(data, response) -> Response[list[Symbol], object]:
 
 
 @validate_data
-def deserialize_kline(data, response) -> Response[list[Kline], object]:
+def deserialize_kline(
+    data, response, trusted: bool = False
+) -> Response[list[Kline], object]:
     data = data["data"]
+    if trusted:
+        return trusted_kline(data, response)
     return Response(
         data=[
             Kline(
@@ -94,3 +94,8 @@ def deserialize_kline(data, response) -> Response[list[Kline], object]:
         ],
         response_object=response,
     )
+
+
+@validate_data
+def deserialize_server_time(data, response) -> Response[int, object]:
+    return Response(data=int(data["data"][0]["ts"]), response_object=response)
@@ -9,9 +9,24 @@ class URLS:
     TICKERS_URL = '/api/v5/market/tickers'  # https://www.okx.com/docs-v5/en/#order-book-trading-market-data-get-tickers
     SYMBOLS_URL = '/api/v5/public/instruments'  # https://www.okx.com/docs-v5/en/#public-data-rest-api-get-instruments
     KLINE_URL = '/api/v5/market/history-candles'  # https://www.okx.com/docs-v5/en/#order-book-trading-market-data-get-candlesticks-history
+    SERVER_TIME_URL = '/api/v5/public/time'  # https://www.okx.com/docs-v5/en/#public-data-rest-api-get-system-time
 
     # Account
     GET_BALANCE = '/api/v5/account/balance'
 
     # WS
     WS_BASE_URL = 'wss://wspap.okx.com:8443/ws/v5/public?brokerId=9999'
+
+    # Rate limits  # https://www.okx.com/docs-v5/en/#overview-rate-limits
+    # OKX limits each endpoint separately; weights scale them into one 40 requests / 2 s window
+    RATE_LIMIT = 40
+    RATE_LIMIT_INTERVAL = 2
+    WEIGHTS = {
+        DEPTH_URL: 1,  # 40 / 2 s
+        TRADES_URL: 1,  # 100 / 2 s
+        TICKER_URL: 2,  # 20 / 2 s
+        TICKERS_URL: 2,  # 20 / 2 s
+        SYMBOLS_URL: 2,  # 20 / 2 s
+        KLINE_URL: 2,  # 20 / 2 s
+        SERVER_TIME_URL: 4,  # 10 / 2 s
+    }
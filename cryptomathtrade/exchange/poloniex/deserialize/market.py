@@ -1,10 +1,12 @@
-from ..._response import Response
+from ..._response import Response, depth_response
 from .utils import validate_data
-from ....types import OrderBook, Order, Ticker
+from ....types import OrderBook, Ticker
 
 
 @validate_data
-def deserialize_depth(data, response) -> Response[OrderBook, object]:
+def deserialize_depth(
+    data, response, trusted: bool = False
+) -> Response[OrderBook, object]:
     def chunk_pairs(arr):
         return [(arr[i], arr[i + 1]) for i in range(0, len(arr), 2)]
 
@@ -12,10 +14,4 @@ def deserialize_depth(data, response) -> Response[OrderBook, object]:
     asks = chunk_pairs(data["asks"])
     bids = chunk_pairs(data["bids"])
 
-    return Response(
-        data=OrderBook(
-            asks=[Order(price=ask[0], volume=ask[1]) for ask in asks],
-            bids=[Order(price=bid[0], volume=bid[1]) for bid in bids],
-        ),
-        response_object=response,
-    )
+    return depth_response(asks, bids, response, trusted)
@@ -1,14 +1,10 @@
-from ..._response import Response
+from ..._response import Response, depth_response
 from .utils import validate_data
-from ....types import OrderBook, Order, Ticker
+from ....types import OrderBook, Ticker
 
 
 @validate_data
-def deserialize_depth(data, response) -> Response[OrderBook, object]:
-    return Response(
-        data=OrderBook(
-            asks=[Order(price=ask[0], volume=ask[1]) for ask in data["a"]],
-            bids=[Order(price=bid[0], volume=bid[1]) for bid in data["b"]],
-        ),
-        response_object=response,
-    )
+def deserialize_depth(
+    data, response, trusted: bool = False
+) -> Response[OrderBook, object]:
+    return depth_response(data["a"], data["b"], response, trusted)
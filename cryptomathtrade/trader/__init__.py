@@ -1,3 +1,5 @@
 from .trade import trade_by_volume, trade_by_amount
-from .calculate import convert_price_in_order, convert_price_in_order_list, calculate_spread
+from .calculate import convert_price_in_order, convert_price_in_order_list, calculate_spread, calculate_spread_arrays
 from .utils import check_fee, get_spread
+from .matrix import ArbitrageMatrix
+from .depth import DepthIndex
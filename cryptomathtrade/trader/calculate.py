@@ -1,3 +1,4 @@
+from array import array
 from decimal import Decimal
 
 from .utils import check_fee, get_spread
@@ -51,6 +52,8 @@ def calculate_spread(asks: list[Order],
     Calculates arbitrage deals based on the provided ask and bid orders,
     taking into account the ask and bid fees.
 
+    Both lists are walked once, best level first, and are not modified.
+
     Args:
         asks (list[Order]): The list of ask orders.
         bids (list[Order]): The list of bid orders.
@@ -64,38 +67,88 @@ def calculate_spread(asks: list[Order],
         the arbitrage deals calculated.
     """
     asks_fee, bids_fee = check_fee(asks_fee), check_fee(bids_fee)
+    ask_factor, bid_factor = Decimal(1) + asks_fee, Decimal(1) - bids_fee
 
     deals = []
+    i = j = 0
+    ask_volume = asks[0].volume if asks else 0
+    bid_volume = bids[0].volume if bids else 0
 
-    while min(len(asks), len(bids)) > 0:
-        ask = asks[0]
-        bid = bids[0]
-
-        adjusted_ask_price = ask.price * (Decimal(1) + asks_fee)
-        adjusted_bid_price = bid.price * (Decimal(1) - bids_fee)
+    while i < len(asks) and j < len(bids):
+        ask = asks[i]
+        bid = bids[j]
 
-        spread = get_spread(adjusted_ask_price, adjusted_bid_price)
+        spread = get_spread(ask.price * ask_factor, bid.price * bid_factor)
 
         if spread <= 0:
             break
 
-        difference_in_volume = bid.volume - ask.volume
-        if difference_in_volume < 0:
-            ask.volume = difference_in_volume * -1
-            bids.pop(0)
-        elif difference_in_volume == 0:
-            bids.pop(0)
-            asks.pop(0)
-        else:
-            bid.volume = difference_in_volume
-            asks.pop(0)
-        volume = min(ask.volume, bid.volume)
-        deals.append(ArbitrageDeal(
-            price_buy=ask.price,
-            price_sell=bid.price,
-            volume=volume,
-            fee_buy=asks_fee,
-            fee_sell=bids_fee
-        ))
+        volume = min(ask_volume, bid_volume)
+        if volume > 0:
+            deals.append(ArbitrageDeal.model_construct(
+                price_buy=ask.price,
+                price_sell=bid.price,
+                volume=volume,
+                fee_buy=asks_fee,
+                fee_sell=bids_fee,
+                spread=spread,
+            ))
+
+        ask_volume -= volume
+        bid_volume -= volume
+        if ask_volume <= 0:
+            i += 1
+            ask_volume = asks[i].volume if i < len(asks) else 0
+        if bid_volume <= 0:
+            j += 1
+            bid_volume = bids[j].volume if j < len(bids) else 0
 
     return deals
+
+
+def calculate_spread_arrays(asks,
+                            bids,
+                            asks_fee: Decimal | float,
+                            bids_fee: Decimal | float) -> tuple[array, array, array, array]:
+    """
+    Float counterpart of calculate_spread for deep books, without a model object per deal.
+
+    Args:
+        asks: Ask levels as (price, volume) pairs, best first, e.g. ArrayOrderBook.asks.
+        bids: Bid levels as (price, volume) pairs, best first, e.g. ArrayOrderBook.bids.
+        asks_fee (Decimal | float): The fee percentage for ask orders.
+        bids_fee (Decimal | float): The fee percentage for bid orders.
+
+    Returns:
+        tuple[array, array, array, array]: Parallel arrays of buy price, sell price,
+        volume and spread, one item per matched pair of levels.
+    """
+    ask_factor = 1 + float(check_fee(asks_fee))
+    bid_factor = 1 - float(check_fee(bids_fee))
+
+    prices_buy, prices_sell, volumes, spreads = array('d'), array('d'), array('d'), array('d')
+    asks, bids = iter(asks), iter(bids)
+    ask_price, ask_volume = next(asks, (0.0, 0.0))
+    bid_price, bid_volume = next(bids, (0.0, 0.0))
+
+    while ask_volume > 0 and bid_volume > 0:
+        adjusted_bid_price = bid_price * bid_factor
+        spread = (adjusted_bid_price - ask_price * ask_factor) / adjusted_bid_price
+
+        if spread <= 0:
+            break
+
+        volume = min(ask_volume, bid_volume)
+        prices_buy.append(ask_price)
+        prices_sell.append(bid_price)
+        volumes.append(volume)
+        spreads.append(spread)
+
+        ask_volume -= volume
+        bid_volume -= volume
+        if ask_volume <= 0:
+            ask_price, ask_volume = next(asks, (0.0, 0.0))
+        if bid_volume <= 0:
+            bid_price, bid_volume = next(bids, (0.0, 0.0))
+
+    return prices_buy, prices_sell, volumes, spreads
@@ -0,0 +1,99 @@
+from array import array
+from bisect import bisect_left
+from decimal import Decimal
+
+from ..types import Order, DepthFill
+
+
+class DepthIndex:
+    """
+    Cumulative volume and amount index over one side of an order book.
+
+    Built once per book snapshot in O(n); every fill query is then a binary search,
+    so many sizing questions can be asked against the same snapshot cheaply.
+
+    Args:
+        levels: (price, volume) pairs, best level first, e.g. ArrayOrderBook.asks
+            or [(order.price, order.volume) for order in order_book.asks].
+    """
+
+    def __init__(self, levels):
+        self.prices = array('d')
+        self.cumulative_volume = array('d')
+        self.cumulative_amount = array('d')
+        volume_total = amount_total = 0.0
+        for price, volume in levels:
+            price, volume = float(price), float(volume)
+            volume_total += volume
+            amount_total += price * volume
+            self.prices.append(price)
+            self.cumulative_volume.append(volume_total)
+            self.cumulative_amount.append(amount_total)
+
+    @classmethod
+    def from_orders(cls, orders: list[Order]) -> 'DepthIndex':
+        return cls((order.price, order.volume) for order in orders)
+
+    def __len__(self):
+        return len(self.prices)
+
+    @property
+    def total_volume(self) -> float:
+        return self.cumulative_volume[-1] if self.prices else 0.0
+
+    @property
+    def total_amount(self) -> float:
+        return self.cumulative_amount[-1] if self.prices else 0.0
+
+    def _fill(self, index: int, volume: float, amount: float, complete: bool) -> DepthFill:
+        if volume <= 0:
+            return DepthFill.model_construct(volume=0.0, amount=0.0, price=None, worst_price=None, complete=complete)
+        return DepthFill.model_construct(
+            volume=volume,
+            amount=amount,
+            price=amount / volume,
+            worst_price=self.prices[index],
+            complete=complete,
+        )
+
+    def fill_volume(self, volume: Decimal | float) -> DepthFill:
+        """
+        Fill a target volume of the asset.
+
+        Args:
+            volume (Decimal | float): The target volume to buy (asks) or sell (bids).
+
+        Returns:
+            DepthFill: Filled volume, amount, average and worst price.
+        """
+        volume = float(volume)
+        if volume <= 0 or not self.prices:
+            return self._fill(0, 0.0, 0.0, volume <= 0)
+        index = bisect_left(self.cumulative_volume, volume)
+        if index == len(self.prices):
+            return self._fill(index - 1, self.total_volume, self.total_amount, False)
+        previous_volume = self.cumulative_volume[index - 1] if index else 0.0
+        previous_amount = self.cumulative_amount[index - 1] if index else 0.0
+        amount = previous_amount + (volume - previous_volume) * self.prices[index]
+        return self._fill(index, volume, amount, True)
+
+    def fill_amount(self, amount: Decimal | float) -> DepthFill:
+        """
+        Fill a target amount to spend (asks) or receive (bids).
+
+        Args:
+            amount (Decimal | float): The target amount.
+
+        Returns:
+            DepthFill: Filled volume, amount, average and worst price.
+        """
+        amount = float(amount)
+        if amount <= 0 or not self.prices:
+            return self._fill(0, 0.0, 0.0, amount <= 0)
+        index = bisect_left(self.cumulative_amount, amount)
+        if index == len(self.prices):
+            return self._fill(index - 1, self.total_volume, self.total_amount, False)
+        previous_volume = self.cumulative_volume[index - 1] if index else 0.0
+        previous_amount = self.cumulative_amount[index - 1] if index else 0.0
+        volume = previous_volume + (amount - previous_amount) / self.prices[index]
+        return self._fill(index, volume, amount, True)
@@ -0,0 +1,99 @@
+from decimal import Decimal
+
+from .calculate import calculate_spread_arrays
+from .utils import check_fee
+from ..types import ArrayOrderBook, OrderBook, ArbitrageOpportunity
+
+
+class ArbitrageMatrix:
+    """
+    Buy-here / sell-there opportunities of one symbol across N exchanges.
+
+    Books are registered with update(); only the row and column of exchanges whose book changed
+    since the last read are recomputed, and a pair is matched level by level only when the best
+    ask of the buying exchange is below the best bid of the selling exchange after fees.
+
+    Usage:
+        matrix = ArbitrageMatrix(fees={'binance': 0.001, 'bingx': 0.001})
+        matrix.update('binance', binance_book)
+        matrix.update('bingx', bingx_book)
+        best = matrix.opportunities()[0]
+
+    Args:
+        fees (dict, optional): Exchange name -> fee in decimal form (0.001 for 0.1%).
+        default_fee (Decimal | float, optional): Fee of exchanges missing from `fees`.
+    """
+
+    def __init__(self, fees: dict = None, default_fee: Decimal | float = 0):
+        self.fees = {name: float(check_fee(fee)) for name, fee in (fees or {}).items()}
+        self.default_fee = float(check_fee(default_fee))
+        self.books: dict[str, ArrayOrderBook] = {}
+        self._matrix: dict[tuple[str, str], ArbitrageOpportunity] = {}
+        self._dirty: set[str] = set()
+
+    def update(self, exchange: str, book: OrderBook | ArrayOrderBook):
+        """
+        Register the current book of an exchange.
+
+        An ArrayOrderBook is kept by reference: call update() again after changing it in place.
+        """
+        if isinstance(book, OrderBook):
+            book = ArrayOrderBook.from_order_book(book)
+        self.books[exchange] = book
+        self._dirty.add(exchange)
+
+    def remove(self, exchange: str):
+        self.books.pop(exchange, None)
+        self._dirty.discard(exchange)
+        for pair in [pair for pair in self._matrix if exchange in pair]:
+            del self._matrix[pair]
+
+    def get_fee(self, exchange: str) -> float:
+        return self.fees.get(exchange, self.default_fee)
+
+    def refresh(self):
+        """Recompute the pairs involving exchanges updated since the last refresh."""
+        if not self._dirty:
+            return
+        for buy in self.books:
+            for sell in self.books:
+                if buy != sell and (buy in self._dirty or sell in self._dirty):
+                    self._compute(buy, sell)
+        self._dirty.clear()
+
+    def _compute(self, buy: str, sell: str):
+        asks, bids = self.books[buy].asks, self.books[sell].bids
+        buy_fee, sell_fee = self.get_fee(buy), self.get_fee(sell)
+        best_ask, best_bid = asks.best(), bids.best()
+        if (
+            best_ask is None
+            or best_bid is None
+            or best_ask[0] * (1 + buy_fee) >= best_bid[0] * (1 - sell_fee)
+        ):
+            self._matrix.pop((buy, sell), None)
+            return
+
+        prices_buy, prices_sell, volumes, _ = calculate_spread_arrays(asks, bids, buy_fee, sell_fee)
+        cost = sum(price * volume for price, volume in zip(prices_buy, volumes)) * (1 + buy_fee)
+        revenue = sum(price * volume for price, volume in zip(prices_sell, volumes)) * (1 - sell_fee)
+        self._matrix[(buy, sell)] = ArbitrageOpportunity.model_construct(
+            buy_exchange=buy,
+            sell_exchange=sell,
+            volume=sum(volumes),
+            cost=cost,
+            revenue=revenue,
+            profit=revenue - cost,
+            spread=(revenue - cost) / revenue,
+            price_buy=prices_buy[-1],
+            price_sell=prices_sell[-1],
+        )
+
+    def get(self, buy_exchange: str, sell_exchange: str) -> ArbitrageOpportunity | None:
+        """Opportunity of buying on `buy_exchange` and selling on `sell_exchange`, None if unprofitable."""
+        self.refresh()
+        return self._matrix.get((buy_exchange, sell_exchange))
+
+    def opportunities(self) -> list[ArbitrageOpportunity]:
+        """All profitable pairs, most profitable first."""
+        self.refresh()
+        return sorted(self._matrix.values(), key=lambda opportunity: opportunity.profit, reverse=True)
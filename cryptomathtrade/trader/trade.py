@@ -27,6 +27,7 @@ def trade_by_amount(orders: list[Order], amount: Decimal | float) -> Deals:
 
         if order_value <= amount:
             deals.deals.append(Deal(price=order.price, volume=order.volume))
+            amount -= order_value
         else:
             remaining_volume = amount / order.price
             deals.deals.append(Deal(price=order.price, volume=remaining_volume))
@@ -1,6 +1,6 @@
-from .deal import Deal, Deals
-from .order import Order, FullOrder, OrderBook, TimeInForce, Side
-from .arbitrage import ArbitrageDeal
+from .deal import Deal, Deals, DepthFill
+from .order import Order, FullOrder, OrderBook, OrderBookUpdate, TimeInForce, Side
+from .arbitrage import ArbitrageDeal, ArbitrageOpportunity
 from .trade import Trade
 from .ticker import Ticker
 from .account import (
@@ -12,5 +12,8 @@ from .account import (
     Withdraw,
     Network,
 )
-from .kline import Kline
+from .kline import Kline, KlineFrame
 from .symbol import Symbol
+from .book import ArrayOrderBook, BookSide, LevelsView
+from .depth import DepthSnapshot
+from .stream import StreamGap
@@ -45,3 +45,37 @@ class ArbitrageDeal(BaseModel):
             ask=self.price_buy * (Decimal(1) + self.fee_buy),
             bid=self.price_sell * (Decimal(1) - self.fee_sell)
         )
+
+
+class ArbitrageOpportunity(BaseModel):
+    """
+    Model representing the whole executable buy-on-one-exchange, sell-on-another opportunity.
+
+    params:
+        buy_exchange (str): Exchange where the asset is bought (its asks are taken).
+
+        sell_exchange (str): Exchange where the asset is sold (its bids are taken).
+
+        volume (float): Maximum executable volume while every matched level is still profitable.
+
+        cost (float): Quote spent on buying `volume`, fee included.
+
+        revenue (float): Quote received for selling `volume`, fee deducted.
+
+        profit (float): revenue - cost.
+
+        spread (float): Volume-weighted spread, profit / revenue, in the same form as ArbitrageDeal.spread.
+
+        price_buy (float): Worst (highest) buy price used.
+
+        price_sell (float): Worst (lowest) sell price used.
+    """
+    buy_exchange: str
+    sell_exchange: str
+    volume: float
+    cost: float
+    revenue: float
+    profit: float
+    spread: float
+    price_buy: float
+    price_sell: float
@@ -0,0 +1,207 @@
+from array import array
+from bisect import bisect_left
+from decimal import Decimal
+
+from .order import Order, OrderBook
+
+
+class LevelsView:
+    """
+    Read-only view of the best `n` levels of a BookSide, best level first.
+
+    Nothing is copied: items are read from the live arrays, so the view reflects later updates.
+    """
+    __slots__ = ('side', 'n')
+
+    def __init__(self, side: 'BookSide', n: int = None):
+        self.side = side
+        self.n = n
+
+    def __len__(self):
+        length = len(self.side)
+        return length if self.n is None else min(self.n, length)
+
+    def __getitem__(self, index: int) -> tuple[float, float]:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('level index out of range')
+        return self.side[index]
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self.side[index]
+
+    def prices(self) -> list[float]:
+        return [price for price, _ in self]
+
+    def volumes(self) -> list[float]:
+        return [volume for _, volume in self]
+
+
+class BookSide:
+    """
+    One side of an order book stored as parallel arrays sorted by price.
+
+    Price lookups are binary searches, O(log n). Inserting or removing a level shifts the tail
+    of the arrays: O(n) bytes moved by a single memmove, which for books of a few thousand
+    levels is cheaper than the pointer chasing of a tree. Indexing is by rank: side[0] is
+    always the best level.
+
+    Volumes are float64, exact for up to 15 significant digits; to_orders() returns the
+    shortest decimal of each float, not necessarily the string the exchange sent. Prices are
+    float64 too unless `tick_size` is given: they are then stored as integer ticks, so equal
+    prices always compare equal and to_orders() returns them as exact Decimal.
+
+    params:
+        descending (bool): True for bids (best level is the highest price), False for asks.
+
+        tick_size (str | Decimal, optional): Price step of the symbol, e.g. "0.01".
+    """
+    __slots__ = ('prices', 'volumes', 'descending', 'tick_size', '_tick')
+
+    def __init__(self, descending: bool = False, tick_size=None):
+        self.descending = descending
+        self.tick_size = None if tick_size is None else Decimal(str(tick_size))
+        self._tick = None if tick_size is None else float(self.tick_size)
+        self.prices = array('d') if tick_size is None else array('q')  # float prices or integer ticks
+        self.volumes = array('d')
+
+    def _key(self, price) -> float | int:
+        """Stored form of a price: float, or the nearest integer tick."""
+        if self._tick is None:
+            return float(price)
+        return round(float(price) / self._tick)
+
+    def _price(self, key: float | int) -> float:
+        return key if self._tick is None else float(self.tick_size * key)
+
+    def __len__(self):
+        return len(self.prices)
+
+    def __getitem__(self, rank: int) -> tuple[float, float]:
+        index = -1 - rank if self.descending else rank
+        return self._price(self.prices[index]), self.volumes[index]
+
+    def __iter__(self):
+        return iter(LevelsView(self))
+
+    def load(self, levels):
+        """
+        Replace all levels.
+
+        params:
+            levels (Iterable): [price, volume, ...] levels; strings, Decimal or float. Zero volumes are skipped.
+        """
+        pairs = sorted((self._key(level[0]), float(level[1])) for level in levels)
+        self.prices = array(self.prices.typecode, [price for price, volume in pairs if volume])
+        self.volumes = array('d', [volume for price, volume in pairs if volume])
+
+    def update(self, price, volume):
+        """Set the volume of one price level, removing the level when volume is zero."""
+        price, volume = self._key(price), float(volume)
+        prices = self.prices
+        index = bisect_left(prices, price)
+        if index < len(prices) and prices[index] == price:
+            if volume:
+                self.volumes[index] = volume
+            else:
+                del prices[index]
+                del self.volumes[index]
+        elif volume:
+            prices.insert(index, price)
+            self.volumes.insert(index, volume)
+
+    def get(self, price) -> float:
+        """Volume at `price`, 0 if the level is empty."""
+        price = self._key(price)
+        index = bisect_left(self.prices, price)
+        if index < len(self.prices) and self.prices[index] == price:
+            return self.volumes[index]
+        return 0.0
+
+    def best(self) -> tuple[float, float] | None:
+        return self[0] if self.prices else None
+
+    def top(self, n: int = None) -> LevelsView:
+        return LevelsView(self, n)
+
+    def to_orders(self, limit: int = None) -> list[Order]:
+        length = len(self.prices) if limit is None else min(limit, len(self.prices))
+        orders = []
+        for rank in range(length):
+            index = -1 - rank if self.descending else rank
+            key, volume = self.prices[index], self.volumes[index]
+            price = Decimal(repr(key)) if self._tick is None else self.tick_size * key
+            orders.append(Order(price=price, volume=Decimal(repr(volume))))
+        return orders
+
+
+class ArrayOrderBook:
+    """
+    Compact order book for high-rate maintenance, convertible to the OrderBook model.
+
+    See BookSide for the update cost and the precision of float levels; pass `tick_size`
+    for exact prices.
+
+    params:
+        asks (BookSide): Sell levels, best (lowest) price first by rank.
+
+        bids (BookSide): Buy levels, best (highest) price first by rank.
+
+        last_update_id (int): Exchange sequence number of the book, when provided.
+
+        tick_size (str | Decimal, optional): Price step of the symbol; prices are then stored as integer ticks.
+    """
+    __slots__ = ('asks', 'bids', 'last_update_id')
+
+    def __init__(self, tick_size=None):
+        self.asks = BookSide(tick_size=tick_size)
+        self.bids = BookSide(descending=True, tick_size=tick_size)
+        self.last_update_id = None
+
+    @classmethod
+    def from_levels(cls, asks, bids, last_update_id: int = None, tick_size=None) -> 'ArrayOrderBook':
+        """
+        Build a book straight from exchange level lists, e.g. [["0.1", "2.5"], ...].
+
+        Items after the volume in a level (order count, etc.) are ignored.
+        """
+        book = cls(tick_size)
+        book.asks.load(asks)
+        book.bids.load(bids)
+        book.last_update_id = last_update_id
+        return book
+
+    @classmethod
+    def from_order_book(cls, order_book: OrderBook, tick_size=None) -> 'ArrayOrderBook':
+        return cls.from_levels(
+            ((order.price, order.volume) for order in order_book.asks),
+            ((order.price, order.volume) for order in order_book.bids),
+            order_book.lastUpdateId,
+            tick_size,
+        )
+
+    def update(self, asks=(), bids=(), last_update_id: int = None):
+        """Apply changed (price, volume) levels; zero volume removes the level."""
+        for price, volume in asks:
+            self.asks.update(price, volume)
+        for price, volume in bids:
+            self.bids.update(price, volume)
+        if last_update_id is not None:
+            self.last_update_id = last_update_id
+
+    @property
+    def best_ask(self) -> tuple[float, float] | None:
+        return self.asks.best()
+
+    @property
+    def best_bid(self) -> tuple[float, float] | None:
+        return self.bids.best()
+
+    def to_order_book(self, limit: int = None) -> OrderBook:
+        return OrderBook(
+            asks=self.asks.to_orders(limit),
+            bids=self.bids.to_orders(limit),
+            lastUpdateId=self.last_update_id,
+        )
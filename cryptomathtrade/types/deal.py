@@ -22,3 +22,25 @@ class Deals(BaseModel):
         deals (list[Deal]): A list of Deal objects, each representing an individual deal.
     """
     deals: list[Deal] = []
+
+
+class DepthFill(BaseModel):
+    """
+    Model representing the result of filling a target volume or amount against one side of an order book.
+
+    params:
+        volume (float): The filled volume of the asset.
+
+        amount (float): The quote amount spent (asks) or received (bids).
+
+        price (float): The volume-weighted average price, None if nothing was filled.
+
+        worst_price (float): The price of the last level touched, None if nothing was filled.
+
+        complete (bool): False if the book was not deep enough to fill the whole target.
+    """
+    volume: float
+    amount: float
+    price: float | None = None
+    worst_price: float | None = None
+    complete: bool
@@ -0,0 +1,27 @@
+from pydantic import BaseModel
+
+from .book import ArrayOrderBook
+from .order import OrderBook
+
+
+class DepthSnapshot(BaseModel, arbitrary_types_allowed=True):
+    """
+    Model representing the outcome of an order book request to one exchange.
+
+    params:
+        exchange (str): Name of the exchange.
+
+        symbol (str): The trading pair as sent to the exchange.
+
+        data (OrderBook | ArrayOrderBook): The order book (ArrayOrderBook from trusted markets),
+            None if the request failed or timed out.
+
+        latency (float): Seconds between sending the request and receiving the result or error.
+
+        error (Exception): The raised exception (asyncio.TimeoutError on deadline), None on success.
+    """
+    exchange: str
+    symbol: str
+    data: OrderBook | ArrayOrderBook | None = None
+    latency: float | None = None
+    error: Exception | None = None
@@ -1,4 +1,7 @@
+from array import array
+from bisect import bisect_left
 from decimal import Decimal
+from operator import itemgetter
 
 from pydantic import BaseModel
 
@@ -33,3 +36,118 @@ class Kline(BaseModel):
     closeTime: int
     amount: Decimal
 
+
+class KlineFrame:
+    """
+    Columnar klines: one contiguous array per field instead of a model object per candle.
+
+    Columns are array('q') for open_time (ms) and array('d') for prices and volume. Slicing
+    returns a frame of memoryviews over the same buffers, so views are free and reflect the
+    parent; concat() and sorted() copy into new arrays.
+
+    Usage:
+        frame = market.get_kline("BTCUSDT", "1m").data  # market created with trusted=True
+        last_hour = frame.between(now - 3_600_000, now)
+        mean = sum(last_hour.close) / len(last_hour)
+
+    params:
+        open_time, open, high, low, close, volume: Columns of equal length.
+    """
+    __slots__ = ('open_time', 'open', 'high', 'low', 'close', 'volume')
+
+    COLUMNS = ('open_time', 'open', 'high', 'low', 'close', 'volume')
+
+    def __init__(self, open_time=None, open=None, high=None, low=None, close=None, volume=None):
+        self.open_time = open_time if open_time is not None else array('q')
+        self.open = open if open is not None else array('d')
+        self.high = high if high is not None else array('d')
+        self.low = low if low is not None else array('d')
+        self.close = close if close is not None else array('d')
+        self.volume = volume if volume is not None else array('d')
+
+    @classmethod
+    def from_rows(cls, rows, columns=(0, 1, 2, 3, 4, 5), time_unit: int = 1) -> 'KlineFrame':
+        """
+        Build a frame straight from exchange kline rows, e.g. [[1700000000000, "0.1", ...], ...].
+
+        params:
+            rows (list): Rows as lists or dicts; values may be strings or numbers.
+
+            columns (tuple): Index (or key for dict rows) of open time, open, high, low, close and volume.
+
+            time_unit (int): Multiplier of the open time to ms, 1000 for exchanges returning seconds.
+        """
+        open_time, *values = columns
+        times = array('q', map(int, map(itemgetter(open_time), rows)))
+        if time_unit != 1:
+            times = array('q', [value * time_unit for value in times])
+        return cls(times, *(array('d', map(float, map(itemgetter(column), rows))) for column in values))
+
+    @classmethod
+    def from_klines(cls, klines: list[Kline]) -> 'KlineFrame':
+        return cls(
+            array('q', [kline.openTime for kline in klines]),
+            array('d', [kline.openPrice for kline in klines]),
+            array('d', [kline.highPrice for kline in klines]),
+            array('d', [kline.lowerPrice for kline in klines]),
+            array('d', [kline.closePrice for kline in klines]),
+            array('d', [kline.amount for kline in klines]),
+        )
+
+    @classmethod
+    def concat(cls, frames) -> 'KlineFrame':
+        """One frame with the rows of every frame, in the given order."""
+        result = cls()
+        for frame in frames:
+            for name in cls.COLUMNS:
+                getattr(result, name).frombytes(getattr(frame, name).tobytes())
+        return result
+
+    def columns(self) -> dict:
+        return {name: getattr(self, name) for name in self.COLUMNS}
+
+    def __len__(self):
+        return len(self.open_time)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return KlineFrame(*(memoryview(getattr(self, name))[index] for name in self.COLUMNS))
+        return tuple(getattr(self, name)[index] for name in self.COLUMNS)
+
+    def __iter__(self):
+        return zip(*(getattr(self, name) for name in self.COLUMNS))
+
+    def between(self, start: int = None, end: int = None) -> 'KlineFrame':
+        """View of the rows with start <= open_time < end; the frame must be sorted by open time."""
+        low = 0 if start is None else bisect_left(self.open_time, start)
+        high = len(self) if end is None else bisect_left(self.open_time, end)
+        return self[low:max(low, high)]
+
+    def sorted(self) -> 'KlineFrame':
+        """Copy ordered by open time, dropping rows with a repeated open time."""
+        times = self.open_time
+        order = sorted(range(len(times)), key=times.__getitem__)
+        order = [index for position, index in enumerate(order)
+                 if position == 0 or times[index] != times[order[position - 1]]]
+        return KlineFrame(
+            array('q', [times[index] for index in order]),
+            *(array('d', [getattr(self, name)[index] for index in order]) for name in self.COLUMNS[1:]),
+        )
+
+    def to_klines(self, interval_ms: int = None) -> list[Kline]:
+        """Kline models of the rows; closeTime is open time + interval - 1 when the interval is given."""
+        return [
+            Kline(
+                openTime=open_time,
+                openPrice=Decimal(repr(open_)),
+                highPrice=Decimal(repr(high)),
+                lowerPrice=Decimal(repr(low)),
+                closePrice=Decimal(repr(close)),
+                closeTime=open_time + interval_ms - 1 if interval_ms else open_time,
+                amount=Decimal(repr(volume)),
+            )
+            for open_time, open_, high, low, close, volume in self
+        ]
+
+    def __repr__(self):
+        return f'KlineFrame(rows={len(self)})'
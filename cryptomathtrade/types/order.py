@@ -77,6 +77,31 @@ class OrderBook(BaseModel):
         asks (list[Order]): List of sell orders (asks).
 
         bids (list[Order]): List of buy orders (bids).
+
+        lastUpdateId (int): Exchange sequence number of the book, when the exchange provides one.
     """
     asks: list[Order]
     bids: list[Order]
+    lastUpdateId: int | None = None
+
+
+class OrderBookUpdate(OrderBook):
+    """
+    Model representing an incremental order book update (diff).
+
+    A level with zero volume must be removed from the book.
+
+    params:
+        asks (list[Order]): Changed sell levels.
+
+        bids (list[Order]): Changed buy levels.
+
+        firstUpdateId (int): Sequence number of the first change in the update.
+
+        lastUpdateId (int): Sequence number of the last change in the update.
+
+        time (int): Event time.
+    """
+    firstUpdateId: int
+    lastUpdateId: int
+    time: int | None = None
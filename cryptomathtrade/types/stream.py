@@ -0,0 +1,20 @@
+from pydantic import BaseModel
+
+
+class StreamGap(BaseModel, arbitrary_types_allowed=True):
+    """
+    Marker yielded by a reconnecting stream when its connection was lost.
+
+    Messages between the disconnect and the reconnect are missing: state built from the
+    stream (local order books, balances) must be resynchronized.
+
+    params:
+        error (Exception): Why the stream stopped (asyncio.TimeoutError when it stalled).
+
+        attempt (int): Consecutive reconnect attempt, 1 for the first after a healthy connection.
+
+        time (int): Timestamp of the disconnect in ms.
+    """
+    error: Exception | None = None
+    attempt: int
+    time: int